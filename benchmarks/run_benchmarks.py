@@ -0,0 +1,456 @@
+"""
+Benchmark suite for the Taylor Swift Album Finder (day03) and the WNBA
+Team Roster Viewer (day04)
+Times the hot paths of both apps and saves the results as JSON, so two
+runs (e.g. before and after a change) can be compared to catch slowdowns.
+
+Usage:
+    python benchmarks/run_benchmarks.py -o results.json
+    python benchmarks/run_benchmarks.py -k album -o album.json
+    python benchmarks/run_benchmarks.py compare before.json results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Month texts for the album_logic lookups (names, aliases and one bad month)
+MONTH_TEXTS = "['January', 'aug', '08', 'août', ' december ', 'Sept.', 'mayo', '13'] * 125"
+
+# One team of made up players (no photo URLs, so nothing is downloaded).
+# A logo file is saved first, like after an earlier launch, so the GUI
+# doesn't start downloading the logo (the timings must not depend on the network).
+GUI_SETUP = """
+import os
+import tkinter as tk
+from bench_serialization import make_league
+import roster_gui
+root = tk.Tk()
+os.makedirs('team_rosters', exist_ok=True)
+tk.PhotoImage(width=80, height=80).write(os.path.join('team_rosters', 'wnba_logo.png'), format='png')
+app = roster_gui.RosterViewerGUI(root)
+assert app.wnba_logo is not None, 'the logo was not loaded from the file'
+roster = make_league()[0]
+for player in roster['players']:
+    player['image_url'] = ''
+app.table_mode.set({table_mode})
+app.toggle_view()
+root.update()
+"""
+
+# Every benchmark runs in a fresh Python process in its app's folder (the
+# folders have modules with the same names) with an empty temp folder as
+# the working directory. 'setup' runs once, then 'stmt' is timed. 'ops' is
+# how many operations one run of 'stmt' does (setup can also set a variable
+# named ops), so the results are seconds per operation.
+BENCHMARKS = [
+    {
+        'name': 'album_logic.lookup',
+        'app': 'day03',
+        'description': 'get_album_for_month on repeated names and aliases (memo hits)',
+        'setup': f"import album_logic\ntexts = {MONTH_TEXTS}\n",
+        'stmt': "for text in texts: album_logic.get_album_for_month(text)",
+        'ops': 1000,
+        'number': 200
+    },
+    {
+        'name': 'album_logic.lookup_no_memo',
+        'app': 'day03',
+        'description': 'month index lookup without the memo (inputs seen for the first time)',
+        'setup': (f"import album_logic\ntexts = {MONTH_TEXTS}\n"
+                  "lookup = album_logic.get_album_for_month.__wrapped__\n"),
+        'stmt': "for text in texts: lookup(text)",
+        'ops': 1000,
+        'number': 50
+    },
+    {
+        'name': 'album_logic.albums_for_dates',
+        'app': 'day03',
+        'requires': ['numpy'],
+        'description': 'albums_for_dates on 1 million birthdates, per date',
+        'setup': ("import numpy as np\nimport album_logic\n"
+                  "dates = np.random.default_rng(0).integers(-16000, 20000, 1000000).astype('datetime64[D]')\n"),
+        'stmt': "album_logic.albums_for_dates(dates)",
+        'ops': 1000000,
+        'number': 5
+    },
+    {
+        'name': 'covers.decode_resize',
+        'app': 'day03',
+        'description': 'open_resized of every album cover to 200x200, per cover',
+        'setup': ("import os\nfrom image_utils import open_resized\n"
+                  "covers_dir = os.path.join(APP_DIR, 'album_covers')\n"
+                  "covers = [os.path.join(covers_dir, name) for name in sorted(os.listdir(covers_dir))\n"
+                  "          if name != 'background.jpg']\n"
+                  "ops = len(covers)\n"),
+        'stmt': "for path in covers: open_resized(path, (200, 200))",
+        'number': 2
+    },
+    {
+        'name': 'roster.parse_roster_page',
+        'app': 'day04',
+        'description': ('_parse_roster_page on the synthetic fixtures/roster_page.html (14 players), with every bio '
+                        'request answered with fixtures/player_page.html (no network)'),
+        'setup': ("from types import SimpleNamespace\nfrom bench_parsing import load_fixture\n"
+                  "from roster_fetcher import WNBARosterFetcher, get_strainers\n"
+                  "fetcher = WNBARosterFetcher(use_cache=False)\n"
+                  "roster_page = load_fixture('roster_page.html')\n"
+                  "player_page = load_fixture('player_page.html')\n"
+                  "player_page.status_code = 200\nplayer_page.headers = {}\n"
+                  "player_page.raise_for_status = lambda: None\n"
+                  "fetcher._session = SimpleNamespace(get=lambda url, **kwargs: player_page)\n"),
+        'stmt': "fetcher._parse_roster_page(fetcher._make_soup(roster_page.text, get_strainers()[0]))",
+        'ops': 1,
+        'number': 5
+    },
+    {
+        'name': 'roster.parse_player_page',
+        'app': 'day04',
+        'description': '_parse_player_response on the synthetic fixtures/player_page.html (default parser)',
+        'setup': ("from bench_parsing import load_fixture\nfrom roster_fetcher import WNBARosterFetcher\n"
+                  "fetcher = WNBARosterFetcher(use_cache=False)\n"
+                  "response = load_fixture('player_page.html')\n"),
+        'stmt': "fetcher._parse_player_response(response)",
+        'ops': 1,
+        'number': 10
+    },
+    {
+        'name': 'roster.save_roster',
+        'app': 'day04',
+        'description': 'save_roster of a 15 player team (JSON files), per team',
+        'setup': ("from bench_serialization import make_league\nfrom roster_fetcher import WNBARosterFetcher\n"
+                  "fetcher = WNBARosterFetcher()\nleague = make_league()\nops = len(league)\n"),
+        'stmt': "for roster in league: fetcher.save_roster(roster)",
+        'number': 5
+    },
+    {
+        'name': 'roster.load_roster',
+        'app': 'day04',
+        'description': 'load_roster of a saved 15 player team, per team',
+        'setup': ("from bench_serialization import make_league\nfrom roster_fetcher import WNBARosterFetcher\n"
+                  "fetcher = WNBARosterFetcher()\nleague = make_league()\nops = len(league)\n"
+                  "for roster in league: fetcher.save_roster(roster)\n"),
+        'stmt': "for roster in league: fetcher.load_roster(roster['team_name'])",
+        'number': 10
+    },
+    {
+        'name': 'roster.get_all_saved_rosters',
+        'app': 'day04',
+        'description': 'get_all_saved_rosters with every team saved',
+        'setup': ("from bench_serialization import make_league\nfrom roster_fetcher import WNBARosterFetcher\n"
+                  "fetcher = WNBARosterFetcher()\n"
+                  "for roster in make_league(): fetcher.save_roster(roster)\n"),
+        'stmt': "fetcher.get_all_saved_rosters()",
+        'ops': 1,
+        'number': 20
+    },
+    {
+        'name': 'gui.display_roster_cards',
+        'app': 'day04',
+        'display': True,
+        'description': 'display_roster of a 15 player team in the card view (widgets made and laid out)',
+        'setup': GUI_SETUP.format(table_mode=False),
+        'stmt': "app.display_roster(roster); root.update_idletasks()",
+        'ops': 1,
+        'number': 5
+    },
+    {
+        'name': 'gui.display_roster_table',
+        'app': 'day04',
+        'display': True,
+        'description': 'display_roster of a 15 player team in the table view (rows changed in place)',
+        'setup': GUI_SETUP.format(table_mode=True),
+        'stmt': "app.display_roster(roster); root.update_idletasks()",
+        'ops': 1,
+        'number': 20
+    }
+]
+
+# Runs one benchmark inside its own process and prints the result as JSON.
+# os._exit skips waiting for background threads (like the GUI's loaders).
+RUNNER = """
+import json, os, sys, timeit
+case = json.loads(sys.argv[1])
+APP_DIR = case['app_dir']
+sys.path.insert(0, APP_DIR)
+for module in case.get('requires', []):
+    try:
+        __import__(module)
+    except ImportError:
+        print(json.dumps({'skipped': module + ' is not installed'}))
+        sys.stdout.flush()
+        os._exit(0)
+namespace = {'APP_DIR': APP_DIR}
+exec(case['setup'], namespace)
+timer = timeit.Timer(case['stmt'], globals=namespace)
+timer.timeit(1)  # Warm up (imports, caches, first layout)
+times = timer.repeat(repeat=case['repeat'], number=case['number'])
+ops = namespace.get('ops', case.get('ops', 1)) * case['number']
+print(json.dumps({'seconds_per_op': [t / ops for t in times]}))
+sys.stdout.flush()
+os._exit(0)
+"""
+
+
+def start_virtual_display():
+    """
+    Start an Xvfb virtual display for the GUI benchmarks (if there is no
+    display and Xvfb is installed)
+    
+    Returns:
+        tuple: (DISPLAY value or None, Xvfb process or None)
+    """
+    if os.environ.get('DISPLAY'):
+        return os.environ['DISPLAY'], None
+    if shutil.which('Xvfb') is None:
+        return None, None
+    
+    display = f":{90 + os.getpid() % 100}"
+    process = subprocess.Popen(['Xvfb', display, '-screen', '0', '1280x1024x24', '-nolisten', 'tcp'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)  # Give it time to start
+    return display, process
+
+
+def run_case(case, repeat, display=None):
+    """
+    Run one benchmark in a fresh Python process
+    
+    Args:
+        case (dict): Benchmark from BENCHMARKS
+        repeat (int): Number of timing rounds
+        display (str): DISPLAY for GUI benchmarks, or None if there is none
+        
+    Returns:
+        dict: Result with 'best', 'median' and 'ops_per_second', or
+              'skipped' / 'error' with the reason
+    """
+    result = {'app': case['app'], 'description': case['description']}
+    
+    if case.get('display') and display is None:
+        result['skipped'] = 'no display (set DISPLAY or install Xvfb)'
+        return result
+    
+    app_dir = os.path.join(REPO_DIR, case['app'])
+    env = dict(os.environ, PYTHONHASHSEED='0')
+    if display is not None:
+        env['DISPLAY'] = display
+    
+    arguments = dict(case, app_dir=app_dir, repeat=repeat)
+    with tempfile.TemporaryDirectory() as work_dir:
+        process = subprocess.run([sys.executable, '-c', RUNNER, json.dumps(arguments)],
+                                 cwd=work_dir, env=env, capture_output=True, text=True)
+    
+    if process.returncode != 0:
+        result['error'] = (process.stderr.strip().splitlines() or ['failed'])[-1]
+        return result
+    
+    output = json.loads(process.stdout.strip().splitlines()[-1])
+    if 'skipped' in output:
+        result['skipped'] = output['skipped']
+        return result
+    
+    times = output['seconds_per_op']
+    result.update({
+        'best': min(times),
+        'median': statistics.median(times),
+        'ops_per_second': 1 / min(times),
+        'repeat': repeat
+    })
+    return result
+
+
+def get_environment():
+    """
+    Describe the machine and versions the benchmarks ran with
+    
+    Returns:
+        dict: Python version, platform, CPU count, git commit and the
+              versions of the libraries the apps use
+    """
+    versions = {}
+    for module in ('PIL', 'bs4', 'lxml', 'requests', 'numpy', 'orjson', 'msgpack'):
+        process = subprocess.run([sys.executable, '-c', f"import {module}; print({module}.__version__)"],
+                                 capture_output=True, text=True)
+        versions[module] = process.stdout.strip() if process.returncode == 0 else None
+    
+    commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                            capture_output=True, text=True).stdout.strip()
+    
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'git_commit': commit or None,
+        'libraries': versions
+    }
+
+
+def run_suite(repeat=5, name_filter=None):
+    """
+    Run every benchmark (or the ones whose name contains name_filter)
+    
+    Args:
+        repeat (int): Number of timing rounds per benchmark
+        name_filter (str): Only run benchmarks with this in their name
+        
+    Returns:
+        dict: 'created', 'environment' and 'results' (name -> result)
+    """
+    cases = [case for case in BENCHMARKS if not name_filter or name_filter in case['name']]
+    
+    display, xvfb = (None, None)
+    if any(case.get('display') for case in cases):
+        display, xvfb = start_virtual_display()
+    
+    results = {}
+    try:
+        for case in cases:
+            results[case['name']] = run_case(case, repeat, display)
+            print_result(case['name'], results[case['name']])
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+    
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'environment': get_environment(),
+        'results': results
+    }
+
+
+def format_seconds(seconds):
+    """Format a time per operation with a fitting unit (e.g. '12.3 us')"""
+    for unit, factor in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def print_result(name, result):
+    """Print one line of the results table"""
+    if 'best' in result:
+        print(f"{name:<34} {format_seconds(result['best']):>10} {format_seconds(result['median']):>10} "
+              f"{result['ops_per_second']:>14,.0f}/s")
+    else:
+        print(f"{name:<34} {'skipped: ' + result['skipped'] if 'skipped' in result else 'ERROR: ' + result['error']}")
+
+
+def compare(before, after):
+    """
+    Compare two result files
+    
+    Args:
+        before (dict): Results of the older run
+        after (dict): Results of the newer run
+        
+    Returns:
+        list: (name, before best, after best, change) of every benchmark in
+              both runs; change is after/before - 1 (positive = slower)
+    """
+    rows = []
+    for name, new in after['results'].items():
+        old = before['results'].get(name)
+        if old and 'best' in old and 'best' in new:
+            rows.append((name, old['best'], new['best'], new['best'] / old['best'] - 1))
+    return rows
+
+
+def find_problems(before, after):
+    """
+    Find the benchmarks of the newer run that could not be compared
+    
+    Args:
+        before (dict): Results of the older run
+        after (dict): Results of the newer run
+        
+    Returns:
+        list: (name, problem, failed) tuples; failed is True for benchmarks
+              that give an error now or were timed before but are missing
+              (skipped ones are only reported)
+    """
+    problems = []
+    for name, new in after['results'].items():
+        if 'error' in new:
+            problems.append((name, 'ERROR: ' + new['error'], True))
+        elif 'skipped' in new:
+            problems.append((name, 'skipped: ' + new['skipped'], False))
+    
+    for name, old in before['results'].items():
+        if 'best' in old and name not in after['results']:
+            problems.append((name, 'missing from the newer run', True))
+    
+    return problems
+
+
+def main(argv=None):
+    """
+    Run the suite or compare two result files
+    
+    Args:
+        argv (list): Command line arguments (default: sys.argv[1:])
+        
+    Returns:
+        int: Exit code (1 if compare found a regression, or a benchmark
+             that gives an error now or is missing)
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    if argv[:1] == ['compare']:
+        parser = argparse.ArgumentParser(prog='run_benchmarks.py compare',
+                                         description='Compare two benchmark result files.')
+        parser.add_argument('before', help='Results of the older run')
+        parser.add_argument('after', help='Results of the newer run')
+        parser.add_argument('--threshold', type=float, default=0.10,
+                            help='Slowdown that counts as a regression (default: 0.10 = 10%%)')
+        args = parser.parse_args(argv[1:])
+        
+        with open(args.before, encoding='utf-8') as f:
+            before = json.load(f)
+        with open(args.after, encoding='utf-8') as f:
+            after = json.load(f)
+        
+        regressions = 0
+        print(f"{'Benchmark':<34} {'before':>10} {'after':>10} {'change':>8}")
+        for name, old_best, new_best, change in compare(before, after):
+            slower = change > args.threshold
+            regressions += slower
+            print(f"{name:<34} {format_seconds(old_best):>10} {format_seconds(new_best):>10} "
+                  f"{change:>+7.1%}{'  SLOWER' if slower else ''}")
+        
+        failed = 0
+        for name, problem, problem_failed in find_problems(before, after):
+            failed += problem_failed
+            print(f"{name:<34} {problem}")
+        return 1 if regressions or failed else 0
+    
+    parser = argparse.ArgumentParser(description='Run the benchmarks of both apps and save the results as JSON.')
+    parser.add_argument('-o', '--output', help='JSON file for the results (default: only print them)')
+    parser.add_argument('-k', '--filter', help='Only run benchmarks with this text in their name')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing rounds per benchmark (default: 5)')
+    args = parser.parse_args(argv)
+    
+    print(f"{'Benchmark':<34} {'best':>10} {'median':>10} {'ops':>16}")
+    suite = run_suite(args.repeat, args.filter)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(suite, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        print(f"Results saved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
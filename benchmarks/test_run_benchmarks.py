@@ -0,0 +1,103 @@
+"""
+Unit tests for run_benchmarks module
+Tests comparing result files and running one quick benchmark
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import run_benchmarks
+
+
+def results(**best):
+    """Make a result file with the given best times"""
+    return {'results': {name: {'best': seconds} for name, seconds in best.items()}}
+
+
+class TestCompare(unittest.TestCase):
+    """Test cases for comparing two runs"""
+    
+    def test_change_per_benchmark(self):
+        """Test that the change is after/before - 1 (positive = slower)"""
+        rows = run_benchmarks.compare(results(a=1.0, b=2.0), results(a=1.5, b=1.0))
+        self.assertEqual(rows, [('a', 1.0, 1.5, 0.5), ('b', 2.0, 1.0, -0.5)])
+    
+    def test_skipped_and_new_benchmarks_are_left_out(self):
+        """Test that only benchmarks timed in both runs are compared"""
+        before = {'results': {'a': {'best': 1.0}, 'gui': {'skipped': 'no display'}}}
+        after = {'results': {'a': {'best': 1.0}, 'gui': {'best': 0.1}, 'new': {'best': 0.1}}}
+        self.assertEqual([row[0] for row in run_benchmarks.compare(before, after)], ['a'])
+    
+    def test_errors_missing_and_skipped_are_reported(self):
+        """Test that benchmarks that fail, are missing or were skipped now are reported"""
+        before = results(load=1.0, save=1.0, gui=1.0, fine=1.0)
+        after = {'results': {'load': {'error': 'OSError: disk full'}, 'gui': {'skipped': 'no display'},
+                             'fine': {'best': 1.0}}}
+        
+        self.assertEqual(run_benchmarks.find_problems(before, after), [
+            ('load', 'ERROR: OSError: disk full', True),
+            ('gui', 'skipped: no display', False),
+            ('save', 'missing from the newer run', True)
+        ])
+    
+    def test_main_exit_code(self):
+        """Test that compare exits with 1 when something got slower than the threshold"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for name, data in (('before', results(a=1.0)), ('after', results(a=1.2))):
+                paths.append(os.path.join(temp_dir, f'{name}.json'))
+                with open(paths[-1], 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+            
+            with mock.patch('builtins.print'):
+                self.assertEqual(run_benchmarks.main(['compare', *paths]), 1)
+                self.assertEqual(run_benchmarks.main(['compare', *paths, '--threshold', '0.5']), 0)
+            
+            # A benchmark that broke or went missing fails the comparison too
+            for data in ({'results': {'a': {'error': 'ValueError'}}}, {'results': {}}):
+                with open(paths[1], 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+                with mock.patch('builtins.print'):
+                    self.assertEqual(run_benchmarks.main(['compare', *paths]), 1)
+            
+            # Skipped (e.g. no display) is only reported
+            with open(paths[1], 'w', encoding='utf-8') as f:
+                json.dump({'results': {'a': {'skipped': 'no display'}}}, f)
+            with mock.patch('builtins.print'):
+                self.assertEqual(run_benchmarks.main(['compare', *paths]), 0)
+
+
+class TestSuite(unittest.TestCase):
+    """Test cases for the benchmark list and the runner"""
+    
+    def test_names_are_unique(self):
+        """Test that every benchmark has its own name"""
+        names = [case['name'] for case in run_benchmarks.BENCHMARKS]
+        self.assertEqual(len(names), len(set(names)))
+    
+    def test_format_seconds(self):
+        """Test the units of the printed times"""
+        self.assertEqual(run_benchmarks.format_seconds(2.5), '2.5 s')
+        self.assertEqual(run_benchmarks.format_seconds(0.0123), '12.3 ms')
+        self.assertEqual(run_benchmarks.format_seconds(4.5e-7), '450 ns')
+    
+    def test_run_one_case(self):
+        """Test running a quick benchmark in its own process"""
+        case = dict(run_benchmarks.BENCHMARKS[0], number=1)
+        result = run_benchmarks.run_case(case, repeat=2)
+        
+        self.assertGreater(result['best'], 0)
+        self.assertLessEqual(result['best'], result['median'])
+        self.assertEqual(result['app'], 'day03')
+    
+    def test_gui_without_display_is_skipped(self):
+        """Test that GUI benchmarks are skipped when there is no display"""
+        case = next(case for case in run_benchmarks.BENCHMARKS if case.get('display'))
+        self.assertIn('skipped', run_benchmarks.run_case(case, repeat=1, display=None))
+
+
+if __name__ == '__main__':
+    unittest.main()
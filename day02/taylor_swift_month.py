@@ -1,78 +1,47 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
-from PIL import Image, ImageTk
 import os
+import sys
+
+# The album logic and cover cache are the ones in day03 (one copy for both days)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "day03"))
+import album_logic
+from cover_cache import CoverCache
 
 def get_taylor_swift_album(month_source=None):
     """Get the Taylor Swift album based on birth month"""
-    # Dictionary mapping month names to Taylor Swift albums
-    month_to_album = {
-        "January": "Taylor Swift",
-        "February": "Fearless",
-        "March": "Speak Now",
-        "April": "Red",
-        "May": "1989",
-        "June": "Reputation",
-        "July": "Lover",
-        "August": "Folklore",
-        "September": "Evermore",
-        "October": "Midnights",
-        "November": "The Tortured Poets Department",
-        "December": "The Life of a Showgirl"
-    }
-    
-    # Dictionary mapping album names to image filenames
-    album_to_image = {
-        "Taylor Swift": "taylor_swift.jpg",
-        "Fearless": "fearless.jpg",
-        "Speak Now": "speak_now.jpg",
-        "Red": "red.jpg",
-        "1989": "1989.jpg",
-        "Reputation": "reputation.jpg",
-        "Lover": "lover.jpg",
-        "Folklore": "folklore.jpg",
-        "Evermore": "evermore.jpg",
-        "Midnights": "midnights.jpg",
-        "The Tortured Poets Department": "ttpd.jpg",
-        "The Life of a Showgirl": "showgirl.jpg"
-    }
-    
     # Get month from the specified source or from text entry
     if month_source:
         month_name = month_source
     else:
-        month_name = month_entry.get().strip().capitalize()  # Capitalize first letter
+        month_name = month_entry.get().strip()
     
-    if month_name in month_to_album:
-        album_name = month_to_album[month_name]
-        
+    # Albums come from the shared album_catalog.json (see album_logic)
+    album_name = album_logic.get_album_for_month(month_name)
+    
+    if album_name:
         result_label.config(
             text=f"{album_name}",
             fg="#8B4789"
         )
         
         # Try to load and display the album cover
-        image_filename = album_to_image[album_name]
-        # Get the directory where this script is located
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        image_path = os.path.join(script_dir, "album_covers", image_filename)
+        image_filename = album_logic.get_image_filename_for_album(album_name)
         
-        if os.path.exists(image_path):
-            try:
-                # Load and resize image
-                img = Image.open(image_path)
-                img = img.resize((200, 200), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                
+        try:
+            # Resized cover (only decoded and resized the first time)
+            photo = cover_cache.get_photo(image_filename, (200, 200))
+        except Exception as e:
+            image_label.config(image="", text="(Image not available)")
+        else:
+            if photo:
                 # Update image label
                 image_label.config(image=photo)
                 image_label.image = photo  # Keep a reference
-            except Exception as e:
-                image_label.config(image="", text="(Image not available)")
-        else:
-            image_label.config(image="", text="(Image not found)")
+            else:
+                image_label.config(image="", text="(Image not found)")
     else:
-        messagebox.showerror("Error", "Please enter a valid month name (e.g., January, February, etc.)")
+        messagebox.showerror("Error", "Please enter a valid month (e.g., January, Jan or 1)")
 
 def get_from_dropdown():
     """Get album from dropdown selection"""
@@ -92,19 +61,19 @@ root.title("Taylor Swift Birth Month Album")
 root.geometry("800x750")
 root.configure(bg="#FFF5F7")
 
-# Load and set background image
+# Resized album covers, kept in memory and in cover_thumbnails/
 script_dir = os.path.dirname(os.path.abspath(__file__))
-background_path = os.path.join(script_dir, "album_covers", "background.jpg")
+cover_cache = CoverCache(os.path.join(script_dir, "album_covers"))
 
+# Load and set background image
 try:
-    background_image = Image.open(background_path)
-    background_image = background_image.resize((800, 750), Image.Resampling.LANCZOS)
-    background_photo = ImageTk.PhotoImage(background_image)
+    background_photo = cover_cache.get_photo("background.jpg", (800, 750))
     
-    # Create a label for the background
-    background_label = tk.Label(root, image=background_photo)
-    background_label.image = background_photo
-    background_label.place(x=0, y=0, relwidth=1, relheight=1)
+    if background_photo:
+        # Create a label for the background
+        background_label = tk.Label(root, image=background_photo)
+        background_label.image = background_photo
+        background_label.place(x=0, y=0, relwidth=1, relheight=1)
 except:
     pass  # If background image not found, continue without it
 
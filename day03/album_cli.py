@@ -0,0 +1,302 @@
+"""
+Bulk album finder for Taylor Swift Album Finder
+Adds an "album" column to a big CSV or JSONL file of birthdates (or birth
+months). The file is read as a stream and handled in fixed-size chunks by
+a process pool, so memory stays the same no matter how big the file is.
+
+Usage:
+    python album_cli.py members.csv -o members_albums.csv
+    python album_cli.py members.jsonl --column dob --workers 4 > out.jsonl
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+from itertools import islice
+
+import album_logic
+
+# Column names tried (in this order) when --column is not given
+DEFAULT_COLUMNS = ("birthdate", "birth_date", "date_of_birth", "dob", "date",
+                   "birth_month", "month")
+
+# ISO dates like 1989-12-13, 1989-12 or 1989-12-13T08:00:00
+ISO_DATE = re.compile(r"\s*\d{4}-(\d{1,2})(?:-\d{1,2})?(?:[T ].*)?$")
+
+
+def album_for_value(value, date_format=None):
+    """
+    Get the album for one birthdate or month value.
+    
+    Args:
+        value: Date ("1989-12-13"), month ("December", "Dec", "12" or 12)
+        date_format (str): strptime format for dates that are not ISO
+                           (e.g. "%d/%m/%Y"), or None
+                           
+    Returns:
+        str or None: Album name, or None if no month can be found
+    """
+    if value is None:
+        return None
+    text = str(value)
+    
+    if date_format:
+        try:
+            return album_logic.get_album_for_month(str(datetime.strptime(text.strip(), date_format).month))
+        except ValueError:
+            pass  # Maybe just a month
+    
+    match = ISO_DATE.match(text)
+    if match:
+        return album_logic.get_album_for_month(match.group(1))
+    
+    return album_logic.get_album_for_month(text)
+
+
+def find_column(names, column=None):
+    """
+    Pick the column with the birthdate or month.
+    
+    Args:
+        names (list): Column names (CSV header or JSON keys)
+        column (str): Column asked for by the user, or None to guess
+        
+    Returns:
+        str: The column name
+        
+    Raises:
+        ValueError: If the column is not there
+    """
+    if column is not None:
+        if column not in names:
+            raise ValueError(f"Column '{column}' not found (columns: {', '.join(names)})")
+        return column
+    
+    for name in DEFAULT_COLUMNS:
+        if name in names:
+            return name
+    raise ValueError(f"No birthdate or month column found (columns: {', '.join(names)}); use --column")
+
+
+def process_csv_chunk(rows, column_index, date_format=None):
+    """
+    Add the album to a chunk of CSV rows (runs in a worker process).
+    
+    Args:
+        rows (list): Rows (lists of strings) without the header
+        column_index (int): Index of the birthdate or month column
+        date_format (str): See album_for_value
+        
+    Returns:
+        tuple: (number of rows, CSV text of the rows with the album added)
+    """
+    output = io.StringIO()
+    writer = csv.writer(output)
+    
+    for row in rows:
+        value = row[column_index] if column_index < len(row) else None
+        writer.writerow(row + [album_for_value(value, date_format) or ""])
+    
+    return len(rows), output.getvalue()
+
+
+def process_jsonl_chunk(lines, column=None, date_format=None):
+    """
+    Add the album to a chunk of JSONL lines (runs in a worker process).
+    
+    Args:
+        lines (list): (line number, JSON object line) tuples
+        column (str): Key with the birthdate or month, or None to guess per line
+        date_format (str): See album_for_value
+        
+    Returns:
+        tuple: (number of rows, JSONL text of the rows with "album" added)
+        
+    Raises:
+        ValueError: If a line is not a JSON object (with its line number)
+    """
+    output = []
+    
+    for line_number, line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"Line {line_number}: not valid JSON ({e})") from None
+        if not isinstance(record, dict):
+            raise ValueError(f"Line {line_number}: expected a JSON object, got {type(record).__name__}")
+        
+        key = find_column(list(record), column) if column is None else column
+        record["album"] = album_for_value(record.get(key), date_format)
+        output.append(json.dumps(record, ensure_ascii=False) + "\n")
+    
+    return len(lines), "".join(output)
+
+
+def chunked(items, chunk_size):
+    """
+    Split a stream into lists of chunk_size items (the last one may be shorter).
+    
+    Args:
+        items (iterable): Items to split
+        chunk_size (int): Items per chunk
+        
+    Yields:
+        list: The next chunk
+        
+    Raises:
+        ValueError: If chunk_size is less than 1 (no rows would be read)
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be 1 or more, not {chunk_size}")
+    
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_in_order(function, chunks, workers):
+    """
+    Run function on every chunk in a process pool, giving the results in order.
+    
+    At most 2 chunks per worker are waiting or running at a time, so a huge
+    file is never read into memory ahead of the workers.
+    
+    Args:
+        function (callable): Function to run on each chunk (must be picklable)
+        chunks (iterable): The chunks
+        workers (int): Number of worker processes (0 runs everything here)
+        
+    Yields:
+        The result of each chunk, in the same order as the chunks
+    """
+    if workers == 0:
+        yield from map(function, chunks)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(function, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        
+        while pending:
+            yield pending.popleft().result()
+
+
+def add_albums(source, output, file_format="csv", column=None, date_format=None,
+               chunk_size=10000, workers=None):
+    """
+    Read birthdates from source and write them with their album to output.
+    
+    Args:
+        source (file): Open input file (text)
+        output (file): Open output file (text)
+        file_format (str): 'csv' (with a header row) or 'jsonl'
+        column (str): Birthdate or month column, or None to guess
+        date_format (str): strptime format for dates that are not ISO
+        chunk_size (int): Rows per chunk sent to a worker
+        workers (int): Worker processes (default: number of CPUs, 0 for none)
+        
+    Returns:
+        int: Number of rows written
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    if file_format == "csv":
+        reader = csv.reader(source)
+        header = next(reader, None)
+        if header is None:
+            return 0
+        
+        column_index = header.index(find_column(header, column))
+        csv.writer(output).writerow(header + ["album"])
+        function = partial(process_csv_chunk, column_index=column_index, date_format=date_format)
+        rows = reader
+    elif file_format == "jsonl":
+        function = partial(process_jsonl_chunk, column=column, date_format=date_format)
+        # Line numbers are kept for error messages (empty lines still count)
+        rows = ((number, line) for number, line in enumerate(source, 1) if line.strip())
+    else:
+        raise ValueError(f"Unknown file format '{file_format}' (use csv or jsonl)")
+    
+    total = 0
+    for count, text in map_in_order(function, chunked(rows, chunk_size), workers):
+        output.write(text)
+        total += count
+    
+    return total
+
+
+def positive_int(text):
+    """argparse type for numbers that must be 1 or more (e.g. --chunk-size)"""
+    number = int(text)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be 1 or more, not {number}")
+    return number
+
+
+def guess_format(path):
+    """Guess the file format from the file name ('jsonl' or 'csv')"""
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def main(argv=None):
+    """
+    Run the command line tool.
+    
+    Args:
+        argv (list): Command line arguments (default: sys.argv[1:])
+        
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(description="Add the Taylor Swift album of each birth month to a CSV or JSONL file.")
+    parser.add_argument("input", help="CSV or JSONL file ('-' for standard input)")
+    parser.add_argument("-o", "--output", default="-", help="Output file (default: standard output)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="File format (default: from the file name)")
+    parser.add_argument("--column", help="Column with the birthdate or month (default: guessed)")
+    parser.add_argument("--date-format", help="strptime format of non-ISO dates, e.g. %%d/%%m/%%Y")
+    parser.add_argument("--chunk-size", type=positive_int, default=10000, help="Rows per chunk (default: 10000)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: number of CPUs, 0 for none)")
+    args = parser.parse_args(argv)
+    
+    file_format = args.format or guess_format(args.input)
+    newline = "" if file_format == "csv" else None
+    
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8", newline=newline)
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline=newline)
+    
+    start = time.perf_counter()
+    try:
+        rows = add_albums(source, output, file_format, args.column, args.date_format,
+                          args.chunk_size, args.workers)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    
+    elapsed = time.perf_counter() - start
+    print(f"{rows:,} rows in {elapsed:.2f} s ({rows / elapsed if elapsed else 0:,.0f} rows/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
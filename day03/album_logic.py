@@ -1,54 +1,253 @@
 """
 Business logic for Taylor Swift Album Finder
 Handles month-to-album mapping and album-to-image mapping
+
+The albums come from album_catalog.json (one file for day02 and day03), so
+a new album only needs a change in that file. A background thread checks
+the file for changes once a second and loads it again when it changed, so
+the lookups themselves never look at the file.
 """
 
-# Dictionary mapping month names to Taylor Swift albums
-MONTH_TO_ALBUM = {
-    "January": "Taylor Swift",
-    "February": "Fearless",
-    "March": "Speak Now",
-    "April": "Red",
-    "May": "1989",
-    "June": "Reputation",
-    "July": "Lover",
-    "August": "Folklore",
-    "September": "Evermore",
-    "October": "Midnights",
-    "November": "The Tortured Poets Department",
-    "December": "The Life of a Showgirl"
-}
+import calendar
+import json
+import os
+import threading
+import time
+import unicodedata
+import warnings
+from functools import lru_cache
+from types import MappingProxyType
+
+# The catalog file shared by the apps (in the folder above day02/day03)
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "album_catalog.json")
+
+# Seconds between checks if the catalog file changed
+CATALOG_CHECK_INTERVAL = 1.0
 
-# Dictionary mapping album names to image filenames
-ALBUM_TO_IMAGE = {
-    "Taylor Swift": "taylor_swift.jpg",
-    "Fearless": "fearless.jpg",
-    "Speak Now": "speak_now.jpg",
-    "Red": "red.jpg",
-    "1989": "1989.jpg",
-    "Reputation": "reputation.jpg",
-    "Lover": "lover.jpg",
-    "Folklore": "folklore.jpg",
-    "Evermore": "evermore.jpg",
-    "Midnights": "midnights.jpg",
-    "The Tortured Poets Department": "ttpd.jpg",
-    "The Life of a Showgirl": "showgirl.jpg"
+# Month names in other languages (January first) that the intake forms send
+LOCALE_MONTH_NAMES = {
+    "French": ["janvier", "février", "mars", "avril", "mai", "juin",
+               "juillet", "août", "septembre", "octobre", "novembre", "décembre"],
+    "Spanish": ["enero", "febrero", "marzo", "abril", "mayo", "junio",
+                "julio", "agosto", "septiembre", "octubre", "noviembre", "diciembre"],
+    "German": ["Januar", "Februar", "März", "April", "Mai", "Juni",
+               "Juli", "August", "September", "Oktober", "November", "Dezember"],
+    "Hebrew": ["ינואר", "פברואר", "מרץ", "אפריל", "מאי", "יוני",
+               "יולי", "אוגוסט", "ספטמבר", "אוקטובר", "נובמבר", "דצמבר"]
 }
 
 
+def normalize_month_text(text):
+    """
+    Turn typed month text into the form used as a key in the month index.
+    
+    Removes spaces around it and a trailing dot ("Jan."), ignores case
+    (casefold) and accents ("août" -> "aout").
+    
+    Args:
+        text (str): Month as typed by the user
+        
+    Returns:
+        str: Normalized text
+    """
+    text = text.strip().rstrip(".").casefold()
+    if text.isascii():
+        return text  # No accents to remove (most inputs)
+    
+    # Split letters from their accents, then drop the accents
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in text if not unicodedata.combining(char))
+
+
+def build_month_index(month_to_album):
+    """
+    Build the lookup index: every accepted way to write a month -> album.
+    
+    Accepted: full names, 3-letter abbreviations ("Jan"), numbers ("8" and
+    "08") and the names in LOCALE_MONTH_NAMES, all without case or accents.
+    
+    Args:
+        month_to_album (dict): English month name -> album, January first
+        
+    Returns:
+        dict: Normalized alias -> album
+    """
+    index = {}
+    
+    for number, (month, album) in enumerate(month_to_album.items(), start=1):
+        aliases = [month, month[:3], str(number), f"{number:02d}"]
+        if month == "September":
+            aliases.append("Sept")
+        aliases += [names[number - 1] for names in LOCALE_MONTH_NAMES.values()]
+        
+        for alias in aliases:
+            key = normalize_month_text(alias)
+            # Two months with the same alias would make lookups depend on order
+            if index.get(key, album) != album:
+                raise ValueError(f"Month alias '{alias}' is used for more than one month")
+            index[key] = album
+    
+    return index
+
+
+class AlbumCatalog:
+    """
+    One version of the album catalog with its lookup tables.
+    
+    Never changed after it is made: a new version of the file makes a new
+    AlbumCatalog, so a lookup that already has the old one can finish with it.
+    """
+    
+    def __init__(self, month_to_album, album_to_image, mtime=None):
+        """
+        Build the lookup tables.
+        
+        Args:
+            month_to_album (dict): English month name -> album, January first
+            album_to_image (dict): Album -> image filename
+            mtime (float): Modification time of the file it was loaded from
+        """
+        self.month_to_album = MappingProxyType(dict(month_to_album))
+        self.album_to_image = MappingProxyType(dict(album_to_image))
+        self.mtime = mtime
+        
+        # Every way to write a month -> album, so a lookup is one normalize
+        # + one dict lookup
+        self.month_index = MappingProxyType(build_month_index(self.month_to_album))
+        
+        # Album of each month in month order; the array functions return the
+        # index in this tuple as the album's code (-1 for no month)
+        self.albums = tuple(self.month_to_album.values())
+
+
+def load_catalog(path=CATALOG_PATH):
+    """
+    Load and check a catalog file.
+    
+    The file has a "months" list with one {"month", "album", "image"} entry
+    per month, January to December.
+    
+    Args:
+        path (str): Path of the catalog JSON file
+        
+    Returns:
+        AlbumCatalog: The catalog
+        
+    Raises:
+        ValueError: If the file is not a valid catalog
+        OSError: If the file can't be read
+    """
+    mtime = os.path.getmtime(path)
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    
+    try:
+        entries = data["months"]
+        months = [entry["month"] for entry in entries]
+        month_to_album = {entry["month"]: entry["album"] for entry in entries}
+        album_to_image = {entry["album"]: entry["image"] for entry in entries}
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Bad album catalog {path}: missing {e}") from None
+    
+    if months != list(calendar.month_name)[1:]:
+        raise ValueError(f"Bad album catalog {path}: needs the 12 months in order, January first")
+    
+    return AlbumCatalog(month_to_album, album_to_image, mtime)
+
+
+# The catalog in use, and when the file was last checked for changes
+_catalog = load_catalog()
+_next_check = time.monotonic() + CATALOG_CHECK_INTERVAL
+_reload_lock = threading.Lock()
+
+# Set after a reload: the memo is cleared again on the next check (see get_catalog)
+_clear_memo_again = False
+
+
+def get_catalog():
+    """
+    Get the current catalog, loading the file again if it changed.
+    
+    Lookups never wait for a reload: if another thread is loading the file
+    right now, the catalog from before is returned.
+    
+    Returns:
+        AlbumCatalog: The catalog
+    """
+    global _catalog, _next_check, _clear_memo_again
+    
+    catalog = _catalog
+    if time.monotonic() < _next_check or not _reload_lock.acquire(blocking=False):
+        return catalog
+    
+    try:
+        _next_check = time.monotonic() + CATALOG_CHECK_INTERVAL
+        
+        # A lookup that started before the last reload may have put an
+        # answer from the old catalog in the memo after it was cleared
+        if _clear_memo_again:
+            get_album_for_month.cache_clear()
+            _clear_memo_again = False
+        
+        try:
+            if os.path.getmtime(CATALOG_PATH) == catalog.mtime:
+                return catalog
+            _catalog = load_catalog(CATALOG_PATH)
+        except (OSError, ValueError) as e:
+            # Keep the last good catalog (e.g. the file is being edited)
+            warnings.warn(f"Album catalog not reloaded: {e}")
+        else:
+            # Remembered inputs must give the new albums
+            get_album_for_month.cache_clear()
+            _clear_memo_again = True
+        return _catalog
+    finally:
+        _reload_lock.release()
+
+
+def _watch_catalog():
+    """Check the catalog file for changes once a second (in a daemon thread)"""
+    while True:
+        time.sleep(CATALOG_CHECK_INTERVAL)
+        try:
+            get_catalog()
+        except Exception as e:
+            warnings.warn(f"Album catalog check failed: {e}")
+
+
+def __getattr__(name):
+    """
+    Keep album_logic.MONTH_TO_ALBUM, ALBUM_TO_IMAGE, MONTH_INDEX and ALBUMS
+    working; they always give the current catalog's tables.
+    """
+    tables = {"MONTH_TO_ALBUM": "month_to_album", "ALBUM_TO_IMAGE": "album_to_image",
+              "MONTH_INDEX": "month_index", "ALBUMS": "albums"}
+    if name in tables:
+        return getattr(get_catalog(), tables[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1024)
 def get_album_for_month(month_name):
     """
     Get the Taylor Swift album for a given birth month.
     
+    Besides the full name, abbreviations ("Jan"), numbers ("8", "08") and
+    French, Spanish, German and Hebrew names ("août") are accepted. The
+    last 1024 different inputs are remembered, so repeated inputs skip the
+    normalizing (the memo is cleared when the catalog file changes).
+    
     Args:
         month_name (str): Name of the month (e.g., "January", "February")
         
     Returns:
         str or None: Album name if month is valid, None otherwise
     """
-    # Normalize the input by capitalizing first letter
-    month_name = month_name.strip().capitalize()
-    return MONTH_TO_ALBUM.get(month_name)
+    return _catalog.month_index.get(normalize_month_text(month_name))
+
+
+threading.Thread(target=_watch_catalog, name="album-catalog-watcher", daemon=True).start()
 
 
 def get_image_filename_for_album(album_name):
@@ -61,7 +260,7 @@ def get_image_filename_for_album(album_name):
     Returns:
         str or None: Image filename if album exists, None otherwise
     """
-    return ALBUM_TO_IMAGE.get(album_name)
+    return get_catalog().album_to_image.get(album_name)
 
 
 def is_valid_month(month_name):
@@ -74,5 +273,110 @@ def is_valid_month(month_name):
     Returns:
         bool: True if valid month, False otherwise
     """
-    month_name = month_name.strip().capitalize()
-    return month_name in MONTH_TO_ALBUM
+    return get_album_for_month(month_name) is not None
+
+
+# Longest date range (in days) albums_for_dates makes a day table for
+MAX_DAY_TABLE = 1_000_000
+
+
+@lru_cache(maxsize=4)
+def _album_tables(catalog):
+    """
+    Make the numpy lookup tables (on first use, so numpy is only imported
+    by programs that use the array functions).
+    
+    Args:
+        catalog (AlbumCatalog): Catalog to make the tables for
+        
+    Returns:
+        tuple: (month code table, album name table)
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("The album array functions need numpy (pip install numpy)") from None
+    
+    # Index 1-12 are the months; 0 and 13 are for numbers outside 1-12
+    codes = np.array([-1] + list(range(12)) + [-1], dtype=np.int8)
+    # Code -1 picks the last entry (None)
+    names = np.array(catalog.albums + (None,), dtype=object)
+    return codes, names
+
+
+def albums_for_months(months, decode=False):
+    """
+    Get the album of every month number in an array (no Python loop).
+    
+    Args:
+        months (array-like): Month numbers 1-12 (integer or float array or
+                             list; NaN and numbers like 2.5 are no month)
+        decode (bool): Return album names instead of codes
+        
+    Returns:
+        numpy.ndarray: Album codes (int8, index into ALBUMS, -1 for numbers
+                       outside 1-12), or album names (None for no month)
+                       
+    Raises:
+        TypeError: If the months are not numbers
+    """
+    import numpy as np
+    codes, names = _album_tables(get_catalog())
+    
+    months = np.asarray(months)
+    if months.dtype.kind == "f":
+        # Floats come from e.g. pandas columns with missing values (NaN);
+        # only whole numbers are months
+        whole = np.isfinite(months) & (np.floor(months) == months)
+        months = np.where(whole, months, 0)
+    elif months.dtype.kind not in "iu":
+        raise TypeError(f"Months must be integer or float numbers, not {months.dtype}")
+    
+    # Numbers below 1 become 0 and above 12 become 13 (both "no month")
+    album_codes = codes.take(np.clip(months, 0, 13).astype(np.intp))
+    
+    return names[album_codes] if decode else album_codes
+
+
+def albums_for_dates(dates, decode=False):
+    """
+    Get the album of every date in a datetime64 array (no Python loop).
+    
+    Args:
+        dates (array-like): numpy datetime64 array (any unit), NaT for no date
+        decode (bool): Return album names instead of codes
+        
+    Returns:
+        numpy.ndarray: Same as albums_for_months
+    """
+    import numpy as np
+    codes, names = _album_tables(get_catalog())
+    
+    days = np.asarray(dates, dtype="datetime64").astype("datetime64[D]")
+    shape = days.shape
+    # Worked out on a 1-d array (a single date too), shaped back at the end
+    days = days.reshape(-1)
+    missing = np.isnat(days)
+    day_numbers = days.view(np.int64)
+    
+    present = day_numbers[~missing] if missing.any() else day_numbers
+    if present.size == 0:
+        album_codes = np.full(days.shape, -1, dtype=np.int8)
+    elif present.max() - present.min() > MAX_DAY_TABLE:
+        # Dates thousands of years apart: work out every month directly
+        months = days.astype("datetime64[M]").astype(np.int64) % 12 + 1
+        album_codes = np.where(missing, np.int8(-1), codes.take(months))
+    else:
+        # Working out the month of each date is slow, so it is only done once
+        # per day in the range of the data (e.g. 36500 days for 100 years),
+        # and then every date looks up its day in that table
+        first, last = present.min(), present.max()
+        range_days = np.arange(first, last + 1).astype("datetime64[D]")
+        range_months = range_days.astype("datetime64[M]").astype(np.int64) % 12 + 1
+        day_codes = codes.take(range_months)
+        
+        album_codes = day_codes.take(np.clip(day_numbers - first, 0, last - first))
+        album_codes = np.where(missing, np.int8(-1), album_codes)
+    
+    album_codes = album_codes.reshape(shape)
+    return names[album_codes] if decode else album_codes
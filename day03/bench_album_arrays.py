@@ -0,0 +1,79 @@
+"""
+Array benchmark for Taylor Swift Album Finder
+Compares albums_for_months / albums_for_dates (numpy, no Python loop) with
+calling get_album_for_month once per row. Needs numpy (pip install numpy).
+"""
+
+import time
+
+import numpy as np
+
+import album_logic
+
+ROWS = 10_000_000
+
+# The per-row loop is slow, so it runs on fewer rows and is scaled up
+SCALAR_ROWS = 500_000
+
+
+def best_seconds(function, repeat=3):
+    """
+    Time a function (best of several runs)
+    
+    Returns:
+        float: Seconds
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run_benchmark(rows=ROWS, scalar_rows=SCALAR_ROWS):
+    """
+    Time every way of mapping rows to albums
+    
+    Args:
+        rows (int): Rows for the numpy functions
+        scalar_rows (int): Rows for the per-row loops
+        
+    Returns:
+        list: (method, seconds for `rows` rows) tuples
+    """
+    rng = np.random.default_rng(0)
+    months = rng.integers(1, 13, rows)
+    # Birthdates between 1925 and 2025
+    dates = rng.integers(-16000, 20000, rows).astype("datetime64[D]")
+    
+    scalar_months = [str(month) for month in months[:scalar_rows].tolist()]
+    scalar_dates = dates[:scalar_rows].tolist()
+    scale = rows / scalar_rows
+    
+    def scalar_month_loop():
+        return [album_logic.get_album_for_month(month) for month in scalar_months]
+    
+    def scalar_date_loop():
+        return [album_logic.get_album_for_month(str(date.month)) for date in scalar_dates]
+    
+    return [
+        ("get_album_for_month loop (months)", best_seconds(scalar_month_loop) * scale),
+        ("get_album_for_month loop (dates)", best_seconds(scalar_date_loop) * scale),
+        ("albums_for_months (codes)", best_seconds(lambda: album_logic.albums_for_months(months))),
+        ("albums_for_months (names)", best_seconds(lambda: album_logic.albums_for_months(months, decode=True))),
+        ("albums_for_dates (codes)", best_seconds(lambda: album_logic.albums_for_dates(dates))),
+        ("albums_for_dates (names)", best_seconds(lambda: album_logic.albums_for_dates(dates, decode=True))),
+    ]
+
+
+def main():
+    """Print the time for 10 million rows and rows per second"""
+    print(f"{ROWS:,} rows (loops measured on {SCALAR_ROWS:,} rows and scaled up)")
+    print(f"{'Method':<36} {'seconds':>8} {'rows/s':>14}")
+    for method, seconds in run_benchmark():
+        print(f"{method:<36} {seconds:>8.3f} {ROWS / seconds:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
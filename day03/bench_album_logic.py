@@ -0,0 +1,80 @@
+"""
+Lookup benchmark for Taylor Swift Album Finder
+Lookups per second of get_album_for_month: the old version (strip +
+capitalize + dict lookup), the month index without the memo, and the
+month index with the memo (repeated inputs, like the GUI and intake forms)
+"""
+
+import timeit
+
+import album_logic
+
+# Inputs the old version also understands, so all three can be compared
+FULL_NAMES = ["January", "august", "  DECEMBER ", "May", "NotAMonth", "november"]
+
+# Inputs only the month index understands
+ALIASES = ["Jan", "08", "8", "août", "Sept.", "mayo", "13"]
+
+
+# A plain dict like the old hard-coded MONTH_TO_ALBUM
+MONTH_TO_ALBUM = dict(album_logic.get_catalog().month_to_album)
+
+
+def old_get_album_for_month(month_name):
+    """get_album_for_month before the month index (for comparison)"""
+    month_name = month_name.strip().capitalize()
+    return MONTH_TO_ALBUM.get(month_name)
+
+
+def lookups_per_second(function, inputs, repeat=5, number=20000):
+    """
+    Time a lookup function on a list of inputs (best of several runs)
+    
+    Args:
+        function (callable): Lookup function
+        inputs (list): Month texts to look up (one after the other)
+        repeat (int): Number of timing runs
+        number (int): Passes over the inputs per run
+        
+    Returns:
+        float: Lookups per second
+    """
+    def run():
+        for text in inputs:
+            function(text)
+    
+    best = min(timeit.repeat(run, repeat=repeat, number=number))
+    return len(inputs) * number / best
+
+
+def run_benchmark():
+    """
+    Measure every version on both kinds of input
+    
+    Returns:
+        list: (version, lookups/s on full names, lookups/s on aliases) tuples;
+              None where the version doesn't understand the inputs
+    """
+    with_memo = album_logic.get_album_for_month
+    
+    no_memo = album_logic.get_album_for_month.__wrapped__
+    
+    return [
+        ("old (strip + capitalize)", lookups_per_second(old_get_album_for_month, FULL_NAMES), None),
+        ("month index, no memo", lookups_per_second(no_memo, FULL_NAMES),
+         lookups_per_second(no_memo, ALIASES)),
+        ("month index + memo", lookups_per_second(with_memo, FULL_NAMES),
+         lookups_per_second(with_memo, ALIASES)),
+    ]
+
+
+def main():
+    """Print lookups per second of every version"""
+    print(f"{'Version':<26} {'full names/s':>14} {'aliases/s':>14}")
+    for version, full_names, aliases in run_benchmark():
+        aliases_text = f"{aliases:>14,.0f}" if aliases is not None else f"{'(not found)':>14}"
+        print(f"{version:<26} {full_names:>14,.0f} {aliases_text}")
+
+
+if __name__ == "__main__":
+    main()
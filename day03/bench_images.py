@@ -0,0 +1,185 @@
+"""
+Image benchmark for Taylor Swift Album Finder
+Compares the old way of making a cover small (decode the whole JPEG, then
+resize) with image_utils.open_resized (JPEG draft mode + reduce), for every
+album cover, the background and a PNG headshot like the ones in day04
+"""
+
+import os
+import subprocess
+import sys
+import timeit
+from io import BytesIO
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Windows: peak memory is not measured
+
+from PIL import Image
+
+from image_utils import open_resized
+
+COVERS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "album_covers")
+
+# Run in a new process by peak_memory_kb: reads the image from standard
+# input, then prints how much the peak memory grew while resizing it
+MEMORY_SCRIPT = """
+import sys
+from io import BytesIO
+import bench_images
+source = BytesIO(sys.stdin.buffer.read())
+function = getattr(bench_images, sys.argv[1])
+before = bench_images.peak_rss_kb()
+function(source, (int(sys.argv[2]), int(sys.argv[3])))
+print(bench_images.peak_rss_kb() - before)
+"""
+
+
+def old_resized(source, size):
+    """The old way: decode the whole image, then resize it"""
+    img = Image.open(source)
+    return img.resize(size, Image.Resampling.LANCZOS)
+
+
+def peak_rss_kb():
+    """
+    Peak memory (max RSS) of this process so far
+    
+    On Linux it is read from /proc (VmHWM), because ru_maxrss of a new
+    process starts at the peak of the process that started it.
+    
+    Returns:
+        int: Kilobytes
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass  # Not Linux
+    
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS gives max RSS in bytes, Linux in kilobytes
+    return max_rss // 1024 if sys.platform == "darwin" else max_rss
+
+
+def peak_memory_kb(function_name, source, size):
+    """
+    Peak memory used to decode and resize one image, measured in a new process
+    
+    Pillow keeps image data outside of Python's memory tracking (tracemalloc
+    doesn't see it), so this measures how much the process's peak memory
+    (max RSS) grows. A new process is used so earlier images don't count.
+    
+    Args:
+        function_name (str): "old_resized" or "open_resized"
+        source (str or BytesIO): The image
+        size (tuple): Target size
+        
+    Returns:
+        int or None: Kilobytes, or None where it can't be measured (Windows)
+    """
+    if resource is None:
+        return None
+    
+    if isinstance(source, BytesIO):
+        data = source.getvalue()
+    else:
+        with open(source, "rb") as f:
+            data = f.read()
+    
+    process = subprocess.run(
+        [sys.executable, "-c", MEMORY_SCRIPT, function_name, str(size[0]), str(size[1])],
+        input=data, capture_output=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    return int(process.stdout)
+
+
+def sample_images():
+    """
+    Get the images to test with
+    
+    Returns:
+        list: (name, source, size) tuples
+    """
+    samples = []
+    for filename in sorted(os.listdir(COVERS_DIR)):
+        size = (800, 750) if filename == "background.jpg" else (200, 200)
+        path = os.path.join(COVERS_DIR, filename)
+        with Image.open(path) as img:
+            if img.width < size[0] or img.height < size[1]:
+                # Made bigger, so both ways decode it the same
+                filename += " (upscale)"
+        samples.append((filename, path, size))
+    
+    # A headshot like the ones on cdn.wnba.com (260x190 PNG), shown at 60x60.
+    # PNGs have no draft mode and 260x190 is less than 4x 60x60, so
+    # open_resized can't do anything faster here (expect about 1.0x)
+    buffer = BytesIO()
+    Image.linear_gradient("L").resize((260, 190)).convert("RGBA").save(buffer, format="PNG")
+    samples.append(("headshot (260x190 PNG)", buffer, (60, 60)))
+    
+    return samples
+
+
+def best_time(function, source, size, repeat=5, number=3):
+    """
+    Time one way of resizing (best of several runs)
+    
+    Returns:
+        float: Milliseconds per image
+    """
+    def run():
+        if isinstance(source, BytesIO):
+            source.seek(0)
+        function(source, size)
+    
+    return min(timeit.repeat(run, repeat=repeat, number=number)) / number * 1000
+
+
+def run_benchmark():
+    """
+    Time both ways of resizing for every sample image
+    
+    Returns:
+        list: (name, old ms, new ms, old peak KB, new peak KB) tuples
+              (peak KB is None where it can't be measured)
+    """
+    results = []
+    for name, source, size in sample_images():
+        results.append((
+            name,
+            best_time(old_resized, source, size),
+            best_time(open_resized, source, size),
+            peak_memory_kb("old_resized", source, size),
+            peak_memory_kb("open_resized", source, size)
+        ))
+    return results
+
+
+def format_kb(kilobytes):
+    """Format a peak memory for the table ("n/a" if not measured)"""
+    return f"{kilobytes:>9,}" if kilobytes is not None else f"{'n/a':>9}"
+
+
+def main():
+    """Print a table of decode + resize time and peak memory"""
+    results = run_benchmark()
+    
+    print(f"{'Image':<24} {'old ms':>8} {'new ms':>8} {'speedup':>8} {'old KB':>9} {'new KB':>9}")
+    for name, old_ms, new_ms, old_kb, new_kb in results:
+        print(f"{name:<24} {old_ms:>8.2f} {new_ms:>8.2f} {old_ms / new_ms:>7.1f}x "
+              f"{format_kb(old_kb)} {format_kb(new_kb)}")
+    
+    old_total = sum(result[1] for result in results)
+    new_total = sum(result[2] for result in results)
+    print(f"{'total':<24} {old_total:>8.2f} {new_total:>8.2f} {old_total / new_total:>7.1f}x")
+    if resource is not None:
+        print(f"Peak memory (growth of max RSS): {max(r[3] for r in results):,} KB before, "
+              f"{max(r[4] for r in results):,} KB now")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Cover cache for Taylor Swift Album Finder
+Keeps the resized album covers in memory and on disk, so each cover is only
+decoded and resized the first time it is shown. Covers can also be resized
+ahead of time in background threads (preload)
+"""
+
+import os
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+from image_utils import open_resized
+
+
+def get_thumbnail_path(image_path, size, cache_dir):
+    """
+    Get a resized copy of an image, making it only if needed.
+    
+    The copy is a PNG file in cache_dir. It is made again when the original
+    image is newer than the copy (e.g. a cover was replaced).
+    
+    Args:
+        image_path (str): Path of the full-size image
+        size (tuple): Size of the copy (width, height)
+        cache_dir (str): Directory to keep the resized copies in
+        
+    Returns:
+        str: Path of the resized copy
+    """
+    name = os.path.splitext(os.path.basename(image_path))[0]
+    thumbnail_path = os.path.join(cache_dir, f"{name}_{size[0]}x{size[1]}.png")
+    
+    # Use the saved copy if it is newer than the original image
+    try:
+        if os.path.getmtime(thumbnail_path) >= os.path.getmtime(image_path):
+            return thumbnail_path
+    except OSError:
+        pass  # No copy yet
+    
+    os.makedirs(cache_dir, exist_ok=True)
+    
+    # Decoded at close to the target size (see image_utils)
+    img = open_resized(image_path, size)
+    if img.mode not in ("RGB", "RGBA", "L", "LA", "P"):
+        img = img.convert("RGB")  # PNG can't store e.g. CMYK JPEGs
+    
+    # Save to a temp file first, so a half written copy is never used
+    temp_path = thumbnail_path + ".tmp"
+    img.save(temp_path, format="PNG")
+    os.replace(temp_path, thumbnail_path)
+    
+    return thumbnail_path
+
+
+class CoverCache:
+    """Resized album covers as PhotoImages, made once per cover and size"""
+    
+    def __init__(self, covers_dir, cache_dir=None, make_photo=None, max_workers=4):
+        """
+        Create the cache.
+        
+        Args:
+            covers_dir (str): Directory with the full-size covers
+            cache_dir (str): Directory for the resized copies
+                             (default: cover_thumbnails next to covers_dir)
+            make_photo (callable): Turns a PNG path into a PhotoImage
+                                   (default: tk.PhotoImage, which reads PNGs itself)
+            max_workers (int): Number of threads used by preload
+        """
+        self.covers_dir = covers_dir
+        self.cache_dir = cache_dir or os.path.join(os.path.dirname(covers_dir), "cover_thumbnails")
+        self.make_photo = make_photo or (lambda path: tk.PhotoImage(file=path))
+        self.max_workers = max_workers
+        self.photos = {}
+        
+        # (filename, size) -> Future of the resized copy's path, for covers
+        # that preload started. Only used from the main thread.
+        self.preloading = {}
+        self._executor = None
+    
+    def preload(self, image_filenames, size):
+        """
+        Start decoding and resizing covers in background threads.
+        
+        Returns right away. The PhotoImages themselves are still made by
+        get_photo, because Tk objects may only be made on the main thread.
+        
+        Args:
+            image_filenames (iterable): File names inside covers_dir
+            size (tuple): Size of the covers (width, height)
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="cover-preload")
+        
+        for image_filename in image_filenames:
+            key = (image_filename, tuple(size))
+            if key in self.photos or key in self.preloading:
+                continue
+            
+            image_path = os.path.join(self.covers_dir, image_filename)
+            self.preloading[key] = self._executor.submit(
+                get_thumbnail_path, image_path, tuple(size), self.cache_dir)
+    
+    def shutdown(self):
+        """Stop preloading (covers that are not started yet are skipped)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def get_photo(self, image_filename, size):
+        """
+        Get a cover as a PhotoImage of the given size.
+        
+        Args:
+            image_filename (str): File name inside covers_dir (e.g. "red.jpg")
+            size (tuple): Size of the cover (width, height)
+            
+        Returns:
+            PhotoImage or None: The cover, or None if the file doesn't exist
+        """
+        key = (image_filename, tuple(size))
+        
+        # Shown before: nothing to decode or resize
+        if key in self.photos:
+            return self.photos[key]
+        
+        thumbnail_path = self._preloaded_path(key)
+        
+        if thumbnail_path is None:
+            # Not preloaded: decode and resize it now
+            image_path = os.path.join(self.covers_dir, image_filename)
+            if not os.path.exists(image_path):
+                return None
+            thumbnail_path = get_thumbnail_path(image_path, tuple(size), self.cache_dir)
+        
+        photo = self.make_photo(thumbnail_path)
+        self.photos[key] = photo
+        return photo
+    
+    def _preloaded_path(self, key):
+        """
+        Get the resized copy made by preload.
+        
+        A cover whose turn has not come yet is taken off the queue, so the
+        caller loads it on demand. A cover that is being resized right now
+        is waited for, since it is already partly done.
+        
+        Args:
+            key (tuple): (filename, size)
+            
+        Returns:
+            str or None: Path of the resized copy, or None to load it on demand
+        """
+        future = self.preloading.pop(key, None)
+        if future is None or future.cancel():
+            return None
+        
+        try:
+            return future.result()
+        except Exception:
+            return None  # e.g. a missing cover file
@@ -0,0 +1,43 @@
+"""
+Image helpers for Taylor Swift Album Finder
+Opens an image already shrunk close to the size it is shown at, so big
+JPEGs are never decoded at full resolution just to be made small.
+Shared by both apps (day02 and day04 import it from this folder)
+"""
+
+from PIL import Image
+
+
+def open_resized(source, size):
+    """
+    Open an image and resize it, decoding as little as possible.
+    
+    JPEGs are decoded in draft mode (the decoder itself scales them down by
+    1/2, 1/4 or 1/8 while decoding), other images are shrunk with the fast
+    Image.reduce first. The final LANCZOS resample then only works on an
+    image that is close to the target size.
+    
+    Args:
+        source (str or file): Path or file object of the image
+        size (tuple): Target size (width, height)
+        
+    Returns:
+        PIL.Image.Image: The resized image
+    """
+    img = Image.open(source)
+    
+    # Draft mode and reduce only help when the image is at least 2x the
+    # target (e.g. not for the background, which is made bigger)
+    if img.width < 2 * size[0] or img.height < 2 * size[1]:
+        return img.resize(size, Image.Resampling.LANCZOS)
+    
+    if img.format == "JPEG":
+        # Keeps the decoded image at least as big as the target size
+        img.draft(img.mode, size)
+    
+    # Shrink by a whole factor while the image is still 2x the target or more
+    factor = min(img.width // (2 * size[0]), img.height // (2 * size[1]))
+    if factor >= 2 and img.mode not in ("1", "P"):
+        img = img.reduce(factor)
+    
+    return img.resize(size, Image.Resampling.LANCZOS)
@@ -1,8 +1,14 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
-from PIL import Image, ImageTk
 import os
 import album_logic
+from cover_cache import CoverCache
+
+# Size the album covers are shown at
+COVER_SIZE = (200, 200)
+
+# Resize every cover in the background after the window is shown
+PRELOAD_COVERS = True
 
 def get_taylor_swift_album(month_source=None):
     """Get the Taylor Swift album based on birth month"""
@@ -23,26 +29,21 @@ def get_taylor_swift_album(month_source=None):
         
         # Try to load and display the album cover
         image_filename = album_logic.get_image_filename_for_album(album_name)
-        # Get the directory where this script is located
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        image_path = os.path.join(script_dir, "album_covers", image_filename)
         
-        if os.path.exists(image_path):
-            try:
-                # Load and resize image
-                img = Image.open(image_path)
-                img = img.resize((200, 200), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                
+        try:
+            # Resized cover (preloaded, or decoded and resized now if it isn't ready yet)
+            photo = cover_cache.get_photo(image_filename, COVER_SIZE)
+        except Exception as e:
+            image_label.config(image="", text="(Image not available)")
+        else:
+            if photo:
                 # Update image label
                 image_label.config(image=photo)
                 image_label.image = photo  # Keep a reference
-            except Exception as e:
-                image_label.config(image="", text="(Image not available)")
-        else:
-            image_label.config(image="", text="(Image not found)")
+            else:
+                image_label.config(image="", text="(Image not found)")
     else:
-        messagebox.showerror("Error", "Please enter a valid month name (e.g., January, February, etc.)")
+        messagebox.showerror("Error", "Please enter a valid month (e.g., January, Jan or 1)")
 
 def get_from_dropdown():
     """Get album from dropdown selection"""
@@ -56,25 +57,29 @@ def get_from_button(month):
     """Get album from month button click"""
     get_taylor_swift_album(month)
 
+def preload_covers():
+    """Start resizing all 12 album covers in background threads"""
+    cover_cache.preload(album_logic.get_catalog().album_to_image.values(), COVER_SIZE)
+
 # Create main window
 root = tk.Tk()
 root.title("Taylor Swift Birth Month Album")
 root.geometry("800x750")
 root.configure(bg="#FFF5F7")
 
-# Load and set background image
+# Resized album covers, kept in memory and in cover_thumbnails/
 script_dir = os.path.dirname(os.path.abspath(__file__))
-background_path = os.path.join(script_dir, "album_covers", "background.jpg")
+cover_cache = CoverCache(os.path.join(script_dir, "album_covers"))
 
+# Load and set background image
 try:
-    background_image = Image.open(background_path)
-    background_image = background_image.resize((800, 750), Image.Resampling.LANCZOS)
-    background_photo = ImageTk.PhotoImage(background_image)
+    background_photo = cover_cache.get_photo("background.jpg", (800, 750))
     
-    # Create a label for the background
-    background_label = tk.Label(root, image=background_photo)
-    background_label.image = background_photo
-    background_label.place(x=0, y=0, relwidth=1, relheight=1)
+    if background_photo:
+        # Create a label for the background
+        background_label = tk.Label(root, image=background_photo)
+        background_label.image = background_photo
+        background_label.place(x=0, y=0, relwidth=1, relheight=1)
 except:
     pass  # If background image not found, continue without it
 
@@ -207,5 +212,11 @@ image_label = tk.Label(
 )
 image_label.pack(pady=10)
 
+# Preload the covers shortly after the window is first drawn, so it
+# doesn't make the window open any slower
+if PRELOAD_COVERS:
+    root.after(100, preload_covers)
+
 # Run the application
 root.mainloop()
+cover_cache.shutdown()
@@ -0,0 +1,162 @@
+"""
+Unit tests for album_cli module
+Tests adding the album column to CSV and JSONL files
+"""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+import album_cli
+
+
+class TestAlbumForValue(unittest.TestCase):
+    """Test cases for finding the album of one value"""
+    
+    def test_iso_dates(self):
+        """Test full dates, year-month and date-times"""
+        self.assertEqual(album_cli.album_for_value("1989-12-13"), "The Life of a Showgirl")
+        self.assertEqual(album_cli.album_for_value("2000-08"), "Folklore")
+        self.assertEqual(album_cli.album_for_value("1995-01-05T08:30:00"), "Taylor Swift")
+    
+    def test_months(self):
+        """Test month names, abbreviations and numbers (also JSON numbers)"""
+        self.assertEqual(album_cli.album_for_value("August"), "Folklore")
+        self.assertEqual(album_cli.album_for_value("Dec"), "The Life of a Showgirl")
+        self.assertEqual(album_cli.album_for_value(5), "1989")
+    
+    def test_date_format(self):
+        """Test dates in another format"""
+        self.assertEqual(album_cli.album_for_value("13/08/1990", "%d/%m/%Y"), "Folklore")
+        self.assertEqual(album_cli.album_for_value("March", "%d/%m/%Y"), "Speak Now")
+    
+    def test_no_month(self):
+        """Test values without a month"""
+        self.assertIsNone(album_cli.album_for_value(None))
+        self.assertIsNone(album_cli.album_for_value(""))
+        self.assertIsNone(album_cli.album_for_value("1989-13-01"))
+
+
+class TestAddAlbums(unittest.TestCase):
+    """Test cases for streaming whole files"""
+    
+    CSV_TEXT = ("id,name,birthdate\n"
+                "1,Ana,1990-01-15\n"
+                "2,\"Cohen, Dana\",1985-08-03\n"
+                "3,Eli,\n"
+                "4,Noa,2001-12-31\n")
+    
+    def run_csv(self, text, **kwargs):
+        output = io.StringIO()
+        count = album_cli.add_albums(io.StringIO(text), output, "csv", **kwargs)
+        return count, output.getvalue().splitlines()
+    
+    def test_csv(self):
+        """Test that the album column is added to every row"""
+        count, lines = self.run_csv(self.CSV_TEXT, workers=0)
+        
+        self.assertEqual(count, 4)
+        self.assertEqual(lines, ["id,name,birthdate,album",
+                                 "1,Ana,1990-01-15,Taylor Swift",
+                                 "2,\"Cohen, Dana\",1985-08-03,Folklore",
+                                 "3,Eli,,",
+                                 "4,Noa,2001-12-31,The Life of a Showgirl"])
+    
+    def test_process_pool_keeps_the_order(self):
+        """Test that small chunks in worker processes come back in order"""
+        rows = "".join(f"{i},Member {i},2000-{i % 12 + 1:02d}-01\n" for i in range(500))
+        _, in_process = self.run_csv("id,name,birthdate\n" + rows, workers=0, chunk_size=7)
+        count, pooled = self.run_csv("id,name,birthdate\n" + rows, workers=2, chunk_size=7)
+        
+        self.assertEqual(count, 500)
+        self.assertEqual(pooled, in_process)
+    
+    def test_month_column(self):
+        """Test a file with a month column instead of dates"""
+        count, lines = self.run_csv("name,month\nAna,aug\nEli,13\n", workers=0)
+        self.assertEqual(lines[1:], ["Ana,aug,Folklore", "Eli,13,"])
+    
+    def test_missing_column(self):
+        """Test that a file without a date column is an error"""
+        with self.assertRaises(ValueError):
+            self.run_csv("id,name\n1,Ana\n", workers=0)
+        with self.assertRaises(ValueError):
+            self.run_csv(self.CSV_TEXT, column="dob", workers=0)
+    
+    def test_jsonl(self):
+        """Test JSONL input (one object per line, empty lines skipped)"""
+        text = '{"id": 1, "dob": "1990-04-02"}\n\n{"id": 2, "dob": "bad"}\n'
+        output = io.StringIO()
+        count = album_cli.add_albums(io.StringIO(text), output, "jsonl", workers=0)
+        
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(count, 2)
+        self.assertEqual(records, [{"id": 1, "dob": "1990-04-02", "album": "Red"},
+                                   {"id": 2, "dob": "bad", "album": None}])
+    
+    
+    def test_jsonl_bad_lines(self):
+        """Test that a line that is not a JSON object is an error with its line number"""
+        for bad_line in ("[1]", '"x"', "3", "{not json"):
+            text = '{"dob": "1990-04-02"}\n\n' + bad_line + "\n"
+            with self.assertRaisesRegex(ValueError, "^Line 3: "):
+                album_cli.add_albums(io.StringIO(text), io.StringIO(), "jsonl", workers=0)
+
+
+class TestMain(unittest.TestCase):
+    """Test cases for the command line"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_files_and_rows_per_second(self):
+        """Test reading and writing files, with rows/s printed at the end"""
+        input_path = os.path.join(self.temp_dir, "members.jsonl")
+        output_path = os.path.join(self.temp_dir, "out.jsonl")
+        with open(input_path, "w", encoding="utf-8") as f:
+            f.write('{"birthdate": "1992-07-04"}\n')
+        
+        messages = io.StringIO()
+        with redirect_stderr(messages):
+            exit_code = album_cli.main([input_path, "-o", output_path, "--workers", "0"])
+        
+        self.assertEqual(exit_code, 0)
+        self.assertIn("rows/s", messages.getvalue())
+        with open(output_path, encoding="utf-8") as f:
+            self.assertEqual(json.loads(f.read())["album"], "Lover")
+    
+    def test_chunk_size_must_be_positive(self):
+        """Test that --chunk-size 0 is rejected instead of dropping every row"""
+        input_path = os.path.join(self.temp_dir, "members.csv")
+        with open(input_path, "w", encoding="utf-8") as f:
+            f.write("name,month\nAna,aug\n")
+        
+        for chunk_size in ("0", "-5"):
+            with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as raised:
+                album_cli.main([input_path, "--chunk-size", chunk_size])
+            self.assertEqual(raised.exception.code, 2)
+        
+        with self.assertRaises(ValueError):
+            album_cli.add_albums(io.StringIO("name,month\nAna,aug\n"), io.StringIO(), chunk_size=0, workers=0)
+    
+    def test_error_exit_code(self):
+        """Test that a missing column gives exit code 2"""
+        input_path = os.path.join(self.temp_dir, "members.csv")
+        with open(input_path, "w", encoding="utf-8") as f:
+            f.write("id,name\n1,Ana\n")
+        
+        with redirect_stderr(io.StringIO()):
+            exit_code = album_cli.main([input_path, "-o", os.path.join(self.temp_dir, "out.csv")])
+        
+        self.assertEqual(exit_code, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,9 +3,22 @@ Unit tests for album_logic module
 Tests the business logic for Taylor Swift Album Finder
 """
 
+import json
+import os
+import shutil
+import tempfile
+import time
 import unittest
+import warnings
+from unittest import mock
+
 import album_logic
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestAlbumLogic(unittest.TestCase):
     """Test cases for album logic functions"""
@@ -71,21 +84,22 @@ class TestAlbumLogic(unittest.TestCase):
         self.assertFalse(album_logic.is_valid_month("NotAMonth"))
         self.assertFalse(album_logic.is_valid_month(""))
         self.assertFalse(album_logic.is_valid_month("13"))
-        self.assertFalse(album_logic.is_valid_month("Jan"))
+        self.assertFalse(album_logic.is_valid_month("Ja"))
     
     def test_edge_cases(self):
         """Test edge cases"""
         # Empty string
         self.assertIsNone(album_logic.get_album_for_month(""))
         
-        # Numbers
-        self.assertIsNone(album_logic.get_album_for_month("1"))
+        # Numbers outside 1-12
+        self.assertIsNone(album_logic.get_album_for_month("0"))
+        self.assertIsNone(album_logic.get_album_for_month("13"))
         
         # Special characters
         self.assertIsNone(album_logic.get_album_for_month("@#$%"))
         
-        # Partial month names
-        self.assertIsNone(album_logic.get_album_for_month("Jan"))
+        # Partial month names (other than the 3-letter abbreviations)
+        self.assertIsNone(album_logic.get_album_for_month("Janu"))
         
         # Misspellings
         self.assertIsNone(album_logic.get_album_for_month("Januray"))
@@ -116,6 +130,234 @@ class TestAlbumLogic(unittest.TestCase):
         self.assertEqual(image2, "ttpd.jpg")
 
 
+class TestMonthAliases(unittest.TestCase):
+    """Test the other ways to write a month (abbreviations, numbers, other languages)"""
+    
+    def test_abbreviations(self):
+        """Test 3-letter abbreviations, with or without a dot"""
+        self.assertEqual(album_logic.get_album_for_month("Jan"), "Taylor Swift")
+        self.assertEqual(album_logic.get_album_for_month("aug"), "Folklore")
+        self.assertEqual(album_logic.get_album_for_month("Sept."), "Evermore")
+        self.assertTrue(album_logic.is_valid_month("DEC"))
+    
+    def test_numbers(self):
+        """Test month numbers with and without a leading zero"""
+        self.assertEqual(album_logic.get_album_for_month("1"), "Taylor Swift")
+        self.assertEqual(album_logic.get_album_for_month("8"), "Folklore")
+        self.assertEqual(album_logic.get_album_for_month("08"), "Folklore")
+        self.assertEqual(album_logic.get_album_for_month(" 12 "), "The Life of a Showgirl")
+    
+    def test_other_languages(self):
+        """Test month names in other languages, with or without accents"""
+        self.assertEqual(album_logic.get_album_for_month("août"), "Folklore")
+        self.assertEqual(album_logic.get_album_for_month("AOUT"), "Folklore")
+        self.assertEqual(album_logic.get_album_for_month("mayo"), "1989")
+        self.assertEqual(album_logic.get_album_for_month("März"), "Speak Now")
+        self.assertEqual(album_logic.get_album_for_month("אוגוסט"), "Folklore")
+    
+    def test_index_covers_every_month(self):
+        """Test that every month has its name, abbreviation and number in the index"""
+        for number, month in enumerate(album_logic.MONTH_TO_ALBUM, start=1):
+            album = album_logic.MONTH_TO_ALBUM[month]
+            self.assertEqual(album_logic.MONTH_INDEX[month.lower()], album)
+            self.assertEqual(album_logic.MONTH_INDEX[month[:3].lower()], album)
+            self.assertEqual(album_logic.MONTH_INDEX[str(number)], album)
+    
+    def test_same_alias_for_two_months_is_an_error(self):
+        """Test that building the index finds an alias used twice"""
+        with self.assertRaises(ValueError):
+            album_logic.build_month_index({"January": "A", "Jan": "B"})
+
+
+class TestCatalog(unittest.TestCase):
+    """Test loading the album catalog file and reloading it when it changes"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "album_catalog.json")
+        with open(album_logic.CATALOG_PATH, encoding="utf-8") as f:
+            self.data = json.load(f)
+        self.write(self.data, mtime=1000)
+        
+        # Use the temp file as the catalog, checked on the next get_catalog.
+        # The lock keeps the watcher thread out while the patches change.
+        self.patches = [
+            mock.patch.object(album_logic, "CATALOG_PATH", self.path),
+            mock.patch.object(album_logic, "_catalog", album_logic.load_catalog(self.path)),
+            mock.patch.object(album_logic, "_next_check", 0)
+        ]
+        with album_logic._reload_lock:
+            for patch in self.patches:
+                patch.start()
+            album_logic.get_album_for_month.cache_clear()
+    
+    def tearDown(self):
+        with album_logic._reload_lock:
+            for patch in self.patches:
+                patch.stop()
+            album_logic.get_album_for_month.cache_clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def write(self, data, mtime):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(data if isinstance(data, str) else json.dumps(data))
+        os.utime(self.path, (mtime, mtime))
+    
+    def test_shared_catalog_file(self):
+        """Test that the catalog file has all 12 months with an image each"""
+        catalog = album_logic.load_catalog(album_logic.CATALOG_PATH)
+        self.assertEqual(len(catalog.month_to_album), 12)
+        self.assertEqual(set(catalog.album_to_image), set(catalog.month_to_album.values()))
+    
+    def test_tables_cannot_be_changed(self):
+        """Test that the lookup tables are read-only"""
+        catalog = album_logic.get_catalog()
+        with self.assertRaises(TypeError):
+            catalog.month_to_album["January"] = "Red"
+        with self.assertRaises(TypeError):
+            catalog.month_index["jan"] = "Red"
+    
+    def test_changed_file_is_reloaded(self):
+        """Test that a new album in the file is used after the check (also for remembered inputs)"""
+        self.assertEqual(album_logic.get_album_for_month("Dec"), "The Life of a Showgirl")
+        
+        self.data["months"][11]["album"] = "New Album"
+        self.data["months"][11]["image"] = "new.jpg"
+        self.write(self.data, mtime=2000)
+        album_logic.get_catalog()
+        
+        self.assertEqual(album_logic.get_album_for_month("Dec"), "New Album")
+        self.assertEqual(album_logic.get_image_filename_for_album("New Album"), "new.jpg")
+        self.assertEqual(album_logic.MONTH_TO_ALBUM["December"], "New Album")
+    
+    def test_watcher_thread_reloads_the_file(self):
+        """Test that the file is reloaded without anyone calling get_catalog"""
+        self.assertEqual(album_logic.get_album_for_month("Jan"), "Taylor Swift")
+        self.data["months"][0]["album"] = "New Album"
+        self.write(self.data, mtime=2000)
+        
+        deadline = time.monotonic() + 5
+        while album_logic.get_album_for_month("Jan") != "New Album" and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(album_logic.get_album_for_month("Jan"), "New Album")
+    
+    def test_check_does_not_wait_for_reload(self):
+        """Test that a check during a reload keeps the catalog from before"""
+        self.data["months"][0]["album"] = "New Album"
+        self.write(self.data, mtime=2000)
+        
+        # Another thread is reloading right now
+        with album_logic._reload_lock:
+            album_logic.get_catalog()
+            self.assertEqual(album_logic.get_album_for_month("January"), "Taylor Swift")
+        
+        album_logic.get_catalog()
+        self.assertEqual(album_logic.get_album_for_month("January"), "New Album")
+    
+    def test_lookups_do_not_check_the_file(self):
+        """Test that lookups never look at the file (the watcher thread does)"""
+        with album_logic._reload_lock:  # Keeps the watcher thread out too
+            with mock.patch.object(album_logic.os.path, "getmtime") as getmtime:
+                for _ in range(100):
+                    album_logic.get_album_for_month("May")
+        getmtime.assert_not_called()
+    
+    def test_bad_file_keeps_old_catalog(self):
+        """Test that a broken file (e.g. half saved) doesn't stop lookups"""
+        self.write('{"months": [', mtime=2000)
+        
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            album_logic.get_catalog()
+            self.assertEqual(album_logic.get_album_for_month("August"), "Folklore")
+        self.assertTrue(caught)
+    
+    def test_months_must_be_in_order(self):
+        """Test that a catalog with months missing or out of order is rejected"""
+        self.data["months"].reverse()
+        self.write(self.data, mtime=2000)
+        with self.assertRaises(ValueError):
+            album_logic.load_catalog(self.path)
+    
+    def test_missing_field(self):
+        """Test that an entry without an image is rejected"""
+        del self.data["months"][0]["image"]
+        self.write(self.data, mtime=2000)
+        with self.assertRaises(ValueError):
+            album_logic.load_catalog(self.path)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestAlbumArrays(unittest.TestCase):
+    """Test the numpy array versions of the month lookup"""
+    
+    def test_months_to_codes(self):
+        """Test that each month number gives the index of its album in ALBUMS"""
+        codes = album_logic.albums_for_months(np.arange(1, 13))
+        self.assertEqual(codes.dtype, np.int8)
+        
+        for month, code in zip(album_logic.MONTH_TO_ALBUM, codes):
+            self.assertEqual(album_logic.ALBUMS[code], album_logic.MONTH_TO_ALBUM[month])
+    
+    def test_invalid_months(self):
+        """Test that numbers outside 1-12 give -1 (and None when decoded)"""
+        codes = album_logic.albums_for_months([0, 13, -4, 100, 8])
+        self.assertEqual(codes.tolist(), [-1, -1, -1, -1, 7])
+        
+        names = album_logic.albums_for_months([0, 8], decode=True)
+        self.assertEqual(names.tolist(), [None, "Folklore"])
+    
+    def test_float_months(self):
+        """Test float months (e.g. a column with NaN): only whole numbers count"""
+        codes = album_logic.albums_for_months(np.array([1.0, 8.0, np.nan, 2.5, 13.0, np.inf]))
+        self.assertEqual(codes.tolist(), [0, 7, -1, -1, -1, -1])
+    
+    def test_months_that_are_not_numbers(self):
+        """Test that text months raise TypeError"""
+        with self.assertRaises(TypeError):
+            album_logic.albums_for_months(["August"])
+    
+    def test_dates(self):
+        """Test dates (any datetime64 unit, before 1970 and NaT)"""
+        days = np.array(["1989-12-13", "1969-08-05", "NaT", "2024-02-29"], dtype="datetime64[D]")
+        self.assertEqual(album_logic.albums_for_dates(days, decode=True).tolist(),
+                         ["The Life of a Showgirl", "Folklore", None, "Fearless"])
+        
+        seconds = np.array(["2000-03-31T23:59:59"], dtype="datetime64[s]")
+        self.assertEqual(album_logic.albums_for_dates(seconds, decode=True).tolist(), ["Speak Now"])
+    
+    def test_single_date(self):
+        """Test a single date (scalar or 0-d array) gives a single album"""
+        self.assertEqual(album_logic.albums_for_dates(np.datetime64("1990-08-01")), 7)
+        self.assertEqual(album_logic.albums_for_dates(np.array("1990-08-01", dtype="datetime64[D]"),
+                                                      decode=True), "Folklore")
+        self.assertEqual(album_logic.albums_for_dates(np.datetime64("NaT")), -1)
+    
+    def test_dates_keep_their_shape(self):
+        """Test a 2-d array of dates gives a 2-d array of codes"""
+        days = np.array([["2000-01-01", "NaT"], ["0001-01-01", "9999-05-05"]], dtype="datetime64[D]")
+        self.assertEqual(album_logic.albums_for_dates(days).tolist(), [[0, -1], [0, 4]])
+    
+    def test_dates_match_the_scalar_lookup(self):
+        """Test many random dates against get_album_for_month"""
+        rng = np.random.default_rng(13)
+        days = rng.integers(-30000, 30000, 2000).astype("datetime64[D]")
+        names = album_logic.albums_for_dates(days, decode=True)
+        
+        for day, name in zip(days.tolist(), names):
+            self.assertEqual(name, album_logic.get_album_for_month(str(day.month)))
+    
+    def test_dates_far_apart(self):
+        """Test dates too far apart for the day table"""
+        days = np.array(["0001-03-01", "9999-12-01", "NaT"], dtype="datetime64[D]")
+        self.assertEqual(album_logic.albums_for_dates(days).tolist(), [2, 11, -1])
+    
+    def test_only_missing_dates(self):
+        """Test an array with no dates at all"""
+        days = np.array(["NaT", "NaT"], dtype="datetime64[D]")
+        self.assertEqual(album_logic.albums_for_dates(days).tolist(), [-1, -1])
+
+
 class TestMonthToAlbumMapping(unittest.TestCase):
     """Test the complete month-to-album mapping"""
     
@@ -0,0 +1,170 @@
+"""
+Unit tests for cover_cache module
+Tests the resized album cover cache (in memory and on disk)
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from PIL import Image
+
+import cover_cache
+import image_utils
+from cover_cache import CoverCache, get_thumbnail_path
+
+
+class TestThumbnailFiles(unittest.TestCase):
+    """Test cases for the resized copies on disk"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.image_path = os.path.join(self.temp_dir, "red.jpg")
+        Image.new("RGB", (600, 600), "red").save(self.image_path)
+        self.cache_dir = os.path.join(self.temp_dir, "cover_thumbnails")
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_thumbnail_is_resized(self):
+        """Test that the copy has the requested size"""
+        path = get_thumbnail_path(self.image_path, (200, 200), self.cache_dir)
+        self.assertEqual(Image.open(path).size, (200, 200))
+    
+    def test_thumbnail_is_made_once(self):
+        """Test that the second call reuses the saved copy"""
+        get_thumbnail_path(self.image_path, (200, 200), self.cache_dir)
+        
+        with mock.patch.object(image_utils.Image, "open") as image_open:
+            get_thumbnail_path(self.image_path, (200, 200), self.cache_dir)
+        
+        image_open.assert_not_called()
+    
+    def test_new_original_makes_new_thumbnail(self):
+        """Test that a replaced cover (newer mtime) is resized again"""
+        path = get_thumbnail_path(self.image_path, (200, 200), self.cache_dir)
+        
+        Image.new("RGB", (600, 600), "blue").save(self.image_path)
+        later = time.time() + 10
+        os.utime(self.image_path, (later, later))
+        
+        path = get_thumbnail_path(self.image_path, (200, 200), self.cache_dir)
+        red, green, blue = Image.open(path).convert("RGB").getpixel((0, 0))
+        self.assertGreater(blue, 200)
+        self.assertLess(red, 50)
+    
+    def test_one_copy_per_size(self):
+        """Test that different sizes get different files"""
+        small = get_thumbnail_path(self.image_path, (100, 100), self.cache_dir)
+        large = get_thumbnail_path(self.image_path, (200, 200), self.cache_dir)
+        self.assertNotEqual(small, large)
+
+
+class TestCoverCache(unittest.TestCase):
+    """Test cases for CoverCache"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.covers_dir = os.path.join(self.temp_dir, "album_covers")
+        os.makedirs(self.covers_dir)
+        Image.new("RGB", (600, 600), "red").save(os.path.join(self.covers_dir, "red.jpg"))
+        
+        # Fake PhotoImage maker (a real one needs a display)
+        self.make_photo = mock.Mock(side_effect=lambda path: ("photo", path))
+        self.cache = CoverCache(self.covers_dir, make_photo=self.make_photo)
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_repeat_click_uses_memory(self):
+        """Test that a cover shown before is not loaded again"""
+        first = self.cache.get_photo("red.jpg", (200, 200))
+        
+        with mock.patch.object(image_utils.Image, "open") as image_open:
+            second = self.cache.get_photo("red.jpg", (200, 200))
+        
+        self.assertIs(first, second)
+        self.assertEqual(self.make_photo.call_count, 1)
+        image_open.assert_not_called()
+    
+    def test_default_cache_dir(self):
+        """Test that the copies go next to album_covers"""
+        self.cache.get_photo("red.jpg", (200, 200))
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "cover_thumbnails", "red_200x200.png")))
+    
+    def test_missing_cover(self):
+        """Test that a missing cover gives None"""
+        self.assertIsNone(self.cache.get_photo("nothing.jpg", (200, 200)))
+
+
+class TestPreload(unittest.TestCase):
+    """Test cases for resizing the covers in the background"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.covers_dir = os.path.join(self.temp_dir, "album_covers")
+        os.makedirs(self.covers_dir)
+        for name, color in [("red.jpg", "red"), ("midnights.jpg", "navy")]:
+            Image.new("RGB", (600, 600), color).save(os.path.join(self.covers_dir, name))
+        
+        self.make_photo = mock.Mock(side_effect=lambda path: ("photo", path))
+        self.cache = CoverCache(self.covers_dir, make_photo=self.make_photo, max_workers=1)
+    
+    def tearDown(self):
+        self.cache.shutdown()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_click_after_preload_does_not_decode(self):
+        """Test that a preloaded cover only needs its PhotoImage made"""
+        self.cache.preload(["red.jpg"], (200, 200))
+        self.cache.preloading["red.jpg", (200, 200)].result(timeout=5)
+        
+        with mock.patch.object(image_utils.Image, "open") as image_open:
+            photo = self.cache.get_photo("red.jpg", (200, 200))
+        
+        image_open.assert_not_called()
+        self.assertTrue(photo[1].endswith("red_200x200.png"))
+        self.assertEqual(self.cache.preloading, {})
+    
+    def test_click_before_ready_loads_on_demand(self):
+        """Test that a cover still waiting in the queue is loaded right away"""
+        release = threading.Event()
+        real_get_thumbnail_path = cover_cache.get_thumbnail_path
+        
+        def slow_get_thumbnail_path(image_path, size, cache_dir):
+            if image_path.endswith("midnights.jpg"):
+                release.wait(5)
+            return real_get_thumbnail_path(image_path, size, cache_dir)
+        
+        with mock.patch.object(cover_cache, "get_thumbnail_path", side_effect=slow_get_thumbnail_path):
+            # One worker: red.jpg waits until midnights.jpg is done
+            self.cache.preload(["midnights.jpg", "red.jpg"], (200, 200))
+            red_future = self.cache.preloading["red.jpg", (200, 200)]
+            
+            photo = self.cache.get_photo("red.jpg", (200, 200))
+            release.set()
+        
+        self.assertTrue(red_future.cancelled())
+        self.assertTrue(photo[1].endswith("red_200x200.png"))
+    
+    def test_preload_skips_covers_already_shown(self):
+        """Test that covers in memory are not resized again"""
+        self.cache.get_photo("red.jpg", (200, 200))
+        self.cache.preload(["red.jpg"], (200, 200))
+        self.assertEqual(self.cache.preloading, {})
+    
+    def test_missing_cover(self):
+        """Test that a missing cover still gives None after preload"""
+        self.cache.preload(["nothing.jpg"], (200, 200))
+        with self.assertRaises(FileNotFoundError):
+            self.cache.preloading["nothing.jpg", (200, 200)].result(timeout=5)
+        
+        self.assertIsNone(self.cache.get_photo("nothing.jpg", (200, 200)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Unit tests for image_utils module
+Tests opening images already shrunk to the size they are shown at
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from io import BytesIO
+
+from PIL import Image
+
+from image_utils import open_resized
+
+
+def gradient(size, mode="RGB"):
+    """Make an image with a smooth gradient (so resizing can be compared)"""
+    img = Image.linear_gradient("L").resize(size)
+    return img.convert(mode)
+
+
+class TestOpenResized(unittest.TestCase):
+    """Test cases for open_resized"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def save(self, img, filename):
+        path = os.path.join(self.temp_dir, filename)
+        img.save(path)
+        return path
+    
+    def test_jpeg_is_resized(self):
+        """Test that a big JPEG comes out at the target size"""
+        path = self.save(gradient((1600, 1600)), "cover.jpg")
+        self.assertEqual(open_resized(path, (200, 200)).size, (200, 200))
+    
+    def test_not_square(self):
+        """Test a headshot-like 260x190 JPEG resized to 60x60"""
+        buffer = BytesIO()
+        gradient((260, 190)).save(buffer, format="JPEG")
+        buffer.seek(0)
+        self.assertEqual(open_resized(buffer, (60, 60)).size, (60, 60))
+    
+    def test_png_and_palette_images(self):
+        """Test that non-JPEG images work too"""
+        png = self.save(gradient((1000, 800), "RGBA"), "logo.png")
+        palette = self.save(gradient((1000, 800)).convert("P"), "palette.png")
+        
+        self.assertEqual(open_resized(png, (80, 80)).size, (80, 80))
+        self.assertEqual(open_resized(palette, (80, 80)).size, (80, 80))
+    
+    def test_image_made_bigger(self):
+        """Test that an image smaller than the target is resized like before"""
+        path = self.save(gradient((736, 414)), "background.jpg")
+        
+        fast = open_resized(path, (800, 750))
+        full = Image.open(path).resize((800, 750), Image.Resampling.LANCZOS)
+        self.assertEqual(fast.tobytes(), full.tobytes())
+    
+    def test_close_to_full_decode(self):
+        """Test that the result looks like the old full decode + LANCZOS"""
+        path = self.save(gradient((1600, 1200)), "cover.jpg")
+        
+        fast = open_resized(path, (200, 200)).convert("L")
+        full = Image.open(path).resize((200, 200), Image.Resampling.LANCZOS).convert("L")
+        
+        differences = [abs(a - b) for a, b in zip(fast.tobytes(), full.tobytes())]
+        self.assertLess(max(differences), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,330 @@
+"""
+WNBA Team Roster Fetcher - Async Version
+Same roster fetching as roster_fetcher.py, but with asyncio + aiohttp so it
+can run inside an asyncio application without blocking the event loop
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from urllib.parse import urlparse
+
+from roster_fetcher import WNBARosterFetcher
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is only needed for this module
+    aiohttp = None
+
+
+class AsyncWNBARosterFetcher:
+    """Handles fetching and saving WNBA team roster data with asyncio"""
+    
+    TEAMS = WNBARosterFetcher.TEAMS
+    
+    # Server answers that are worth trying again
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
+    def __init__(self, data_dir='team_rosters', max_connections=16, max_per_host=6, retries=2, **kwargs):
+        """
+        Initialize the async roster fetcher
+        
+        Args:
+            data_dir (str): Directory to save roster data files
+            max_connections (int): Max number of open requests overall
+            max_per_host (int): Max number of open requests to the same host
+            retries (int): How many times a failed request is tried again
+            **kwargs: Passed on to WNBARosterFetcher (use_cache, cache_ttl,
+                      parser, strain)
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncWNBARosterFetcher needs aiohttp (pip install aiohttp)")
+        
+        # The sync fetcher does the parsing, caching and file handling
+        self._fetcher = WNBARosterFetcher(data_dir=data_dir, max_connections=max_connections,
+                                          max_per_host=max_per_host, **kwargs)
+        self.data_dir = data_dir
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.retries = retries
+        
+        self._session = None
+        self._connection_slots = asyncio.Semaphore(max_connections)
+        self._host_slots = {}
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def close(self):
+        """Close the HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._fetcher._session is not None:
+            self._fetcher.session.close()
+    
+    def get_all_teams(self):
+        """
+        Get list of all team names
+        
+        Returns:
+            list: Sorted list of team names
+        """
+        return self._fetcher.get_all_teams()
+    
+    async def fetch_team_roster(self, team_name, incremental=False, max_bio_age=None):
+        """
+        Fetch roster data for a specific team from wnba.com
+        
+        Returns the same roster dictionary as WNBARosterFetcher.fetch_team_roster.
+        All player pages are fetched concurrently on the event loop.
+        
+        Args:
+            team_name (str): Name of the team
+            incremental (bool): Reuse the bios from the last saved roster
+            max_bio_age (int): Max age of a reused bio in seconds
+            
+        Returns:
+            dict: Roster data including team info and players
+        """
+        fetcher = self._fetcher
+        if team_name not in self.TEAMS:
+            raise ValueError(f"Team '{team_name}' not found")
+        
+        # Handle expansion teams (no data available yet for 2026 teams)
+        if team_name in fetcher.EXPANSION_TEAMS:
+            return fetcher._roster_data(
+                team_name, 'expansion_2026', [],
+                message=f'{team_name} is an expansion team joining in 2026. Roster data not yet available.'
+            )
+        
+        roster_url = f'https://{self.TEAMS[team_name]}.wnba.com/roster/'
+        
+        try:
+            # Fetch and parse the roster page (or reuse the cached cards)
+            players = await self._get_parsed(roster_url, 'roster', fetcher._parse_roster_response, timeout=10)
+            
+            # Add height, college and experience from the player pages
+            previous = await self.load_roster(team_name) if incremental else None
+            bio_fetched_at, to_fetch = fetcher._reuse_player_details(players, previous, max_bio_age)
+            
+            all_details = await asyncio.gather(*[self._fetch_player_details(p) for p in to_fetch])
+            for player, details in zip(to_fetch, all_details):
+                if details is not None:
+                    player.update(details)
+                    bio_fetched_at[player['id']] = datetime.now().isoformat()
+            
+            return fetcher._roster_data(team_name, 'active', players,
+                                        source_url=roster_url, bio_fetched_at=bio_fetched_at)
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return fetcher._roster_data(team_name, 'error', [], error=str(e) or type(e).__name__)
+    
+    async def fetch_all_rosters(self, team_names=None, on_team_done=None, incremental=False):
+        """
+        Fetch and save the rosters of many teams concurrently
+        
+        Works like WNBARosterFetcher.fetch_all_rosters. If the calling task is
+        cancelled, every team that is still running is cancelled too.
+        
+        Args:
+            team_names (list): Teams to fetch (default: all teams)
+            on_team_done (callable): Optional callback called with
+                (team_name, result) as each team finishes
+            incremental (bool): Only fetch new or outdated player bios
+            
+        Returns:
+            dict: Result for each team name with 'status', 'players',
+                  'elapsed' (seconds), 'filepath' and 'error'
+        """
+        if team_names is None:
+            team_names = self.get_all_teams()
+        
+        for team_name in team_names:
+            if team_name not in self.TEAMS:
+                raise ValueError(f"Team '{team_name}' not found")
+        
+        async def fetch_and_save(team_name):
+            start = time.perf_counter()
+            filepath = None
+            
+            try:
+                roster_data = await self.fetch_team_roster(team_name, incremental=incremental)
+                if roster_data['status'] != 'error':
+                    filepath = await self.save_roster(roster_data)
+                status = roster_data['status']
+                player_count = len(roster_data['players'])
+                error = roster_data.get('error')
+            except Exception as e:
+                status = 'error'
+                player_count = 0
+                error = str(e)
+            
+            result = {
+                'status': status,
+                'players': player_count,
+                'elapsed': round(time.perf_counter() - start, 3),
+                'filepath': filepath,
+                'error': error
+            }
+            if on_team_done:
+                on_team_done(team_name, result)
+            return result
+        
+        results = await asyncio.gather(*[fetch_and_save(team_name) for team_name in team_names])
+        return dict(zip(team_names, results))
+    
+    # Nightly refresh of the whole league
+    refresh_league = fetch_all_rosters
+    
+    async def save_roster(self, roster_data):
+        """
+        Save roster data to a JSON file (in a worker thread)
+        
+        Args:
+            roster_data (dict): Roster data to save
+            
+        Returns:
+            str: Path to saved file
+        """
+        return await asyncio.to_thread(self._fetcher.save_roster, roster_data)
+    
+    async def load_roster(self, team_name, as_of=None):
+        """
+        Load saved roster data from file (in a worker thread)
+        
+        Args:
+            team_name (str): Name of the team
+            as_of (datetime): Load the roster as it was at this time
+                              (needs storage='snapshots')
+                              
+        Returns:
+            dict: Roster data or None if file doesn't exist
+        """
+        return await asyncio.to_thread(self._fetcher.load_roster, team_name, as_of)
+    
+    async def get_all_saved_rosters(self):
+        """
+        Get list of all teams with saved roster data
+        
+        Returns:
+            list: List of team names with saved data
+        """
+        return await asyncio.to_thread(self._fetcher.get_all_saved_rosters)
+    
+    async def _fetch_player_details(self, player):
+        """
+        Fetch height, college and experience from a player's own page
+        
+        Args:
+            player (dict): Player dictionary from the roster page
+            
+        Returns:
+            dict: Dictionary with 'height', 'college' and 'experience',
+                  or None if the page could not be fetched
+        """
+        player_id = player['id']
+        
+        try:
+            player_url = f"https://www.wnba.com/player/{player_id}"
+            return await self._get_parsed(player_url, 'player', self._fetcher._parse_player_response, timeout=5)
+        except Exception as e:
+            # If we can't fetch player details, just continue with what we have
+            print(f"Could not fetch details for {player['name']} ({player_id}): {e}")
+            return None
+    
+    async def _get_parsed(self, url, resource, parse, timeout=10):
+        """
+        Get a parsed page, using the HTTP cache when possible
+        (see WNBARosterFetcher._get_parsed)
+        
+        Args:
+            url (str): URL to download
+            resource (str): Kind of page for the TTL ('roster' or 'player')
+            parse (callable): Function that turns the response into data
+            timeout (int): Timeout in seconds
+            
+        Returns:
+            The parsed data
+        """
+        # The cache files are read and written in a worker thread (like
+        # save_roster), and so is the parsing, to keep the loop free
+        entry, headers = await asyncio.to_thread(self._fetcher._cache_lookup, url, resource)
+        if headers is None:
+            return entry['data']
+        
+        response = await self._get(url, timeout=timeout, headers=headers)
+        return await asyncio.to_thread(self._fetcher._use_response, url, entry, response, parse)
+    
+    async def _get(self, url, timeout=10, headers=None):
+        """
+        Send a GET request while respecting the connection limits, and try
+        again (with a short backoff) on temporary errors
+        
+        Args:
+            url (str): URL to download
+            timeout (int): Timeout in seconds
+            headers (dict): Extra headers for this request only
+            
+        Returns:
+            SimpleNamespace: Response with status_code, headers, text and content
+        """
+        host = urlparse(url).netloc
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        
+        for attempt in range(self.retries + 1):
+            try:
+                # Host slot first: a busy host must not hold global slots
+                # that requests to other hosts could use
+                async with self._host_slots[host], self._connection_slots:
+                    return await self._request(url, timeout, headers)
+            except aiohttp.ClientResponseError as e:
+                if e.status not in self.RETRY_STATUSES or attempt == self.retries:
+                    raise
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == self.retries:
+                    raise
+            
+            await asyncio.sleep(0.5 * 2 ** attempt)
+    
+    async def _request(self, url, timeout, headers=None):
+        """
+        Send one GET request
+        
+        Args:
+            url (str): URL to download
+            timeout (int): Timeout in seconds
+            headers (dict): Extra headers for this request only
+            
+        Returns:
+            SimpleNamespace: Response with status_code, headers, text and content
+        """
+        session = self._get_session()
+        
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            response.raise_for_status()
+            content = await response.read()
+            return SimpleNamespace(
+                status_code=response.status,
+                headers=response.headers,
+                content=content,
+                text=content.decode(response.get_encoding(), errors='replace')
+            )
+    
+    def _get_session(self):
+        """
+        Get the shared aiohttp session (created on first use, inside the loop)
+        
+        Returns:
+            aiohttp.ClientSession: The session
+        """
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.max_per_host)
+            self._session = aiohttp.ClientSession(connector=connector, headers=WNBARosterFetcher.HEADERS)
+        
+        return self._session
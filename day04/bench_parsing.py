@@ -0,0 +1,110 @@
+"""
+WNBA Team Roster Fetcher - Parsing Benchmark
+Times how long it takes to parse the HTML fixtures with each parser.
+The fixtures are synthetic: player cards and a bio list in the markup the
+parser reads, padded with generated filler (CSS rules and menus) to about
+140 KB. The results compare the options, they are not live-site timings.
+"""
+
+import os
+import tempfile
+import timeit
+from types import SimpleNamespace
+
+from roster_fetcher import WNBARosterFetcher
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def get_available_parsers():
+    """
+    Get the BeautifulSoup parsers that are installed
+    
+    Returns:
+        list: Parser names ('html.parser' is always there)
+    """
+    parsers = ['html.parser']
+    try:
+        import lxml  # noqa: F401
+        parsers.append('lxml')
+    except ImportError:
+        pass
+    return parsers
+
+
+def load_fixture(filename):
+    """
+    Load a saved page as a fake response (with .text and .content)
+    
+    Args:
+        filename (str): File name inside the fixtures directory
+        
+    Returns:
+        SimpleNamespace: Object with the page as text and bytes
+    """
+    with open(os.path.join(FIXTURES_DIR, filename), 'rb') as f:
+        content = f.read()
+    return SimpleNamespace(text=content.decode('utf-8'), content=content)
+
+
+def time_parse(parse, response, repeat=5, number=10):
+    """
+    Time a parse function
+    
+    Args:
+        parse (callable): Function taking the response
+        response: Fake response to parse
+        repeat (int): Number of timing rounds (the best one is kept)
+        number (int): Number of parses per round
+        
+    Returns:
+        float: Milliseconds per page
+    """
+    best = min(timeit.repeat(lambda: parse(response), repeat=repeat, number=number))
+    return best / number * 1000
+
+
+def run_benchmark(repeat=5, number=10):
+    """
+    Parse the roster page and player page fixtures with every parser,
+    with and without strained (partial) parsing
+    
+    Args:
+        repeat (int): Number of timing rounds
+        number (int): Number of parses per round
+        
+    Returns:
+        list: One dict per parser/mode with 'parser', 'strain',
+              'roster_ms' and 'player_ms'
+    """
+    roster_response = load_fixture('roster_page.html')
+    player_response = load_fixture('player_page.html')
+    results = []
+    
+    with tempfile.TemporaryDirectory() as data_dir:
+        for parser in get_available_parsers():
+            for strain in (False, True):
+                fetcher = WNBARosterFetcher(data_dir=data_dir, use_cache=False, parser=parser, strain=strain)
+                results.append({
+                    'parser': parser,
+                    'strain': strain,
+                    'roster_ms': time_parse(fetcher._parse_roster_response, roster_response, repeat, number),
+                    'player_ms': time_parse(fetcher._parse_player_response, player_response, repeat, number)
+                })
+                fetcher.session.close()
+    
+    return results
+
+
+def main():
+    """Print the parse time per page for each parser"""
+    results = run_benchmark()
+    
+    print(f"{'Parser':<12} {'Mode':<10} {'Roster page':>12} {'Player page':>12}")
+    for result in results:
+        mode = 'strained' if result['strain'] else 'full'
+        print(f"{result['parser']:<12} {mode:<10} {result['roster_ms']:>9.2f} ms {result['player_ms']:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+WNBA Team Roster Fetcher - Serialization Benchmark
+Compares save/load time and size on disk of the roster file formats for a
+full league
+"""
+
+import os
+import random
+import tempfile
+import timeit
+
+from roster_fetcher import WNBARosterFetcher
+from roster_store import JSONRosterStore, msgpack, orjson
+
+
+def make_league(players_per_team=15, seed=13):
+    """
+    Build roster data for every active team (made up players, real shape)
+    
+    Args:
+        players_per_team (int): Number of players on each team
+        seed (int): Random seed, so every run uses the same data
+        
+    Returns:
+        list: One roster dict per team
+    """
+    rng = random.Random(seed)
+    positions = ['Guard', 'Forward', 'Center', 'Guard-Forward', 'Forward-Center']
+    rosters = []
+    
+    for team_name, team_slug in WNBARosterFetcher.TEAMS.items():
+        if team_name in WNBARosterFetcher.EXPANSION_TEAMS:
+            continue
+        
+        players = []
+        for i in range(players_per_team):
+            player_id = str(1628000 + rng.randrange(20000))
+            players.append({
+                'id': player_id,
+                'number': str(rng.randrange(0, 55)),
+                'name': f"Player {team_slug.title()} {i}",
+                'position': rng.choice(positions),
+                'height': f"{rng.randrange(5, 7)}-{rng.randrange(0, 12)}",
+                'ppg': f"{rng.uniform(0, 25):.1f}",
+                'rpg': f"{rng.uniform(0, 12):.1f}",
+                'apg': f"{rng.uniform(0, 9):.1f}",
+                'college': rng.choice(['Iowa', 'South Carolina', 'UConn', 'Stanford', 'LSU', 'France']),
+                'experience': str(rng.randrange(0, 16)),
+                'image_url': f'https://cdn.wnba.com/headshots/wnba/latest/260x190/{player_id}.png'
+            })
+        
+        rosters.append({
+            'team_name': team_name,
+            'team_slug': team_slug,
+            'status': 'active',
+            'players': players,
+            'fetched_at': '2025-06-01T12:00:00.000000',
+            'source_url': f'https://{team_slug}.wnba.com/roster/'
+        })
+    
+    return rosters
+
+
+def get_available_formats():
+    """
+    Get the file formats that can be used here
+    
+    Returns:
+        list: Format names
+    """
+    formats = ['json', 'compact']
+    if msgpack is not None:
+        formats.append('msgpack')
+    return formats
+
+
+def run_benchmark(repeat=5, number=20):
+    """
+    Save and load a full league with every file format
+    
+    Args:
+        repeat (int): Number of timing rounds (the best one is kept)
+        number (int): Number of league saves/loads per round
+        
+    Returns:
+        list: One dict per format with 'format', 'save_ms', 'load_ms' and 'bytes'
+    """
+    rosters = make_league()
+    slugs = [roster['team_slug'] for roster in rosters]
+    results = []
+    
+    for file_format in get_available_formats():
+        with tempfile.TemporaryDirectory() as data_dir:
+            store = JSONRosterStore(data_dir, file_format)
+            
+            def save_league():
+                return [store.save(roster) for roster in rosters]
+            
+            def load_league():
+                return [store.load(slug) for slug in slugs]
+            
+            save_time = min(timeit.repeat(save_league, repeat=repeat, number=number)) / number
+            load_time = min(timeit.repeat(load_league, repeat=repeat, number=number)) / number
+            size = sum(os.path.getsize(path) for path in save_league())
+        
+        results.append({
+            'format': file_format,
+            'save_ms': save_time * 1000,
+            'load_ms': load_time * 1000,
+            'bytes': size
+        })
+    
+    return results
+
+
+def main():
+    """Print save/load time and size on disk of a full league for each format"""
+    print(f"Full league: {len(make_league())} teams (orjson installed: {orjson is not None})")
+    print(f"{'Format':<10} {'Save':>10} {'Load':>10} {'On disk':>12}")
+    for result in run_benchmark():
+        print(f"{result['format']:<10} {result['save_ms']:>7.2f} ms {result['load_ms']:>7.2f} ms "
+              f"{result['bytes']:>8,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+WNBA Team Roster Viewer - Startup Benchmark
+Times how long the GUI takes to start (import time and time until the window
+is first drawn) and checks which heavy modules get imported on the way
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Modules that are slow to import and should only load when they are needed
+HEAVY_MODULES = ['bs4', 'lxml', 'requests', 'urllib3', 'PIL']
+
+# Each script runs in a fresh Python process and prints its result as JSON.
+# os._exit skips waiting for background downloads (like the logo) to finish.
+IMPORT_SCRIPT = """
+import json, os, sys, time
+start = time.perf_counter()
+import roster_gui
+elapsed = time.perf_counter() - start
+print(json.dumps({'ms': elapsed * 1000, 'modules': [m for m in HEAVY if m in sys.modules]}))
+sys.stdout.flush()
+os._exit(0)
+"""
+
+LOAD_SAVED_SCRIPT = """
+import json, os, sys
+from roster_fetcher import WNBARosterFetcher
+fetcher = WNBARosterFetcher(data_dir='team_rosters')
+fetcher.save_roster({'team_name': 'Indiana Fever', 'team_slug': 'fever', 'status': 'active',
+                     'players': [], 'fetched_at': '2025-06-01T12:00:00'})
+fetcher.load_roster('Indiana Fever')
+fetcher.get_all_saved_rosters()
+print(json.dumps({'modules': [m for m in HEAVY if m in sys.modules]}))
+sys.stdout.flush()
+os._exit(0)
+"""
+
+FIRST_PAINT_SCRIPT = """
+import json, os, sys, time
+start = time.perf_counter()
+import tkinter as tk
+try:
+    root = tk.Tk()
+except tk.TclError:
+    print(json.dumps({'ms': None}))
+    sys.stdout.flush()
+    os._exit(0)
+import roster_gui
+app = roster_gui.RosterViewerGUI(root)
+root.update()
+elapsed = time.perf_counter() - start
+print(json.dumps({'ms': elapsed * 1000, 'modules': [m for m in HEAVY if m in sys.modules]}))
+sys.stdout.flush()
+os._exit(0)
+"""
+
+
+def run_script(script):
+    """
+    Run a benchmark script in a new Python process (in an empty data folder)
+    
+    Args:
+        script (str): Python code that prints one JSON line
+        
+    Returns:
+        dict: The printed result
+    """
+    code = f"HEAVY = {HEAVY_MODULES!r}\n{script}"
+    env = dict(os.environ, PYTHONPATH=HERE + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        output = subprocess.run([sys.executable, '-c', code], cwd=work_dir, env=env,
+                                capture_output=True, text=True, check=True).stdout
+    
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_benchmark(repeat=5):
+    """
+    Measure the GUI startup (best of several fresh processes)
+    
+    Args:
+        repeat (int): Number of processes per measurement
+        
+    Returns:
+        dict: 'import_ms', 'first_paint_ms' (None without a display) and the
+              heavy modules imported by 'import_modules', 'load_saved_modules'
+              and 'first_paint_modules'
+    """
+    imports = [run_script(IMPORT_SCRIPT) for _ in range(repeat)]
+    paints = [run_script(FIRST_PAINT_SCRIPT) for _ in range(repeat)]
+    load_saved = run_script(LOAD_SAVED_SCRIPT)
+    
+    paint_times = [paint['ms'] for paint in paints if paint['ms'] is not None]
+    
+    return {
+        'import_ms': min(result['ms'] for result in imports),
+        'first_paint_ms': min(paint_times) if paint_times else None,
+        'import_modules': imports[0]['modules'],
+        'load_saved_modules': load_saved['modules'],
+        'first_paint_modules': paints[0].get('modules')
+    }
+
+
+def main():
+    """Print the startup times and the heavy modules imported"""
+    result = run_benchmark()
+    
+    print(f"{'import roster_gui':<28} {result['import_ms']:>8.1f} ms")
+    if result['first_paint_ms'] is None:
+        print(f"{'time to first paint':<28} {'(no display)':>11}")
+    else:
+        print(f"{'time to first paint':<28} {result['first_paint_ms']:>8.1f} ms")
+    
+    print()
+    for label, key in [('after import', 'import_modules'),
+                       ('after loading a saved roster', 'load_saved_modules'),
+                       ('after first paint', 'first_paint_modules')]:
+        modules = result[key]
+        if modules is None:
+            continue
+        print(f"Heavy modules {label}: {', '.join(modules) if modules else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
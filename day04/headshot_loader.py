@@ -0,0 +1,218 @@
+"""
+WNBA Team Roster Viewer - Headshot Loader
+Downloads, decodes and resizes player photos in a thread pool, so the
+Tk main loop only has to turn the finished images into PhotoImages
+"""
+
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+
+# image_utils is shared with the Taylor Swift app (one copy, in day03)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "day03"))
+
+
+class HeadshotLoader:
+    """Loads player headshots in background threads"""
+    
+    def __init__(self, session=None, size=(60, 60), max_workers=16, thumbnail_cache=None,
+                 session_factory=None):
+        """
+        Initialize the loader
+        
+        Args:
+            session: requests.Session to download with (shared with the fetcher)
+            size (tuple): Size the images are resized to (width, height)
+            max_workers (int): Number of images downloaded at the same time
+            thumbnail_cache (ThumbnailCache): Optional disk cache of resized
+                                              images (checked before downloading)
+            session_factory (callable): Instead of session: returns the session
+                                        on first download (in a worker thread)
+        """
+        self._session = session
+        self._session_factory = session_factory
+        self.size = size
+        self.thumbnail_cache = thumbnail_cache
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        
+        # Finished downloads wait here until the main thread picks them up
+        self._done = queue.Queue()
+        self._pending = set()
+    
+    @property
+    def session(self):
+        """The session used for downloads"""
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+    
+    def load(self, url, on_loaded, player_id=None):
+        """
+        Start loading an image in the background
+        
+        on_loaded is not called from the worker thread: it is called by
+        process_done() (on the thread that calls it, i.e. the Tk main loop).
+        
+        Args:
+            url (str): URL of the headshot
+            on_loaded (callable): Called with the resized PIL image,
+                                  or None if the image could not be loaded
+            player_id (str): Player ID for the thumbnail cache
+        """
+        self._submit(on_loaded, self._download, url, player_id)
+    
+    def load_any(self, urls, on_loaded, size=None, cache_path=None):
+        """
+        Start loading the first URL that works (e.g. a logo with mirrors),
+        trying them one after another in the background
+        
+        This runs on its own daemon thread instead of the pool: Python waits
+        for the pool's threads when it exits, so a hanging mirror (up to
+        3 URLs x 3 tries x 5 s) would keep the program running after the
+        window is closed.
+        
+        Args:
+            urls (list): URLs to try in order
+            on_loaded (callable): Called (by process_done) with the resized
+                                  PIL image, or None if no URL worked
+            size (tuple): Size to resize to (default: the loader's size)
+            cache_path (str): Optional PNG file to save the resized image to
+        """
+        future = Future()
+        self._track(future, on_loaded)
+        
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return  # Cancelled before it started
+            try:
+                future.set_result(self._download_any(urls, size, cache_path))
+            except Exception as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=run, name="headshot-load-any", daemon=True).start()
+    
+    def _submit(self, on_loaded, function, *args):
+        """
+        Run a download function in the pool and queue its result
+        
+        Args:
+            on_loaded (callable): Called by process_done with the result
+            function (callable): Function to run in a worker thread
+            *args: Arguments for the function
+        """
+        self._track(self._executor.submit(function, *args), on_loaded)
+    
+    def _track(self, future, on_loaded):
+        """
+        Queue the result of a download for process_done when it finishes
+        
+        Args:
+            future (Future): The running download
+            on_loaded (callable): Called by process_done with the result
+        """
+        self._pending.add(future)
+        future.add_done_callback(lambda f: self._done.put((f, on_loaded)))
+    
+    def process_done(self):
+        """
+        Call on_loaded for every image that finished since the last call
+        (run this on the Tk main thread, e.g. with root.after)
+        
+        Returns:
+            int: Number of images still loading
+        """
+        while True:
+            try:
+                future, on_loaded = self._done.get_nowait()
+            except queue.Empty:
+                break
+            
+            self._pending.discard(future)
+            if future.cancelled():
+                continue
+            
+            # Failed downloads give None so the caller can show a placeholder
+            on_loaded(None if future.exception() else future.result())
+        
+        return len(self._pending)
+    
+    def cancel_pending(self):
+        """Don't start the downloads that are still waiting (e.g. a new roster is shown)"""
+        for future in list(self._pending):
+            future.cancel()
+    
+    def shutdown(self):
+        """Stop the worker threads"""
+        self.cancel_pending()
+        self._executor.shutdown(wait=False)
+    
+    def _download_any(self, urls, size=None, cache_path=None):
+        """
+        Download the first URL that works (runs in a worker thread)
+        
+        Args:
+            urls (list): URLs to try in order
+            size (tuple): Size to resize to (default: the loader's size)
+            cache_path (str): Optional PNG file to save the resized image to
+            
+        Returns:
+            PIL.Image.Image: The resized image
+        """
+        for url in urls:
+            try:
+                image = self._download(url, size=size)
+            except Exception:
+                continue  # Try next URL
+            
+            if cache_path:
+                tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+                try:
+                    image.save(tmp_path, format='PNG')
+                    os.replace(tmp_path, cache_path)
+                except OSError:
+                    pass  # Not saved, so it is downloaded again next time
+            
+            return image
+        
+        raise OSError("None of the image URLs could be loaded")
+    
+    def _download(self, url, player_id=None, size=None):
+        """
+        Download, decode and resize one image (runs in a worker thread)
+        
+        Args:
+            url (str): URL of the headshot
+            player_id (str): Player ID for the thumbnail cache
+            size (tuple): Size to resize to (default: the loader's size)
+            
+        Returns:
+            PIL.Image.Image: The resized image
+        """
+        # PIL is imported here (in a worker thread) to keep the GUI start fast
+        from image_utils import open_resized
+        
+        size = size or self.size
+        use_cache = self.thumbnail_cache is not None and player_id
+        
+        # Already resized on an earlier run: no download needed
+        if use_cache:
+            image = self.thumbnail_cache.get(player_id, url, size)
+            if image is not None:
+                return image
+        
+        response = self.session.get(url, timeout=5)
+        response.raise_for_status()
+        
+        # Decoded at close to the row size (JPEG draft mode, see image_utils)
+        image = open_resized(BytesIO(response.content), size)
+        
+        if use_cache:
+            try:
+                self.thumbnail_cache.put(player_id, url, size, image)
+            except OSError:
+                pass  # A full disk shouldn't stop the photo from showing
+        
+        return image
@@ -0,0 +1,118 @@
+"""
+WNBA Team Roster Fetcher - HTTP Cache
+Keeps downloaded pages on disk so they are not downloaded and parsed again
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class HTTPCache:
+    """On-disk cache of parsed pages together with their ETag / Last-Modified"""
+    
+    def __init__(self, cache_dir):
+        """
+        Initialize the cache
+        
+        Args:
+            cache_dir (str): Directory to keep the cache files in
+        """
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        
+        # Create cache directory if it doesn't exist
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+    
+    def _path(self, url):
+        """
+        Get the cache file path for a URL
+        
+        Args:
+            url (str): URL of the page
+            
+        Returns:
+            str: Path of the cache file
+        """
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, url):
+        """
+        Get the cache entry for a URL
+        
+        Args:
+            url (str): URL of the page
+            
+        Returns:
+            dict: Entry with 'url', 'etag', 'last_modified', 'checked_at' and
+                  'data' (the parsed page), or None if not cached
+        """
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if entry.get('url') != url:
+            return None
+        
+        return entry
+    
+    def put(self, url, etag, last_modified, data):
+        """
+        Save the parsed page and its validators
+        
+        Args:
+            url (str): URL of the page
+            etag (str): ETag response header (or None)
+            last_modified (str): Last-Modified response header (or None)
+            data: Parsed page (must be JSON serializable)
+        """
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'checked_at': time.time(),
+            'data': data
+        }
+        self._write(url, entry)
+    
+    def touch(self, url):
+        """
+        Mark a cached page as checked now (after a 304 Not Modified)
+        
+        Args:
+            url (str): URL of the page
+        """
+        entry = self.get(url)
+        if entry is not None:
+            entry['checked_at'] = time.time()
+            self._write(url, entry)
+    
+    def clear(self):
+        """Remove every cached page"""
+        with self._lock:
+            for filename in os.listdir(self.cache_dir):
+                if filename.endswith('.json'):
+                    os.remove(os.path.join(self.cache_dir, filename))
+    
+    def _write(self, url, entry):
+        """
+        Write an entry to disk (write to a temp file, then rename it, so
+        another thread never reads a half written file)
+        
+        Args:
+            url (str): URL of the page
+            entry (dict): Cache entry
+        """
+        path = self._path(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        
+        with self._lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
@@ -0,0 +1,192 @@
+"""
+WNBA Team Roster Viewer - League Table
+All saved rosters in one in-memory table (one list per column) with the sort
+orders worked out once, so sorting and filtering while the user types never
+reads the roster files again
+"""
+
+import re
+
+# Columns that can be sorted on, best first
+SORT_KEYS = ('ppg', 'rpg', 'apg', 'height', 'name')
+
+# Text columns kept for every player
+TEXT_COLUMNS = ('team', 'id', 'number', 'name', 'position', 'height', 'ppg', 'rpg', 'apg',
+                'experience', 'college', 'image_url')
+
+
+def stat_value(value):
+    """
+    Turn a stat like '19.2' (or 19.2) into a number
+    
+    Args:
+        value: Stat from the roster data
+        
+    Returns:
+        float: The number, or None if it is missing ('--', '')
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def height_inches(height):
+    """
+    Turn a height like '6-0' into inches
+    
+    Args:
+        height (str): Height from the player's page
+        
+    Returns:
+        int: Height in inches, or None if it can't be read
+    """
+    match = re.match(r'\s*(\d+)\D+(\d+)', str(height or ''))
+    if not match:
+        return None
+    return int(match.group(1)) * 12 + int(match.group(2))
+
+
+class LeagueTable:
+    """Every player of every saved roster, with fast sort and filter"""
+    
+    def __init__(self, rosters):
+        """
+        Build the table
+        
+        Args:
+            rosters (list): Roster data dictionaries (as saved by the fetcher)
+        """
+        self.columns = {name: [] for name in TEXT_COLUMNS}
+        numbers = {'ppg': [], 'rpg': [], 'apg': [], 'height': []}
+        self._search = []
+        self._positions = []
+        
+        for roster in rosters:
+            for player in roster.get('players', []):
+                self.columns['team'].append(roster['team_name'])
+                for name in TEXT_COLUMNS[1:]:
+                    self.columns[name].append(player.get(name, '--'))
+                
+                for name in ('ppg', 'rpg', 'apg'):
+                    numbers[name].append(stat_value(player.get(name)))
+                numbers['height'].append(height_inches(player.get('height')))
+                
+                # Lower case text for the search box ('\n' so a search can't
+                # match across two fields)
+                self._search.append('\n'.join(str(player.get(name) or '') for name in
+                                              ('name', 'position', 'college')).lower())
+                self._positions.append(str(player.get('position') or '').lower())
+        
+        self.size = len(self._search)
+        
+        # Row numbers in sort order for each sort key (both directions);
+        # players without a value always go last
+        self._orders = {}
+        for key in SORT_KEYS:
+            if key == 'name':
+                values = [str(name).lower() for name in self.columns['name']]
+            else:
+                values = numbers[key]
+            
+            present = [i for i in range(self.size) if values[i] is not None]
+            missing = [i for i in range(self.size) if values[i] is None]
+            ascending = sorted(present, key=lambda i: values[i])
+            self._orders[key, False] = ascending + missing
+            self._orders[key, True] = ascending[::-1] + missing
+        
+        # The last filter, so typing one more letter only checks the rows
+        # that matched before
+        self._last_filter = None
+    
+    @classmethod
+    def from_fetcher(cls, fetcher):
+        """
+        Load every saved roster (done once when the league view opens)
+        
+        Args:
+            fetcher (WNBARosterFetcher): Fetcher to load the rosters with
+            
+        Returns:
+            LeagueTable: The table
+        """
+        rosters = [fetcher.load_roster(team_name) for team_name in fetcher.get_all_saved_rosters()]
+        return cls([roster for roster in rosters if roster is not None])
+    
+    def query(self, text='', position='', sort_by='ppg', descending=True):
+        """
+        Get the rows that match a filter, in sort order
+        
+        Args:
+            text (str): Part of a name, position or college (case does not matter)
+            position (str): Part of the position, e.g. 'Guard' ('' for all)
+            sort_by (str): One of SORT_KEYS
+            descending (bool): Biggest first (for names: Z to A)
+            
+        Returns:
+            list: Row numbers
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Can't sort by '{sort_by}' (use one of {', '.join(SORT_KEYS)})")
+        
+        order = self._orders[sort_by, descending]
+        matches = self._filter(text.strip().lower(), position.strip().lower())
+        
+        if matches is None:
+            return list(order)
+        return [i for i in order if i in matches]
+    
+    def _filter(self, text, position):
+        """
+        Find the rows that match a filter
+        
+        Args:
+            text (str): Lower case search text
+            position (str): Lower case position
+            
+        Returns:
+            set: Matching row numbers, or None if there is no filter
+        """
+        if not text and not position:
+            self._last_filter = None
+            return None
+        
+        # A longer search text can only match fewer rows
+        if self._last_filter is not None:
+            last_text, last_position, last_matches = self._last_filter
+            if last_position == position and text.startswith(last_text):
+                candidates = last_matches
+            else:
+                candidates = range(self.size)
+        else:
+            candidates = range(self.size)
+        
+        matches = {i for i in candidates
+                   if text in self._search[i] and position in self._positions[i]}
+        
+        self._last_filter = (text, position, matches)
+        return matches
+    
+    def row(self, index):
+        """
+        Get one row as a player dictionary (with a 'team' key)
+        
+        Args:
+            index (int): Row number
+            
+        Returns:
+            dict: The player
+        """
+        return {name: values[index] for name, values in self.columns.items()}
+    
+    def rows(self, indexes):
+        """
+        Get many rows as player dictionaries
+        
+        Args:
+            indexes (list): Row numbers
+            
+        Returns:
+            list: The players
+        """
+        return [self.row(i) for i in indexes]
@@ -3,11 +3,48 @@ WNBA Team Roster Fetcher - Business Logic
 Fetches team roster data from wnba.com and saves locally
 """
 
-import requests
-from bs4 import BeautifulSoup
-import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlparse
+from http_cache import HTTPCache
+from roster_store import SnapshotRosterStore, create_store
+
+# requests and bs4 are slow to import, so they are only imported when the
+# first page is downloaded / parsed. Loading saved rosters never needs them.
+
+
+@lru_cache(maxsize=None)
+def get_strainers():
+    """
+    Get the parts of the pages we actually read (used when strain=True):
+    the player cards on a roster page and the bio list on a player page
+    
+    Returns:
+        tuple: (roster page SoupStrainer, player page SoupStrainer)
+    """
+    from bs4 import SoupStrainer
+    
+    roster_strainer = SoupStrainer('a', href=lambda x: x and '/player/' in x)
+    player_strainer = SoupStrainer('dl', class_=lambda x: x and 'PlayerProfileInfoSecondary' in str(x))
+    return roster_strainer, player_strainer
+
+
+def get_default_parser():
+    """
+    Pick the fastest installed HTML parser for BeautifulSoup
+    
+    Returns:
+        str: 'lxml' if lxml is installed, otherwise Python's built-in 'html.parser'
+    """
+    try:
+        import lxml  # noqa: F401
+        return 'lxml'
+    except ImportError:
+        return 'html.parser'
 
 
 class WNBARosterFetcher:
@@ -32,19 +69,131 @@ class WNBARosterFetcher:
         'Toronto Tempo': 'toronto'     # 2026 expansion
     }
     
-    def __init__(self, data_dir='team_rosters'):
+    # Teams without roster data yet
+    EXPANSION_TEAMS = ['Portland Fire', 'Toronto Tempo']
+    
+    # Headers sent with every request
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    
+    # How long (in seconds) a cached page is used without asking the server again.
+    # Roster pages have the stats so they go stale fast, player bios rarely change.
+    CACHE_TTL = {
+        'roster': 15 * 60,          # 15 minutes
+        'player': 7 * 24 * 60 * 60  # 1 week
+    }
+    
+    def __init__(self, data_dir='team_rosters', max_workers=8, max_connections=16, max_per_host=6,
+                 use_cache=True, cache_ttl=None, parser=None, strain=True, storage='json',
+                 file_format='json'):
         """
         Initialize the roster fetcher
         
         Args:
             data_dir (str): Directory to save roster data files
+            max_workers (int): Max number of player pages fetched at the same time
+            max_connections (int): Max number of open requests overall
+            max_per_host (int): Max number of open requests to the same host
+            use_cache (bool): Keep downloaded pages in data_dir/http_cache
+            cache_ttl (dict): Override CACHE_TTL for 'roster' and/or 'player'
+            parser (str): BeautifulSoup parser ('lxml' or 'html.parser'),
+                          default: lxml if installed
+            strain (bool): Only parse the parts of the pages we read
+            storage (str): 'json' (one file per team), 'sqlite' (all teams
+                           in data_dir/rosters.db with indexed lookups) or
+                           'snapshots' (every fetch kept in data_dir/snapshots)
+            file_format (str): Roster file format for the 'json' storage:
+                               'json', 'compact' or 'msgpack'
         """
         self.data_dir = data_dir
         self.base_url = 'https://www.wnba.com'
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self.cache_ttl = dict(self.CACHE_TTL, **(cache_ttl or {}))
+        self._parser = parser
+        self.strain = strain
+        
+        # Connection limits shared by every thread using this fetcher
+        self._connection_slots = threading.BoundedSemaphore(max_connections)
+        self._host_slots = {}
+        self._host_slots_lock = threading.Lock()
+        
+        # Shared HTTP session, so connections are kept alive and reused
+        # (created on first use, see the session property)
+        self.max_connections = max_connections
+        # Keep-alive connections kept per host; anything else sharing the
+        # session (like the GUI's photo downloads) should use at most this
+        # many threads, or urllib3 throws the extra connections away
+        self.pool_maxsize = max(max_per_host, max_workers, 1)
+        self._session = None
+        self._session_lock = threading.Lock()
         
         # Create data directory if it doesn't exist
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
+        
+        # On-disk HTTP cache (ETag / Last-Modified + the parsed page)
+        self.cache = HTTPCache(os.path.join(self.data_dir, 'http_cache')) if use_cache else None
+        
+        # Where the rosters are saved
+        self.store = create_store(storage, self.data_dir, file_format)
+    
+    @property
+    def parser(self):
+        """BeautifulSoup parser name (picked on first use, so lxml isn't imported before it's needed)"""
+        if self._parser is None:
+            self._parser = get_default_parser()
+        return self._parser
+    
+    @parser.setter
+    def parser(self, value):
+        self._parser = value
+    
+    @property
+    def session(self):
+        """Shared requests.Session (created on first use, so requests isn't imported before it's needed)"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session(self.max_connections)
+        return self._session
+    
+    def _create_session(self, max_connections):
+        """
+        Create a pooled HTTP session with default headers and retries
+        
+        Args:
+            max_connections (int): Max number of open requests overall
+            
+        Returns:
+            requests.Session: The configured session
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        session.headers.update(self.HEADERS)
+        
+        # Retry temporary failures with a short backoff (0.5s, 1s, ...)
+        retry = Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET', 'HEAD')
+        )
+        
+        # One pool per host: every team subdomain + www, cdn and the logo hosts
+        adapter = HTTPAdapter(
+            pool_connections=len(self.TEAMS) + 5,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        
+        return session
     
     def get_all_teams(self):
         """
@@ -55,13 +204,26 @@ class WNBARosterFetcher:
         """
         return sorted(self.TEAMS.keys())
     
-    def fetch_team_roster(self, team_name):
+    def fetch_team_roster(self, team_name, incremental=False, max_bio_age=None, progress=None,
+                          cancel_event=None):
         """
         Fetch roster data for a specific team from wnba.com
         
+        In incremental mode the last saved roster is loaded and only the bio
+        pages of new players (or players whose bio is older than max_bio_age)
+        are fetched. Everyone else keeps their saved height, college and
+        experience.
+        
         Args:
             team_name (str): Name of the team
-            
+            incremental (bool): Reuse the bios from the last saved roster
+            max_bio_age (int): Max age of a reused bio in seconds
+                               (default: the 'player' cache TTL)
+            progress (callable): Optional callback called with (done, total)
+                                 as each player is finished (from a worker thread)
+            cancel_event (threading.Event): When set, the fetch stops early and
+                                            a 'cancelled' roster is returned
+                                            
         Returns:
             dict: Roster data including team info and players
         """
@@ -71,64 +233,439 @@ class WNBARosterFetcher:
         team_slug = self.TEAMS[team_name]
         
         # Handle expansion teams (no data available yet for 2026 teams)
-        if team_name in ['Portland Fire', 'Toronto Tempo']:
-            return {
-                'team_name': team_name,
-                'team_slug': team_slug,
-                'status': 'expansion_2026',
-                'players': [],
-                'fetched_at': datetime.now().isoformat(),
-                'message': f'{team_name} is an expansion team joining in 2026. Roster data not yet available.'
-            }
+        if team_name in self.EXPANSION_TEAMS:
+            return self._roster_data(
+                team_name, 'expansion_2026', [],
+                message=f'{team_name} is an expansion team joining in 2026. Roster data not yet available.'
+            )
+        
+        import requests
         
         # Construct roster URL (teams use subdomain format: [team].wnba.com)
         roster_url = f'https://{team_slug}.wnba.com/roster/'
         
         try:
-            # Fetch the roster page
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(roster_url, headers=headers, timeout=10)
-            response.raise_for_status()
+            # Fetch and parse the roster page (or reuse the cached cards)
+            players = self._get_parsed(roster_url, 'roster', self._parse_roster_response, timeout=10)
             
-            # Parse the HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Add height, college and experience from the player pages
+            previous = self.load_roster(team_name) if incremental else None
+            bio_fetched_at = self._add_player_details(players, previous, max_bio_age, progress, cancel_event)
             
-            # Extract player data (this will need to be adjusted based on actual HTML structure)
-            players = self._parse_roster_page(soup)
-            
-            roster_data = {
-                'team_name': team_name,
-                'team_slug': team_slug,
-                'status': 'active',
-                'players': players,
-                'fetched_at': datetime.now().isoformat(),
-                'source_url': roster_url
-            }
+            if cancel_event is not None and cancel_event.is_set():
+                return self._roster_data(team_name, 'cancelled', [], message='Fetch cancelled')
             
-            return roster_data
+            return self._roster_data(team_name, 'active', players,
+                                     source_url=roster_url, bio_fetched_at=bio_fetched_at)
             
         except requests.RequestException as e:
-            return {
-                'team_name': team_name,
-                'team_slug': team_slug,
-                'status': 'error',
-                'players': [],
-                'fetched_at': datetime.now().isoformat(),
-                'error': str(e)
-            }
+            return self._roster_data(team_name, 'error', [], error=str(e))
+    
+    def _roster_data(self, team_name, status, players, **extra):
+        """
+        Build the roster dictionary that is returned and saved
+        
+        Args:
+            team_name (str): Name of the team
+            status (str): 'active', 'error' or 'expansion_2026'
+            players (list): List of player dictionaries
+            **extra: Other keys to add (source_url, error, message, ...)
+            
+        Returns:
+            dict: Roster data including team info and players
+        """
+        roster_data = {
+            'team_name': team_name,
+            'team_slug': self.TEAMS[team_name],
+            'status': status,
+            'players': players,
+            'fetched_at': datetime.now().isoformat()
+        }
+        roster_data.update(extra)
+        
+        return roster_data
+    
+    def fetch_all_rosters(self, team_names=None, on_team_done=None, incremental=False):
+        """
+        Fetch the rosters of many teams in parallel and save each one
+        
+        Every team is fetched in its own worker. The number of open requests
+        is limited by max_connections overall and by max_per_host for each
+        host (every team has its own [team].wnba.com subdomain, while all the
+        player pages are on www.wnba.com). Each roster is saved with
+        save_roster as soon as that team is done. A team that fails is not
+        saved, so its last good roster file is kept.
+        
+        Args:
+            team_names (list): Teams to fetch (default: all teams)
+            on_team_done (callable): Optional callback called with
+                (team_name, result) as each team finishes
+            incremental (bool): Only fetch new or outdated player bios
+                (see fetch_team_roster)
+                
+        Returns:
+            dict: Result for each team name with 'status', 'players',
+                  'elapsed' (seconds), 'filepath' and 'error'
+        """
+        if team_names is None:
+            team_names = self.get_all_teams()
+        
+        for team_name in team_names:
+            if team_name not in self.TEAMS:
+                raise ValueError(f"Team '{team_name}' not found")
+        
+        results = {}
+        if not team_names:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=len(team_names)) as executor:
+            futures = {executor.submit(self._fetch_and_save, team_name, incremental): team_name
+                       for team_name in team_names}
+            
+            for future in as_completed(futures):
+                team_name = futures[future]
+                results[team_name] = future.result()
+                
+                if on_team_done:
+                    on_team_done(team_name, results[team_name])
+        
+        # Return the results in the same order as the requested teams
+        return {team_name: results[team_name] for team_name in team_names}
+    
+    # Nightly refresh of the whole league
+    refresh_league = fetch_all_rosters
+    
+    def _fetch_and_save(self, team_name, incremental=False):
+        """
+        Fetch one team's roster, save it and time it (used by fetch_all_rosters)
+        
+        Args:
+            team_name (str): Name of the team
+            incremental (bool): Only fetch new or outdated player bios
+            
+        Returns:
+            dict: Result with 'status', 'players', 'elapsed', 'filepath' and 'error'
+        """
+        start = time.perf_counter()
+        filepath = None
+        
+        try:
+            roster_data = self.fetch_team_roster(team_name, incremental=incremental)
+            if roster_data['status'] != 'error':
+                filepath = self.save_roster(roster_data)
+            status = roster_data['status']
+            player_count = len(roster_data['players'])
+            error = roster_data.get('error')
+        except Exception as e:
+            status = 'error'
+            player_count = 0
+            error = str(e)
+        
+        return {
+            'status': status,
+            'players': player_count,
+            'elapsed': round(time.perf_counter() - start, 3),
+            'filepath': filepath,
+            'error': error
+        }
+    
+    def _get(self, url, timeout=10, headers=None):
+        """
+        Send a GET request through the shared session while respecting the
+        connection limits
+        
+        Args:
+            url (str): URL to download
+            timeout (int): Timeout in seconds
+            headers (dict): Extra headers for this request only
+            
+        Returns:
+            requests.Response: The response (raises for HTTP errors)
+        """
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            host_slot = self._host_slots[host]
+        
+        # Host slot first: a thread waiting for a busy host must not hold
+        # one of the global slots that requests to other hosts could use
+        with host_slot, self._connection_slots:
+            if headers:
+                response = self.session.get(url, timeout=timeout, headers=headers)
+            else:
+                response = self.session.get(url, timeout=timeout)
+        
+        response.raise_for_status()
+        return response
+    
+    def _get_parsed(self, url, resource, parse, timeout=10):
+        """
+        Get a parsed page, using the HTTP cache when possible
+        
+        A cached page younger than its TTL is used without any request. An
+        older one is revalidated with If-None-Match / If-Modified-Since, and
+        if the server answers 304 Not Modified the cached result is used, so
+        the page is neither downloaded nor parsed again.
+        
+        Args:
+            url (str): URL to download
+            resource (str): Kind of page for the TTL ('roster' or 'player')
+            parse (callable): Function that turns the response into data
+            timeout (int): Timeout in seconds
+            
+        Returns:
+            The parsed data
+        """
+        if self.cache is None:
+            return parse(self._get(url, timeout=timeout))
+        
+        entry, headers = self._cache_lookup(url, resource)
+        if headers is None:
+            return entry['data']
+        
+        response = self._get(url, timeout=timeout, headers=headers)
+        return self._use_response(url, entry, response, parse)
+    
+    def _cache_lookup(self, url, resource):
+        """
+        Look a page up in the HTTP cache before asking the server
+        (also used by AsyncWNBARosterFetcher, in a worker thread)
+        
+        Args:
+            url (str): URL of the page
+            resource (str): Kind of page for the TTL ('roster' or 'player')
+            
+        Returns:
+            tuple: (cache entry or None, headers for the request). The
+                   headers are None when the entry is still fresh, so no
+                   request is needed
+        """
+        entry = self.cache.get(url) if self.cache is not None else None
+        headers = {}
+        
+        if entry is not None:
+            # Still fresh: no need to ask the server
+            if time.time() - entry['checked_at'] < self.cache_ttl[resource]:
+                return entry, None
+            
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        
+        return entry, headers
+    
+    def _use_response(self, url, entry, response, parse):
+        """
+        Turn the server's answer into data and update the HTTP cache
+        (also used by AsyncWNBARosterFetcher, in a worker thread)
+        
+        Args:
+            url (str): URL of the page
+            entry (dict): Cache entry from _cache_lookup, or None
+            response: Response of the request
+            parse (callable): Function that turns the response into data
+            
+        Returns:
+            The parsed data (the cached data for a 304 Not Modified)
+        """
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(url)
+            return entry['data']
+        
+        data = parse(response)
+        if self.cache is not None:
+            self.cache.put(url, response.headers.get('ETag'), response.headers.get('Last-Modified'), data)
+        
+        return data
+    
+    def _parse_roster_response(self, response):
+        """
+        Parse the player cards out of a roster page response
+        
+        Args:
+            response: Response of the roster page
+            
+        Returns:
+            list: List of player dictionaries with empty bio fields
+        """
+        soup = self._make_soup(response.text, get_strainers()[0])
+        return self._parse_roster_cards(soup)
+    
+    def _make_soup(self, markup, strainer=None):
+        """
+        Build a BeautifulSoup tree with the configured parser
+        
+        Args:
+            markup (str or bytes): HTML of the page
+            strainer (SoupStrainer): Parts of the page to keep (if strain is on)
+            
+        Returns:
+            BeautifulSoup: The parsed page
+        """
+        from bs4 import BeautifulSoup
+        
+        if self.strain and strainer is not None:
+            return BeautifulSoup(markup, self.parser, parse_only=strainer)
+        return BeautifulSoup(markup, self.parser)
     
     def _parse_roster_page(self, soup):
         """
         Parse roster information from BeautifulSoup object
         
+        Works in two phases: first the player cards on the roster page are
+        collected, then every player's bio page is fetched through a bounded
+        worker pool (see max_workers). Players keep their roster order.
+        
         Args:
             soup: BeautifulSoup object of roster page
             
         Returns:
             list: List of player dictionaries
         """
+        # Phase 1: collect basic info from the roster cards
+        players = self._parse_roster_cards(soup)
+        
+        # Phase 2: fetch detailed info from individual player pages
+        self._add_player_details(players)
+        
+        return players
+    
+    def _add_player_details(self, players, previous=None, max_bio_age=None, progress=None, cancel_event=None):
+        """
+        Fetch the players' bio pages through a bounded worker pool and add
+        height, college and experience to the players (in place)
+        
+        Args:
+            players (list): Player dictionaries from the roster page
+            previous (dict): Last saved roster data, to reuse fresh bios from
+            max_bio_age (int): Max age of a reused bio in seconds
+            progress (callable): Optional callback called with (done, total)
+            cancel_event (threading.Event): Stop fetching when set
+            
+        Returns:
+            dict: When each player's bio was fetched (player id -> ISO time)
+        """
+        bio_fetched_at, to_fetch = self._reuse_player_details(players, previous, max_bio_age)
+        
+        # Players with a reused bio are already done
+        done = len(players) - len(to_fetch)
+        if progress:
+            progress(done, len(players))
+        
+        if not to_fetch or (cancel_event is not None and cancel_event.is_set()):
+            return bio_fetched_at
+        
+        def fetch_unless_cancelled(player):
+            # The fetch may be cancelled while this player waits for a worker
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            return self._fetch_player_details(player)
+        
+        # Fetch the bio pages in parallel (each player dict is updated in
+        # place, so the roster order stays the same whatever finishes first)
+        workers = max(1, min(self.max_workers, len(to_fetch)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(fetch_unless_cancelled, player): player for player in to_fetch}
+            
+            for future in as_completed(futures):
+                details = future.result()
+                if details is not None:
+                    player = futures[future]
+                    player.update(details)
+                    bio_fetched_at[player['id']] = datetime.now().isoformat()
+                
+                done += 1
+                if progress:
+                    progress(done, len(players))
+                
+                # Don't start the player pages that are still waiting
+                if cancel_event is not None and cancel_event.is_set():
+                    for waiting in futures:
+                        waiting.cancel()
+                    break
+        
+        return bio_fetched_at
+    
+    def _reuse_player_details(self, players, previous, max_bio_age=None):
+        """
+        Copy the saved bio of every player whose bio is recent enough
+        
+        Args:
+            players (list): Player dictionaries from the roster page
+            previous (dict): Last saved roster data (or None)
+            max_bio_age (int): Max age of a reused bio in seconds
+            
+        Returns:
+            tuple: (bio_fetched_at dict of the reused players,
+                    list of players whose bio still has to be fetched)
+        """
+        reused = self._reusable_bios(previous, max_bio_age)
+        bio_fetched_at = {}
+        to_fetch = []
+        
+        for player in players:
+            if player['id'] in reused:
+                old_player, fetched_at = reused[player['id']]
+                for key in ('height', 'college', 'experience'):
+                    player[key] = old_player.get(key, '')
+                bio_fetched_at[player['id']] = fetched_at
+            else:
+                to_fetch.append(player)
+        
+        return bio_fetched_at, to_fetch
+    
+    def _reusable_bios(self, previous, max_bio_age=None):
+        """
+        Find the players in a saved roster whose bio is recent enough to reuse
+        
+        Args:
+            previous (dict): Last saved roster data (or None)
+            max_bio_age (int): Max age of a reused bio in seconds
+                               (default: the 'player' cache TTL)
+                               
+        Returns:
+            dict: Player id -> (saved player dict, ISO time the bio was fetched)
+        """
+        if not previous or previous.get('status') != 'active':
+            return {}
+        
+        if max_bio_age is None:
+            max_bio_age = self.cache_ttl['player']
+        
+        # Rosters saved before bio times were tracked: use the roster fetch time
+        # for players that have bio data
+        bio_fetched_at = previous.get('bio_fetched_at')
+        if bio_fetched_at is None:
+            bio_fetched_at = {p['id']: previous['fetched_at'] for p in previous.get('players', [])
+                              if p.get('height') or p.get('college') or p.get('experience')}
+        
+        reusable = {}
+        now = datetime.now()
+        for player in previous.get('players', []):
+            fetched_at = bio_fetched_at.get(player.get('id'))
+            if not fetched_at:
+                continue
+            try:
+                age = (now - datetime.fromisoformat(fetched_at)).total_seconds()
+            except ValueError:
+                continue
+            if age < max_bio_age:
+                reusable[player['id']] = (player, fetched_at)
+        
+        return reusable
+    
+    def _parse_roster_cards(self, soup):
+        """
+        Collect the player cards from the roster page (no extra requests)
+        
+        Args:
+            soup: BeautifulSoup object of roster page
+            
+        Returns:
+            list: List of player dictionaries with empty bio fields
+        """
         players = []
         
         # Find all links that go to player pages
@@ -184,56 +721,22 @@ class WNBARosterFetcher:
                         elif label == 'APG':
                             apg = value
                 
-                # Now fetch detailed info from individual player page
-                height = ''
-                college = ''
-                experience = ''
-                
-                try:
-                    player_url = f"https://www.wnba.com/player/{player_id}"
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                    }
-                    player_response = requests.get(player_url, headers=headers, timeout=5)
-                    player_response.raise_for_status()
-                    player_soup = BeautifulSoup(player_response.content, 'html.parser')
-                    
-                    # Find the bio dl element with player details
-                    bio_dl = player_soup.find('dl', class_=lambda x: x and 'PlayerProfileInfoSecondary' in str(x))
-                    if bio_dl:
-                        dts = bio_dl.find_all('dt')
-                        dds = bio_dl.find_all('dd')
-                        
-                        for dt, dd in zip(dts, dds):
-                            label = dt.get_text(strip=True)
-                            value = dd.get_text(strip=True)
-                            
-                            if label == 'Height':
-                                height = value
-                            elif label == 'College/Country':
-                                # Extract just the college part (before the /)
-                                college = value.split('/')[0].strip()
-                            elif label == 'EXP':
-                                experience = value.strip()
-                except Exception as e:
-                    # If we can't fetch player details, just continue with what we have
-                    print(f"Could not fetch details for {name} ({player_id}): {e}")
-                
                 if name:  # Only add if we found a name
                     # Construct image URL
                     image_url = f'https://cdn.wnba.com/headshots/wnba/latest/260x190/{player_id}.png' if player_id else ''
                     
+                    # Height, college and experience are filled in from the player page later
                     players.append({
                         'id': player_id,
                         'number': number,
                         'name': name,
                         'position': position,
-                        'height': height,
+                        'height': '',
                         'ppg': ppg,
                         'rpg': rpg,
                         'apg': apg,
-                        'college': college,
-                        'experience': experience,
+                        'college': '',
+                        'experience': '',
                         'image_url': image_url
                     })
             except Exception as e:
@@ -242,6 +745,63 @@ class WNBARosterFetcher:
         
         return players
     
+    def _fetch_player_details(self, player):
+        """
+        Fetch height, college and experience from a player's own page
+        
+        Runs inside the worker pool, so it never raises: if the page can't be
+        fetched the player just keeps empty bio fields.
+        
+        Args:
+            player (dict): Player dictionary from the roster page
+            
+        Returns:
+            dict: Dictionary with 'height', 'college' and 'experience',
+                  or None if the page could not be fetched
+        """
+        player_id = player['id']
+        
+        try:
+            player_url = f"https://www.wnba.com/player/{player_id}"
+            return self._get_parsed(player_url, 'player', self._parse_player_response, timeout=5)
+        except Exception as e:
+            # If we can't fetch player details, just continue with what we have
+            print(f"Could not fetch details for {player['name']} ({player_id}): {e}")
+            return None
+    
+    def _parse_player_response(self, response):
+        """
+        Parse height, college and experience out of a player page response
+        
+        Args:
+            response: Response of the player page
+            
+        Returns:
+            dict: Dictionary with 'height', 'college' and 'experience'
+        """
+        details = {'height': '', 'college': '', 'experience': ''}
+        player_soup = self._make_soup(response.content, get_strainers()[1])
+        
+        # Find the bio dl element with player details
+        bio_dl = player_soup.find('dl', class_=lambda x: x and 'PlayerProfileInfoSecondary' in str(x))
+        if bio_dl:
+            dts = bio_dl.find_all('dt')
+            dds = bio_dl.find_all('dd')
+            
+            for dt, dd in zip(dts, dds):
+                label = dt.get_text(strip=True)
+                value = dd.get_text(strip=True)
+                
+                if label == 'Height':
+                    details['height'] = value
+                elif label == 'College/Country':
+                    # Extract just the college part (before the /)
+                    details['college'] = value.split('/')[0].strip()
+                elif label == 'EXP':
+                    details['experience'] = value.strip()
+        
+        return details
+    
     def _extract_player_info(self, element):
         """
         Extract player information from a player card element
@@ -270,7 +830,8 @@ class WNBARosterFetcher:
     
     def save_roster(self, roster_data):
         """
-        Save roster data to a JSON file
+        Save roster data (to a file in file_format, or to the database with
+        storage='sqlite')
         
         Args:
             roster_data (dict): Roster data to save
@@ -278,40 +839,29 @@ class WNBARosterFetcher:
         Returns:
             str: Path to saved file
         """
-        team_slug = roster_data['team_slug']
-        filename = f"{team_slug}_roster.json"
-        filepath = os.path.join(self.data_dir, filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(roster_data, f, indent=2, ensure_ascii=False)
-        
-        return filepath
+        return self.store.save(roster_data)
     
-    def load_roster(self, team_name):
+    def load_roster(self, team_name, as_of=None):
         """
-        Load saved roster data from file
+        Load saved roster data
         
         Args:
             team_name (str): Name of the team
-            
+            as_of (datetime): Load the roster as it was at this time
+                              (needs storage='snapshots')
+                              
         Returns:
-            dict: Roster data or None if file doesn't exist
+            dict: Roster data or None if it was never saved
         """
-        if team_name not in self.TEAMS:
-            return None
+        if as_of is not None and not isinstance(self.store, SnapshotRosterStore):
+            raise ValueError("Loading a roster as_of a time needs storage='snapshots'")
         
-        team_slug = self.TEAMS[team_name]
-        filename = f"{team_slug}_roster.json"
-        filepath = os.path.join(self.data_dir, filename)
-        
-        if not os.path.exists(filepath):
+        if team_name not in self.TEAMS:
             return None
         
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return None
+        if as_of is not None:
+            return self.store.load(self.TEAMS[team_name], as_of=as_of)
+        return self.store.load(self.TEAMS[team_name])
     
     def get_all_saved_rosters(self):
         """
@@ -320,11 +870,7 @@ class WNBARosterFetcher:
         Returns:
             list: List of team names with saved data
         """
-        saved_teams = []
-        for team_name, team_slug in self.TEAMS.items():
-            filename = f"{team_slug}_roster.json"
-            filepath = os.path.join(self.data_dir, filename)
-            if os.path.exists(filepath):
-                saved_teams.append(team_name)
+        saved_slugs = self.store.saved_slugs()
+        saved_teams = [team_name for team_name, team_slug in self.TEAMS.items() if team_slug in saved_slugs]
         
         return sorted(saved_teams)
@@ -6,15 +6,23 @@ Allows users to select teams and fetch/view roster data
 import tkinter as tk
 from tkinter import ttk, messagebox
 from roster_fetcher import WNBARosterFetcher
-import json
-from PIL import Image, ImageTk
-import requests
-from io import BytesIO
+from headshot_loader import HeadshotLoader
+from roster_table import LEAGUE_COLUMNS, RosterTable
+from league_table import LeagueTable
+from thumbnail_cache import ThumbnailCache
+import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 
 class RosterViewerGUI:
     """GUI for viewing and fetching WNBA team rosters"""
     
+    # Number of player photos kept in memory between roster switches
+    PHOTO_CACHE_SIZE = 200
+    
     def __init__(self, root):
         """
         Initialize the GUI
@@ -39,15 +47,36 @@ class RosterViewerGUI:
         # Logo cache
         self.wnba_logo = None
         
-        # Initialize the roster fetcher
+        # Initialize the roster fetcher (its HTTP session is also used for images)
         self.fetcher = WNBARosterFetcher()
         
-        # Cache for player images
-        self.image_cache = {}
+        # Cache for player images ((player id, image url) -> PhotoImage),
+        # least recently shown first. It is kept when switching teams.
+        self.image_cache = OrderedDict()
+        
+        # Headshots are downloaded and resized in background threads, and the
+        # resized images are kept on disk for the next time
+        self.thumbnail_cache = ThumbnailCache(os.path.join(self.fetcher.data_dir, 'thumbnails'))
+        # (the fetcher's session is only made when the first image is
+        # downloaded, so requests isn't imported while the window opens)
+        # One download thread per pooled connection of the shared session
+        self.headshot_loader = HeadshotLoader(session_factory=lambda: self.fetcher.session, size=(60, 60),
+                                              max_workers=self.fetcher.pool_maxsize,
+                                              thumbnail_cache=self.thumbnail_cache)
+        self.polling_headshots = False
+        
+        # Fetches run in a background thread, which sends its progress back
+        # through this queue (Tk widgets may only be touched on the main thread)
+        self.fetch_executor = ThreadPoolExecutor(max_workers=1)
+        self.fetch_queue = queue.Queue()
+        self.cancel_event = None
         
         # Setup the UI
         self.setup_ui()
         
+        # Stop a running fetch when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         # Load initial data
         self.update_saved_teams_label()
     
@@ -129,7 +158,7 @@ class RosterViewerGUI:
         button_frame = tk.Frame(selection_frame, bg=self.wnba_light_gray)
         button_frame.grid(row=2, column=0, columnspan=3, pady=15)
         
-        fetch_btn = tk.Button(
+        self.fetch_btn = tk.Button(
             button_frame,
             text="Fetch Roster from Web",
             command=self.fetch_roster,
@@ -141,7 +170,7 @@ class RosterViewerGUI:
             cursor="hand2",
             relief=tk.FLAT
         )
-        fetch_btn.pack(side=tk.LEFT, padx=5)
+        self.fetch_btn.pack(side=tk.LEFT, padx=5)
         
         load_btn = tk.Button(
             button_frame,
@@ -171,6 +200,32 @@ class RosterViewerGUI:
         )
         clear_btn.pack(side=tk.LEFT, padx=5)
         
+        league_btn = tk.Button(
+            button_frame,
+            text="League View",
+            command=self.open_league_view,
+            bg=self.wnba_black,
+            fg=self.wnba_white,
+            font=("Arial", 11),
+            padx=20,
+            pady=10,
+            cursor="hand2",
+            relief=tk.FLAT
+        )
+        league_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Table view (one Treeview) or card view (a row of widgets per player)
+        self.table_mode = tk.BooleanVar(value=True)
+        table_check = tk.Checkbutton(
+            button_frame,
+            text="Table view",
+            variable=self.table_mode,
+            command=self.toggle_view,
+            bg=self.wnba_light_gray,
+            font=("Arial", 10)
+        )
+        table_check.pack(side=tk.LEFT, padx=5)
+        
         # Saved rosters info
         self.saved_label = tk.Label(
             selection_frame,
@@ -193,12 +248,16 @@ class RosterViewerGUI:
         )
         display_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Create canvas with scrollbar for custom roster display
-        canvas_frame = tk.Frame(display_frame, bg=self.wnba_light_gray)
-        canvas_frame.pack(fill=tk.BOTH, expand=True)
+        # Table for the roster (the default view)
+        self.roster_table = RosterTable(display_frame, header_color=self.wnba_orange)
+        self.roster_table.frame.pack(fill=tk.BOTH, expand=True)
+        self.current_roster = None
+        
+        # Create canvas with scrollbar for custom roster display (card view)
+        self.canvas_frame = tk.Frame(display_frame, bg=self.wnba_light_gray)
         
-        self.canvas = tk.Canvas(canvas_frame, bg='white')
-        scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas = tk.Canvas(self.canvas_frame, bg='white')
+        scrollbar = ttk.Scrollbar(self.canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
         self.scrollable_frame = tk.Frame(self.canvas, bg='white')
         
         self.scrollable_frame.bind(
@@ -247,43 +306,71 @@ class RosterViewerGUI:
     
     def load_wnba_logo(self, label_widget):
         """
-        Load WNBA logo from CDN
+        Show the WNBA logo from the cache file, or show "WNBA" text and
+        download the logo in the background (so the window opens right away)
         
         Args:
             label_widget: Label widget to display the logo in
         """
+        # Text until the logo is there (and if it can't be loaded at all)
+        label_widget.config(text="WNBA", font=("Arial", 36, "bold"), 
+                          fg=self.wnba_orange)
+        
+        logo_path = os.path.join(self.fetcher.data_dir, 'wnba_logo.png')
+        
+        # Already downloaded and resized on an earlier launch
+        # (Tk reads PNG files by itself, so PIL isn't needed at startup)
         try:
-            # Try multiple WNBA logo sources
-            logo_urls = [
-                'https://content.sportslogos.net/logos/45/1068/full/wnba_logo_2019_sportslogosnet-8326.png',
-                'https://upload.wikimedia.org/wikipedia/en/thumb/4/4a/WNBA_logo.svg/200px-WNBA_logo.svg.png',
-                'https://cdn.nba.com/logos/leagues/logo-wnba.png'
-            ]
-            
-            for logo_url in logo_urls:
-                try:
-                    response = requests.get(logo_url, timeout=5)
-                    if response.status_code == 200:
-                        image = Image.open(BytesIO(response.content))
-                        # Resize logo to fit nicely in header
-                        image = image.resize((80, 80), Image.Resampling.LANCZOS)
-                        photo = ImageTk.PhotoImage(image)
-                        self.wnba_logo = photo
-                        label_widget.config(image=photo)
-                        return  # Success, exit the function
-                except:
-                    continue  # Try next URL
-            
-            # If all URLs fail, show text instead
-            label_widget.config(text="WNBA", font=("Arial", 36, "bold"), 
-                              fg=self.wnba_orange)
-        except:
-            # If everything fails, show text instead
-            label_widget.config(text="WNBA", font=("Arial", 36, "bold"), 
-                              fg=self.wnba_orange)
+            self.wnba_logo = tk.PhotoImage(file=logo_path)
+            label_widget.config(image=self.wnba_logo, text="")
+            return
+        except tk.TclError:
+            pass
+        
+        # Try multiple WNBA logo sources
+        logo_urls = [
+            'https://content.sportslogos.net/logos/45/1068/full/wnba_logo_2019_sportslogosnet-8326.png',
+            'https://upload.wikimedia.org/wikipedia/en/thumb/4/4a/WNBA_logo.svg/200px-WNBA_logo.svg.png',
+            'https://cdn.nba.com/logos/leagues/logo-wnba.png'
+        ]
+        
+        # Resize logo to fit nicely in header (done in the background too)
+        self.headshot_loader.load_any(
+            logo_urls,
+            lambda image: self.show_logo(image, label_widget),
+            size=(80, 80),
+            cache_path=logo_path
+        )
+        self.start_polling_headshots()
+    
+    def show_logo(self, image, label_widget):
+        """
+        Show the loaded logo in place of the "WNBA" text
+        
+        Args:
+            image: Resized PIL image, or None if no logo URL worked
+            label_widget: Label widget to display the logo in
+        """
+        if image is None or not label_widget.winfo_exists():
+            return
+        
+        from PIL import ImageTk
+        
+        photo = ImageTk.PhotoImage(image)
+        self.wnba_logo = photo
+        label_widget.config(image=photo, text="")
     
     def fetch_roster(self):
-        """Fetch roster data from the web"""
+        """
+        Fetch roster data from the web in a background thread
+        (or cancel the fetch if one is already running)
+        """
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+            self.fetch_btn.config(state=tk.DISABLED)
+            self.status_var.set("Cancelling...")
+            return
+        
         team_name = self.team_var.get()
         
         if not team_name:
@@ -291,29 +378,92 @@ class RosterViewerGUI:
             return
         
         self.status_var.set(f"Fetching roster for {team_name}...")
-        self.root.update()
+        self.fetch_btn.config(text="Cancel Fetch", bg=self.wnba_red)
+        
+        self.cancel_event = threading.Event()
+        self.fetch_executor.submit(self._fetch_in_background, team_name, self.cancel_event)
+        self.root.after(100, self._poll_fetch_queue)
+    
+    def _fetch_in_background(self, team_name, cancel_event):
+        """
+        Fetch and save a roster (runs in the background thread)
+        
+        Every update is put on the fetch queue for the main thread.
+        
+        Args:
+            team_name (str): Name of the team
+            cancel_event (threading.Event): Set when the user cancels
+        """
+        def progress(done, total):
+            self.fetch_queue.put(('progress', team_name, done, total))
         
         try:
             # Fetch the roster
-            roster_data = self.fetcher.fetch_team_roster(team_name)
-            
-            # Save the roster
-            filepath = self.fetcher.save_roster(roster_data)
-            
-            # Display the roster
-            self.display_roster(roster_data)
+            roster_data = self.fetcher.fetch_team_roster(team_name, progress=progress, cancel_event=cancel_event)
             
-            self.status_var.set(f"Roster fetched and saved to {filepath}")
-            self.update_saved_teams_label()
-            
-            messagebox.showinfo(
-                "Success",
-                f"Roster data for {team_name} has been fetched and saved!"
-            )
+            # Save the roster (unless the user cancelled)
+            filepath = None
+            if roster_data['status'] != 'cancelled':
+                filepath = self.fetcher.save_roster(roster_data)
             
+            self.fetch_queue.put(('done', team_name, roster_data, filepath))
         except Exception as e:
-            self.status_var.set("Error occurred")
-            messagebox.showerror("Error", f"Failed to fetch roster:\n{str(e)}")
+            self.fetch_queue.put(('error', team_name, str(e), None))
+    
+    def _poll_fetch_queue(self):
+        """Show the updates from the background fetch (runs on the main thread)"""
+        try:
+            while True:
+                message = self.fetch_queue.get_nowait()
+                kind, team_name = message[0], message[1]
+                
+                if kind == 'progress':
+                    done, total = message[2], message[3]
+                    if not self.cancel_event.is_set():
+                        self.status_var.set(f"Fetching roster for {team_name}... player {done}/{total}")
+                    continue
+                
+                self._fetch_finished()
+                
+                if kind == 'error':
+                    self.status_var.set("Error occurred")
+                    messagebox.showerror("Error", f"Failed to fetch roster:\n{message[2]}")
+                    return
+                
+                roster_data, filepath = message[2], message[3]
+                if roster_data['status'] == 'cancelled':
+                    self.status_var.set(f"Fetch cancelled for {team_name}")
+                    return
+                
+                # Display the roster
+                self.display_roster(roster_data)
+                
+                self.status_var.set(f"Roster fetched and saved to {filepath}")
+                self.update_saved_teams_label()
+                
+                messagebox.showinfo(
+                    "Success",
+                    f"Roster data for {team_name} has been fetched and saved!"
+                )
+                return
+        except queue.Empty:
+            pass
+        
+        # Keep polling while the fetch is running
+        self.root.after(100, self._poll_fetch_queue)
+    
+    def _fetch_finished(self):
+        """Put the Fetch button back after a fetch ends"""
+        self.cancel_event = None
+        self.fetch_btn.config(text="Fetch Roster from Web", bg=self.wnba_orange, state=tk.NORMAL)
+    
+    def on_close(self):
+        """Cancel a running fetch and close the window"""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+        self.fetch_executor.shutdown(wait=False)
+        self.headshot_loader.shutdown()
+        self.root.destroy()
     
     def load_roster(self):
         """Load saved roster data from file"""
@@ -343,12 +493,14 @@ class RosterViewerGUI:
         Args:
             roster_data (dict): Roster data to display
         """
-        # Clear existing display
+        self.current_roster = roster_data
+        
+        # Clear existing display (the table keeps its rows and changes them)
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
         
-        # Clear image cache for new roster
-        self.image_cache.clear()
+        # Photos of the old roster that are still waiting are not needed
+        self.headshot_loader.cancel_pending()
         
         # Update info label
         team_name = roster_data['team_name']
@@ -359,12 +511,14 @@ class RosterViewerGUI:
                 text=f"⚠ {roster_data['message']}",
                 fg='orange'
             )
+            self.roster_table.clear()
             return
         elif status == 'error':
             self.info_label.config(
                 text=f"❌ ERROR: {roster_data.get('error', 'Unknown error')}",
                 fg='red'
             )
+            self.roster_table.clear()
             return
         
         # Update info with team details
@@ -379,6 +533,10 @@ class RosterViewerGUI:
         
         players = roster_data.get('players', [])
         
+        if self.table_mode.get():
+            self.display_table(players)
+            return
+        
         if not players:
             no_data_label = tk.Label(
                 self.scrollable_frame,
@@ -426,12 +584,11 @@ class RosterViewerGUI:
             photo_label = tk.Label(player_frame, bg=bg_color, width=60, height=60)
             photo_label.pack(side=tk.LEFT, padx=3, pady=5)
             
-            # Load image in background
+            # Load image in background (all photos download at the same time)
             image_url = player.get('image_url', '')
             player_id = player.get('id', '')
             if image_url and player_id:
-                self.root.after(100 * i, lambda url=image_url, pid=player_id, lbl=photo_label: 
-                              self.load_and_display_image(url, pid, lbl))
+                self.load_and_display_image(image_url, player_id, photo_label)
             else:
                 photo_label.config(text='📷', font=('Arial', 20))
             
@@ -476,6 +633,36 @@ class RosterViewerGUI:
             tk.Label(player_frame, text=college, bg=bg_color,
                     font=('Arial', 9), width=15, anchor='w').pack(side=tk.LEFT, padx=3)
     
+    def display_table(self, players):
+        """
+        Show the players in the table view (rows are changed in place)
+        
+        Args:
+            players (list): Player dictionaries
+        """
+        self.roster_table.show_players(players)
+        
+        for player in players:
+            image_url = player.get('image_url', '')
+            player_id = player.get('id', '')
+            if image_url and player_id:
+                self.load_photo(
+                    image_url, player_id,
+                    lambda photo, pid=player_id: self.roster_table.set_photo(pid, photo)
+                )
+    
+    def toggle_view(self):
+        """Switch between the table view and the card view"""
+        if self.table_mode.get():
+            self.canvas_frame.pack_forget()
+            self.roster_table.frame.pack(fill=tk.BOTH, expand=True, before=self.info_label)
+        else:
+            self.roster_table.frame.pack_forget()
+            self.canvas_frame.pack(fill=tk.BOTH, expand=True, before=self.info_label)
+        
+        if self.current_roster is not None:
+            self.display_roster(self.current_roster)
+    
     def load_and_display_image(self, image_url, player_id, label_widget):
         """
         Load player image from URL and display in label
@@ -485,34 +672,156 @@ class RosterViewerGUI:
             player_id (str): Player ID for caching
             label_widget: Label widget to display the image in
         """
+        def show(photo):
+            # The roster may have been cleared while the image was loading
+            if not label_widget.winfo_exists():
+                return
+            
+            if photo is None:
+                # Show emoji if image fails to load
+                label_widget.config(text='📷', font=('Arial', 20))
+            else:
+                label_widget.config(image=photo)
+        
+        self.load_photo(image_url, player_id, show)
+    
+    def load_photo(self, image_url, player_id, show):
+        """
+        Get a player's photo from the cache, or load it in the background
+        
+        The download, decoding and resizing happen in the headshot loader's
+        threads; show is called later by _poll_headshots.
+        
+        Args:
+            image_url (str): URL of the player's headshot
+            player_id (str): Player ID for caching
+            show (callable): Called on the main thread with the PhotoImage,
+                             or None if the image could not be loaded
+        """
         # Check if already cached
-        if player_id in self.image_cache:
-            label_widget.config(image=self.image_cache[player_id])
+        key = (player_id, image_url)
+        if key in self.image_cache:
+            self.image_cache.move_to_end(key)
+            show(self.image_cache[key])
             return
         
-        try:
-            # Download image
-            response = requests.get(image_url, timeout=5)
-            if response.status_code == 200:
-                # Open and resize image
-                image = Image.open(BytesIO(response.content))
-                # Resize to fit in row (60x60 pixels)
-                image = image.resize((60, 60), Image.Resampling.LANCZOS)
-                # Convert to PhotoImage
-                photo = ImageTk.PhotoImage(image)
-                # Cache it
-                self.image_cache[player_id] = photo
-                # Display it
-                label_widget.config(image=photo)
-        except Exception as e:
-            # Show emoji if image fails to load
-            label_widget.config(text='📷', font=('Arial', 20))
+        self.headshot_loader.load(
+            image_url,
+            lambda image: show(self.make_photo(image, key)),
+            player_id=player_id
+        )
+        self.start_polling_headshots()
+    
+    def start_polling_headshots(self):
+        """Start checking for loaded images (if not checking already)"""
+        if not self.polling_headshots:
+            self.polling_headshots = True
+            self.root.after(50, self._poll_headshots)
+    
+    def _poll_headshots(self):
+        """Show the headshots that finished loading (runs on the main thread)"""
+        still_loading = self.headshot_loader.process_done()
+        
+        if still_loading:
+            self.root.after(50, self._poll_headshots)
+        else:
+            self.polling_headshots = False
+    
+    def make_photo(self, image, key):
+        """
+        Turn a loaded headshot into a cached PhotoImage
+        (PhotoImages can only be made on the main thread)
+        
+        Args:
+            image: Resized PIL image, or None if it could not be loaded
+            key (tuple): (player id, image url) for caching
+            
+        Returns:
+            ImageTk.PhotoImage: The photo, or None
+        """
+        if image is None:
+            return None
+        
+        from PIL import ImageTk
+        
+        # Convert to PhotoImage
+        photo = ImageTk.PhotoImage(image)
+        # Cache it (forget the least recently shown photo when full)
+        self.image_cache[key] = photo
+        if len(self.image_cache) > self.PHOTO_CACHE_SIZE:
+            self.image_cache.popitem(last=False)
+        return photo
+    
+    def open_league_view(self):
+        """Open a window with every player of every saved roster"""
+        # All rosters are read once here; sorting and filtering use the table
+        league = LeagueTable.from_fetcher(self.fetcher)
+        
+        if league.size == 0:
+            messagebox.showwarning("No Saved Data", "No saved rosters yet.\nTry fetching some teams first.")
+            return
+        
+        window = tk.Toplevel(self.root)
+        window.title("WNBA League View")
+        window.geometry("1000x600")
+        window.configure(bg=self.wnba_light_gray)
+        
+        # Filter and sort controls
+        controls = tk.Frame(window, bg=self.wnba_light_gray)
+        controls.pack(fill=tk.X, padx=10, pady=10)
+        
+        tk.Label(controls, text="Search:", bg=self.wnba_light_gray,
+                font=("Arial", 10, "bold")).pack(side=tk.LEFT)
+        search_var = tk.StringVar()
+        search_entry = tk.Entry(controls, textvariable=search_var, font=("Arial", 10), width=25)
+        search_entry.pack(side=tk.LEFT, padx=(5, 15))
+        
+        tk.Label(controls, text="Position:", bg=self.wnba_light_gray,
+                font=("Arial", 10, "bold")).pack(side=tk.LEFT)
+        position_var = tk.StringVar(value="All")
+        ttk.Combobox(controls, textvariable=position_var, values=["All", "Guard", "Forward", "Center"],
+                     state='readonly', width=10).pack(side=tk.LEFT, padx=(5, 15))
+        
+        tk.Label(controls, text="Sort by:", bg=self.wnba_light_gray,
+                font=("Arial", 10, "bold")).pack(side=tk.LEFT)
+        sort_names = {"PPG": 'ppg', "RPG": 'rpg', "APG": 'apg', "Height": 'height', "Name": 'name'}
+        sort_var = tk.StringVar(value="PPG")
+        ttk.Combobox(controls, textvariable=sort_var, values=list(sort_names),
+                     state='readonly', width=8).pack(side=tk.LEFT, padx=5)
+        
+        count_label = tk.Label(controls, bg=self.wnba_light_gray, fg=self.wnba_orange, font=("Arial", 10))
+        count_label.pack(side=tk.RIGHT)
+        
+        table = RosterTable(window, row_height=24, header_color=self.wnba_orange,
+                            columns=LEAGUE_COLUMNS, show_photos=False)
+        table.frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        
+        def refresh(*args):
+            position = position_var.get()
+            sort_by = sort_names[sort_var.get()]
+            rows = league.query(
+                search_var.get(),
+                position='' if position == "All" else position,
+                sort_by=sort_by,
+                descending=(sort_by != 'name')
+            )
+            table.show_players(league.rows(rows))
+            count_label.config(text=f"{len(rows)} of {league.size} players")
+        
+        # Update the table on every key press and every choice
+        for var in (search_var, position_var, sort_var):
+            var.trace_add('write', refresh)
+        
+        refresh()
+        search_entry.focus_set()
     
     def clear_display(self):
         """Clear the display"""
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
-        self.image_cache.clear()
+        self.headshot_loader.cancel_pending()
+        self.roster_table.clear()
+        self.current_roster = None
         self.info_label.config(text="Select a team and fetch roster data", fg="gray")
         self.status_var.set("Display cleared")
     
@@ -0,0 +1,778 @@
+"""
+WNBA Team Roster Fetcher - Storage
+Where the fetched rosters are kept: one JSON file per team, or a single
+SQLite database with indexed lookups
+"""
+
+import bisect
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+# Optional faster serializers
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class JSONRosterStore:
+    """
+    Saves every roster to its own {team_slug}_roster file
+    
+    Formats:
+        'json'    - pretty printed JSON, stats as strings (the original format)
+        'compact' - one-line JSON with stats as numbers (uses orjson if installed)
+        'msgpack' - binary MessagePack with stats as numbers (needs msgpack)
+    
+    load() works out the format from the file itself, so files saved in any
+    format can always be loaded.
+    """
+    
+    FORMATS = ('json', 'compact', 'msgpack')
+    
+    # Player fields saved as numbers in the compact formats
+    NUMERIC_FIELDS = ('ppg', 'rpg', 'apg', 'number')
+    
+    def __init__(self, data_dir, file_format='json'):
+        """
+        Initialize the store
+        
+        Args:
+            data_dir (str): Directory to save roster data files
+            file_format (str): 'json', 'compact' or 'msgpack'
+        """
+        if file_format not in self.FORMATS:
+            raise ValueError(f"Unknown format '{file_format}' (use one of {', '.join(self.FORMATS)})")
+        if file_format == 'msgpack' and msgpack is None:
+            raise ImportError("The 'msgpack' format needs msgpack (pip install msgpack)")
+        
+        self.data_dir = data_dir
+        self.file_format = file_format
+    
+    def _path(self, team_slug, extension='.json'):
+        """Get the roster file path of a team"""
+        return os.path.join(self.data_dir, f"{team_slug}_roster{extension}")
+    
+    def save(self, roster_data):
+        """
+        Save roster data to a file in the store's format
+        
+        Args:
+            roster_data (dict): Roster data to save
+            
+        Returns:
+            str: Path to saved file
+        """
+        team_slug = roster_data['team_slug']
+        
+        if self.file_format == 'json':
+            filepath = self._path(team_slug)
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(roster_data, f, indent=2, ensure_ascii=False)
+            return filepath
+        
+        compact_data = _with_numeric_stats(roster_data, self.NUMERIC_FIELDS)
+        
+        if self.file_format == 'msgpack':
+            filepath = self._path(team_slug, '.msgpack')
+            data = msgpack.packb(compact_data, use_bin_type=True)
+        elif orjson is not None:
+            filepath = self._path(team_slug)
+            data = orjson.dumps(compact_data)
+        else:
+            filepath = self._path(team_slug)
+            data = json.dumps(compact_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        
+        with open(filepath, 'wb') as f:
+            f.write(data)
+        
+        return filepath
+    
+    def load(self, team_slug):
+        """
+        Load saved roster data from file (any format)
+        
+        Args:
+            team_slug (str): Team slug (e.g. 'fever')
+            
+        Returns:
+            dict: Roster data or None if file doesn't exist
+        """
+        # If the team was saved in more than one format, use the newest file
+        candidates = [path for path in (self._path(team_slug), self._path(team_slug, '.msgpack'))
+                      if os.path.exists(path)]
+        if not candidates:
+            return None
+        filepath = max(candidates, key=os.path.getmtime)
+        
+        try:
+            with open(filepath, 'rb') as f:
+                data = f.read()
+            return _decode(data)
+        except (OSError, ValueError):
+            return None
+    
+    def saved_slugs(self):
+        """
+        Get the slugs of all teams with a saved roster (one directory listing
+        instead of checking every file)
+        
+        Returns:
+            set: Team slugs
+        """
+        try:
+            filenames = os.listdir(self.data_dir)
+        except OSError:
+            return set()
+        
+        slugs = set()
+        for name in filenames:
+            for suffix in ('_roster.json', '_roster.msgpack'):
+                if name.endswith(suffix):
+                    slugs.add(name[:-len(suffix)])
+        
+        return slugs
+
+
+class SQLiteRosterStore:
+    """
+    Saves all rosters, players and the fetch history in one SQLite file
+    
+    The database runs in WAL mode, so the GUI can read while a fetch is
+    saving. Players are indexed by team, id, name and PPG, so questions like
+    "which team is player X on" don't need to read every roster.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS teams (
+            team_slug TEXT PRIMARY KEY,
+            team_name TEXT NOT NULL,
+            status TEXT NOT NULL,
+            fetched_at TEXT NOT NULL,
+            roster_json TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS players (
+            team_slug TEXT NOT NULL REFERENCES teams(team_slug) ON DELETE CASCADE,
+            roster_order INTEGER NOT NULL,
+            player_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            number TEXT,
+            position TEXT,
+            height TEXT,
+            ppg REAL,
+            rpg REAL,
+            apg REAL,
+            college TEXT,
+            experience TEXT,
+            PRIMARY KEY (team_slug, roster_order)
+        );
+        CREATE INDEX IF NOT EXISTS idx_players_player_id ON players(player_id);
+        CREATE INDEX IF NOT EXISTS idx_players_name ON players(name COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS idx_players_ppg ON players(ppg);
+        CREATE TABLE IF NOT EXISTS fetch_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            team_slug TEXT NOT NULL,
+            fetched_at TEXT NOT NULL,
+            status TEXT NOT NULL,
+            player_count INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_fetch_history_team ON fetch_history(team_slug, fetched_at);
+    """
+    
+    def __init__(self, db_path):
+        """
+        Initialize the store (creates the database if needed)
+        
+        Args:
+            db_path (str): Path of the SQLite database file
+        """
+        self.db_path = db_path
+        
+        conn = self._connect()
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(self.SCHEMA)
+        finally:
+            conn.close()
+    
+    def _connect(self):
+        """
+        Open a connection (one per call, so any thread can use the store)
+        
+        Returns:
+            sqlite3.Connection: The connection
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA foreign_keys=ON')
+        return conn
+    
+    def save(self, roster_data):
+        """
+        Save roster data (replaces the team's previous roster and adds a
+        row to the fetch history)
+        
+        Args:
+            roster_data (dict): Roster data to save
+            
+        Returns:
+            str: Path of the database file
+        """
+        team_slug = roster_data['team_slug']
+        players = roster_data.get('players', [])
+        
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO teams (team_slug, team_name, status, fetched_at, roster_json) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (team_slug, roster_data['team_name'], roster_data['status'],
+                     roster_data['fetched_at'], json.dumps(roster_data, ensure_ascii=False))
+                )
+                conn.execute('DELETE FROM players WHERE team_slug = ?', (team_slug,))
+                conn.executemany(
+                    'INSERT INTO players (team_slug, roster_order, player_id, name, number, position, '
+                    'height, ppg, rpg, apg, college, experience) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    [(team_slug, i, p.get('id', ''), p.get('name', ''), p.get('number'), p.get('position'),
+                      p.get('height'), _to_number(p.get('ppg')), _to_number(p.get('rpg')),
+                      _to_number(p.get('apg')), p.get('college'), p.get('experience'))
+                     for i, p in enumerate(players)]
+                )
+                conn.execute(
+                    'INSERT INTO fetch_history (team_slug, fetched_at, status, player_count) VALUES (?, ?, ?, ?)',
+                    (team_slug, roster_data['fetched_at'], roster_data['status'], len(players))
+                )
+        finally:
+            conn.close()
+        
+        return self.db_path
+    
+    def load(self, team_slug):
+        """
+        Load saved roster data
+        
+        Args:
+            team_slug (str): Team slug (e.g. 'fever')
+            
+        Returns:
+            dict: Roster data or None if the team was never saved
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT roster_json FROM teams WHERE team_slug = ?', (team_slug,)).fetchone()
+        finally:
+            conn.close()
+        
+        return json.loads(row['roster_json']) if row else None
+    
+    def saved_slugs(self):
+        """
+        Get the slugs of all teams with a saved roster
+        
+        Returns:
+            set: Team slugs
+        """
+        conn = self._connect()
+        try:
+            return {row['team_slug'] for row in conn.execute('SELECT team_slug FROM teams')}
+        finally:
+            conn.close()
+    
+    def find_player(self, name_or_id):
+        """
+        Find which team a player is on (by player id or name, any case)
+        
+        Args:
+            name_or_id (str): Player id or full name
+            
+        Returns:
+            list: Dicts with 'team_name', 'team_slug', 'player_id' and 'name'
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                'SELECT t.team_name, p.team_slug, p.player_id, p.name FROM players p '
+                'JOIN teams t ON t.team_slug = p.team_slug '
+                'WHERE p.player_id = ? '
+                'UNION '
+                'SELECT t.team_name, p.team_slug, p.player_id, p.name FROM players p '
+                'JOIN teams t ON t.team_slug = p.team_slug '
+                'WHERE p.name = ? COLLATE NOCASE',
+                (name_or_id, name_or_id)
+            ).fetchall()
+        finally:
+            conn.close()
+        
+        return [dict(row) for row in rows]
+    
+    def query_players(self, position=None, min_ppg=None, min_rpg=None, min_apg=None):
+        """
+        Find players across all saved teams, e.g. all guards with PPG > 15
+        
+        Args:
+            position (str): Part of the position (e.g. 'Guard')
+            min_ppg (float): Only players scoring more than this
+            min_rpg (float): Only players with more rebounds than this
+            min_apg (float): Only players with more assists than this
+            
+        Returns:
+            list: Player dicts (with 'team_name'), best scorers first
+        """
+        conditions = []
+        params = []
+        
+        if position:
+            conditions.append('p.position LIKE ?')
+            params.append(f'%{position}%')
+        for column, minimum in (('ppg', min_ppg), ('rpg', min_rpg), ('apg', min_apg)):
+            if minimum is not None:
+                conditions.append(f'p.{column} > ?')
+                params.append(minimum)
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                'SELECT t.team_name, p.team_slug, p.player_id, p.name, p.number, p.position, p.height, '
+                'p.ppg, p.rpg, p.apg, p.college, p.experience FROM players p '
+                f'JOIN teams t ON t.team_slug = p.team_slug {where} '
+                'ORDER BY p.ppg DESC',
+                params
+            ).fetchall()
+        finally:
+            conn.close()
+        
+        return [dict(row) for row in rows]
+    
+    def fetch_history(self, team_slug):
+        """
+        Get every saved fetch of a team, oldest first
+        
+        Args:
+            team_slug (str): Team slug (e.g. 'fever')
+            
+        Returns:
+            list: Dicts with 'fetched_at', 'status' and 'player_count'
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                'SELECT fetched_at, status, player_count FROM fetch_history '
+                'WHERE team_slug = ? ORDER BY fetched_at',
+                (team_slug,)
+            ).fetchall()
+        finally:
+            conn.close()
+        
+        return [dict(row) for row in rows]
+
+
+class SnapshotRosterStore:
+    """
+    Keeps every fetch of every team as a history of snapshots
+    
+    Each team has its own directory with an index (index.jsonl, one line per
+    snapshot) and one small file per snapshot. Most snapshots are deltas:
+    only the fields and players that changed since the previous snapshot.
+    Every KEYFRAME_INTERVAL snapshots a full copy (keyframe) is saved, so
+    loading any point in time reads one keyframe and at most
+    KEYFRAME_INTERVAL - 1 deltas, never the whole history.
+    """
+    
+    KEYFRAME_INTERVAL = 10
+    
+    # Bytes read at a time from the end of index.jsonl to find its last line
+    TAIL_BLOCK = 1024
+    
+    def __init__(self, snapshot_dir):
+        """
+        Initialize the store
+        
+        Args:
+            snapshot_dir (str): Directory to keep the snapshots in
+        """
+        self.snapshot_dir = snapshot_dir
+        self._lock = threading.Lock()
+        
+        # team slug -> (index file size and mtime, index, fetch times), so
+        # as_of loads don't read and parse the whole index every time
+        self._index_cache = {}
+        
+        # Create snapshot directory if it doesn't exist
+        if not os.path.exists(self.snapshot_dir):
+            os.makedirs(self.snapshot_dir)
+    
+    def _team_dir(self, team_slug):
+        """Get the snapshot directory of a team"""
+        return os.path.join(self.snapshot_dir, team_slug)
+    
+    def _snapshot_path(self, team_slug, seq):
+        """Get the file path of one snapshot"""
+        return os.path.join(self._team_dir(team_slug), f"{seq:06d}.json")
+    
+    def _index_path(self, team_slug):
+        """Get the path of a team's snapshot index"""
+        return os.path.join(self._team_dir(team_slug), 'index.jsonl')
+    
+    def _read_index(self, team_slug):
+        """
+        Read a team's snapshot index
+        
+        Args:
+            team_slug (str): Team slug (e.g. 'fever')
+            
+        Returns:
+            list: One dict per snapshot with 'seq', 'fetched_at', 'kind'
+                  ('full' or 'delta') and 'keyframe' (seq of its keyframe)
+        """
+        try:
+            with open(self._index_path(team_slug), 'r', encoding='utf-8') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except OSError:
+            return []
+    
+    def _read_last_entry(self, team_slug):
+        """
+        Read only the last line of a team's index (the latest snapshot), so
+        the cost doesn't grow with the length of the history
+        
+        Args:
+            team_slug (str): Team slug (e.g. 'fever')
+            
+        Returns:
+            dict: Index entry of the latest snapshot, or None if there is none
+        """
+        try:
+            with open(self._index_path(team_slug), 'rb') as f:
+                position = f.seek(0, os.SEEK_END)
+                tail = b''
+                # Read blocks from the end until a whole line is there
+                while position > 0 and b'\n' not in tail.rstrip():
+                    step = min(self.TAIL_BLOCK, position)
+                    position -= step
+                    f.seek(position)
+                    tail = f.read(step) + tail
+        except OSError:
+            return None
+        
+        last_line = tail.rstrip().rsplit(b'\n', 1)[-1]
+        return json.loads(last_line) if last_line.strip() else None
+    
+    def _cached_index(self, team_slug):
+        """
+        Get a team's index and its fetch times, parsed once and kept until
+        the index file changes
+        
+        Args:
+            team_slug (str): Team slug (e.g. 'fever')
+            
+        Returns:
+            tuple: (index list, list of fetch times as datetimes)
+        """
+        try:
+            stat = os.stat(self._index_path(team_slug))
+            version = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            return [], []
+        
+        cached = self._index_cache.get(team_slug)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+        
+        index = self._read_index(team_slug)
+        fetch_times = [datetime.fromisoformat(entry['fetched_at']) for entry in index]
+        self._index_cache[team_slug] = (version, index, fetch_times)
+        return index, fetch_times
+    
+    def save(self, roster_data):
+        """
+        Add a snapshot of the roster to the team's history
+        
+        Args:
+            roster_data (dict): Roster data to save
+            
+        Returns:
+            str: Path of the snapshot file
+        """
+        team_slug = roster_data['team_slug']
+        
+        with self._lock:
+            last = self._read_last_entry(team_slug)
+            seq = last['seq'] + 1 if last else 0
+            
+            delta = None
+            if last and seq - last['keyframe'] < self.KEYFRAME_INTERVAL:
+                previous = self._rebuild(team_slug, last)
+                delta = _roster_delta(previous, roster_data)
+            
+            if delta is None:
+                entry = {'seq': seq, 'fetched_at': roster_data['fetched_at'], 'kind': 'full', 'keyframe': seq}
+                snapshot = roster_data
+            else:
+                entry = {'seq': seq, 'fetched_at': roster_data['fetched_at'], 'kind': 'delta',
+                         'keyframe': last['keyframe']}
+                snapshot = delta
+            
+            team_dir = self._team_dir(team_slug)
+            if not os.path.exists(team_dir):
+                os.makedirs(team_dir)
+            
+            # Write the snapshot first, then add it to the index
+            filepath = self._snapshot_path(team_slug, seq)
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+            with open(self._index_path(team_slug), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+            self._index_cache.pop(team_slug, None)
+        
+        return filepath
+    
+    def load(self, team_slug, as_of=None):
+        """
+        Load the roster as it was at a point in time
+        
+        Args:
+            team_slug (str): Team slug (e.g. 'fever')
+            as_of (datetime): Point in time (default: the latest snapshot)
+            
+        Returns:
+            dict: Roster data or None if there is no snapshot that old
+        """
+        try:
+            if as_of is None:
+                # The latest roster (GUI, incremental refresh): only the
+                # last line of the index is read
+                entry = self._read_last_entry(team_slug)
+            else:
+                index, fetch_times = self._cached_index(team_slug)
+                position = bisect.bisect_right(fetch_times, as_of) - 1
+                entry = index[position] if position >= 0 else None
+            
+            if entry is None:
+                return None
+            return self._rebuild(team_slug, entry)
+        except (OSError, ValueError):
+            return None
+    
+    def history(self, team_slug):
+        """
+        Get the times of all snapshots of a team, oldest first
+        
+        Args:
+            team_slug (str): Team slug (e.g. 'fever')
+            
+        Returns:
+            list: ISO fetch times
+        """
+        index, _ = self._cached_index(team_slug)
+        return [entry['fetched_at'] for entry in index]
+    
+    def saved_slugs(self):
+        """
+        Get the slugs of all teams with at least one snapshot
+        
+        Returns:
+            set: Team slugs
+        """
+        try:
+            names = os.listdir(self.snapshot_dir)
+        except OSError:
+            return set()
+        
+        return {name for name in names
+                if os.path.exists(os.path.join(self.snapshot_dir, name, 'index.jsonl'))}
+    
+    def _rebuild(self, team_slug, entry):
+        """
+        Rebuild a snapshot from its keyframe and the deltas after it
+        
+        Snapshots are numbered one after the other, so the deltas are the
+        files from the keyframe's seq + 1 up to the wanted seq.
+        
+        Args:
+            team_slug (str): Team slug
+            entry (dict): Index entry of the wanted snapshot
+            
+        Returns:
+            dict: Roster data
+        """
+        with open(self._snapshot_path(team_slug, entry['keyframe']), 'r', encoding='utf-8') as f:
+            roster_data = json.load(f)
+        
+        for seq in range(entry['keyframe'] + 1, entry['seq'] + 1):
+            with open(self._snapshot_path(team_slug, seq), 'r', encoding='utf-8') as f:
+                roster_data = _apply_roster_delta(roster_data, json.load(f))
+        
+        return roster_data
+
+
+def _roster_delta(previous, current):
+    """
+    Work out what changed between two rosters of the same team
+    
+    Args:
+        previous (dict): Older roster data
+        current (dict): Newer roster data
+        
+    Returns:
+        dict: The delta, or None if it can't be stored as one (e.g. two
+              players with the same id)
+    """
+    old_players = {p.get('id'): p for p in previous.get('players', [])}
+    new_players = {p.get('id'): p for p in current.get('players', [])}
+    if len(old_players) != len(previous.get('players', [])) or len(new_players) != len(current.get('players', [])):
+        return None
+    
+    delta = {
+        'set': {key: value for key, value in current.items()
+                if key != 'players' and previous.get(key) != value},
+        'unset': [key for key in previous if key not in current],
+        'added': {pid: p for pid, p in new_players.items() if pid not in old_players},
+        'removed': [pid for pid in old_players if pid not in new_players],
+        'changed': {}
+    }
+    
+    for pid, player in new_players.items():
+        old_player = old_players.get(pid)
+        if old_player is None or old_player == player:
+            continue
+        delta['changed'][pid] = {
+            'set': {key: value for key, value in player.items() if old_player.get(key) != value},
+            'unset': [key for key in old_player if key not in player]
+        }
+    
+    order = list(new_players)
+    if order != [pid for pid in old_players if pid in new_players] + list(delta['added']):
+        delta['order'] = order
+    
+    return delta
+
+
+def _apply_roster_delta(roster_data, delta):
+    """
+    Apply a delta made by _roster_delta to the older roster
+    
+    Args:
+        roster_data (dict): Older roster data
+        delta (dict): The delta
+        
+    Returns:
+        dict: The newer roster data
+    """
+    players = {}
+    for player in roster_data.get('players', []):
+        pid = player.get('id')
+        if pid in delta['removed']:
+            continue
+        change = delta['changed'].get(pid)
+        if change:
+            player = dict(player, **change['set'])
+            for key in change['unset']:
+                player.pop(key, None)
+        players[pid] = player
+    players.update(delta['added'])
+    
+    order = delta.get('order', list(players))
+    
+    new_roster = {key: value for key, value in roster_data.items() if key not in delta['unset']}
+    new_roster.update(delta['set'])
+    new_roster['players'] = [players[pid] for pid in order]
+    
+    return new_roster
+
+
+def _to_number(value):
+    """
+    Convert a stat like '15.2' to a float (None if it isn't a number)
+    
+    Args:
+        value: Stat value from the roster page
+        
+    Returns:
+        float or None: The number
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _with_numeric_stats(roster_data, fields):
+    """
+    Copy roster data with the players' numeric stats stored as numbers
+    
+    Args:
+        roster_data (dict): Roster data
+        fields (tuple): Player fields to convert
+        
+    Returns:
+        dict: The copy ('19.2' -> 19.2, '22' -> 22, '' and '00' stay text)
+    """
+    players = []
+    for player in roster_data.get('players', []):
+        player = dict(player)
+        for field in fields:
+            value = player.get(field)
+            if isinstance(value, str):
+                number = _to_number(value)
+                if number is not None:
+                    # Keep text that wouldn't come back the same (e.g. jersey '00')
+                    if number.is_integer() and str(int(number)) == value:
+                        player[field] = int(number)
+                    elif str(number) == value:
+                        player[field] = number
+        players.append(player)
+    
+    return dict(roster_data, players=players)
+
+
+def _decode(data):
+    """
+    Decode a saved roster file, whatever format it was saved in
+    
+    Args:
+        data (bytes): File contents
+        
+    Returns:
+        dict: Roster data
+    """
+    if data.lstrip()[:1] == b'{':
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data.decode('utf-8'))
+    
+    if msgpack is None:
+        raise ValueError("This roster was saved with msgpack, which is not installed")
+    return msgpack.unpackb(data, raw=False)
+
+
+def create_store(storage, data_dir, file_format='json'):
+    """
+    Create the roster store for a storage name
+    
+    Args:
+        storage (str): 'json' (one file per team), 'sqlite' (one database)
+                       or 'snapshots' (every fetch, as deltas)
+        data_dir (str): Directory to keep the data in
+        file_format (str): File format for the 'json' storage
+                           ('json', 'compact' or 'msgpack')
+                           
+    Returns:
+        JSONRosterStore or SQLiteRosterStore: The store
+    """
+    if storage == 'json':
+        return JSONRosterStore(data_dir, file_format)
+    if storage == 'sqlite':
+        return SQLiteRosterStore(os.path.join(data_dir, 'rosters.db'))
+    if storage == 'snapshots':
+        return SnapshotRosterStore(os.path.join(data_dir, 'snapshots'))
+    raise ValueError(f"Unknown storage '{storage}' (use 'json', 'sqlite' or 'snapshots')")
@@ -0,0 +1,134 @@
+"""
+WNBA Team Roster Viewer - Roster Table
+A ttk.Treeview table for the roster. Tk only draws the rows that are on
+screen, and switching teams changes the rows in place instead of making
+new widgets, so it stays fast for a whole league (~200 players)
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+# (player key, heading, width, anchor) of every column after the photo
+COLUMNS = [
+    ('number', '#', 40, 'center'),
+    ('name', 'Player Name', 170, 'w'),
+    ('position', 'Pos', 110, 'w'),
+    ('height', 'Ht', 50, 'center'),
+    ('ppg', 'PPG', 50, 'center'),
+    ('rpg', 'RPG', 50, 'center'),
+    ('apg', 'APG', 50, 'center'),
+    ('experience', 'Exp', 50, 'center'),
+    ('college', 'College', 150, 'w'),
+]
+
+# Columns of the league view (every team in one table)
+LEAGUE_COLUMNS = [('team', 'Team', 150, 'w')] + COLUMNS
+
+
+def player_values(player, columns=COLUMNS):
+    """
+    Get the cell values of a player's row
+    
+    Args:
+        player (dict): Player dictionary
+        columns (list): Table columns (default: COLUMNS)
+        
+    Returns:
+        tuple: One value per column
+    """
+    return tuple(player.get(key, '--') for key, _, _, _ in columns)
+
+
+class RosterTable:
+    """Roster table with a photo column, reusing its rows between teams"""
+    
+    def __init__(self, parent, row_height=64, header_color="#FE5000", columns=COLUMNS, show_photos=True):
+        """
+        Create the table (call .frame.pack() to show it)
+        
+        Args:
+            parent: Widget to put the table in
+            row_height (int): Height of a row in pixels (fits a 60x60 photo)
+            header_color (str): Background color of the column headings
+            columns (list): (player key, heading, width, anchor) of each column
+            show_photos (bool): Show the photo column
+        """
+        self.frame = tk.Frame(parent, bg='white')
+        self.columns = columns
+        
+        style_name = f'Roster{row_height}.Treeview'
+        style = ttk.Style(parent)
+        style.configure(style_name, rowheight=row_height, font=('Arial', 10))
+        style.configure(f'{style_name}.Heading', background=header_color,
+                        foreground='white', font=('Arial', 10, 'bold'))
+        
+        self.tree = ttk.Treeview(
+            self.frame,
+            columns=[key for key, _, _, _ in columns],
+            show='tree headings' if show_photos else 'headings',
+            style=style_name,
+            selectmode='browse'
+        )
+        self.tree.heading('#0', text='Photo')
+        self.tree.column('#0', width=80, stretch=False, anchor='center')
+        for key, heading, width, anchor in columns:
+            self.tree.heading(key, text=heading)
+            self.tree.column(key, width=width, anchor=anchor, stretch=(key in ('name', 'college')))
+        
+        # Alternate row colors like the card view
+        self.tree.tag_configure('even', background='#F5F5F5')
+        self.tree.tag_configure('odd', background='white')
+        
+        scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Player id -> row id of the players shown now
+        self._rows = {}
+    
+    def show_players(self, players):
+        """
+        Show a list of players, changing the existing rows in place
+        
+        Args:
+            players (list): Player dictionaries
+        """
+        rows = self.tree.get_children()
+        self._rows = {}
+        
+        for i, player in enumerate(players):
+            values = player_values(player, self.columns)
+            tags = ('even' if i % 2 == 0 else 'odd',)
+            
+            if i < len(rows):
+                row_id = rows[i]
+                self.tree.item(row_id, values=values, tags=tags, image='')
+            else:
+                row_id = self.tree.insert('', tk.END, values=values, tags=tags)
+            
+            if player.get('id'):
+                self._rows[player['id']] = row_id
+        
+        # Remove the rows the new roster doesn't need
+        if len(rows) > len(players):
+            self.tree.delete(*rows[len(players):])
+        
+        self.tree.yview_moveto(0)
+    
+    def set_photo(self, player_id, photo):
+        """
+        Show a player's photo (ignored if the player is not shown anymore)
+        
+        Args:
+            player_id (str): Player ID
+            photo: ImageTk.PhotoImage, or None to show no photo
+        """
+        row_id = self._rows.get(player_id)
+        if row_id is not None and self.tree.exists(row_id):
+            self.tree.item(row_id, image=photo if photo is not None else '')
+    
+    def clear(self):
+        """Remove every row"""
+        self.show_players([])
@@ -0,0 +1,168 @@
+"""
+Unit tests for async_roster_fetcher module
+Tests the asyncio fetcher offline (no requests go out to wnba.com)
+"""
+
+import asyncio
+import shutil
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from roster_fetcher import WNBARosterFetcher
+from test_roster_fetcher import ROSTER_HTML
+
+try:
+    from async_roster_fetcher import AsyncWNBARosterFetcher
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+BIO_HTML = ('<dl class="PlayerProfileInfoSecondary"><dt>Height</dt><dd>6-0</dd>'
+            '<dt>College/Country</dt><dd>Iowa/USA</dd><dt>EXP</dt><dd>2</dd></dl>')
+
+
+def fake_response(url):
+    """Build a fake response for a roster page or a player page"""
+    html = ROSTER_HTML if '/roster/' in url else BIO_HTML
+    return SimpleNamespace(status_code=200, headers={}, text=html, content=html.encode('utf-8'))
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class TestAsyncRosterFetcher(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncWNBARosterFetcher"""
+    
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.fetcher = AsyncWNBARosterFetcher(data_dir=self.data_dir, max_connections=2, use_cache=False)
+    
+    async def asyncTearDown(self):
+        await self.fetcher.close()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+    
+    async def test_same_roster_shape_as_sync(self):
+        """Test that the async roster has the same keys as the sync one"""
+        async def fake_request(url, timeout, headers=None):
+            return fake_response(url)
+        
+        with mock.patch.object(self.fetcher, '_request', side_effect=fake_request):
+            roster = await self.fetcher.fetch_team_roster('Indiana Fever')
+        
+        sync_fetcher = WNBARosterFetcher(data_dir=self.data_dir, use_cache=False)
+        with mock.patch.object(sync_fetcher.session, 'get', side_effect=lambda url, **kw: mock.Mock(**vars(fake_response(url)))):
+            sync_roster = sync_fetcher.fetch_team_roster('Indiana Fever')
+        
+        self.assertEqual(list(roster.keys()), list(sync_roster.keys()))
+        self.assertEqual(roster['players'], sync_roster['players'])
+        self.assertEqual(roster['players'][0]['college'], 'Iowa')
+    
+    async def test_connection_limit(self):
+        """Test that no more than max_connections requests are open at once"""
+        open_requests = {'now': 0, 'max': 0}
+        
+        async def fake_request(url, timeout, headers=None):
+            open_requests['now'] += 1
+            open_requests['max'] = max(open_requests['max'], open_requests['now'])
+            await asyncio.sleep(0.01)
+            open_requests['now'] -= 1
+            return fake_response(url)
+        
+        with mock.patch.object(self.fetcher, '_request', side_effect=fake_request):
+            results = await self.fetcher.fetch_all_rosters(['Indiana Fever', 'Chicago Sky'])
+        
+        self.assertEqual(results['Indiana Fever']['players'], 3)
+        self.assertEqual(open_requests['max'], 2)
+        self.assertEqual(await self.fetcher.get_all_saved_rosters(), ['Chicago Sky', 'Indiana Fever'])
+        saved = await self.fetcher.load_roster('Indiana Fever')
+        self.assertEqual(len(saved['players']), 3)
+    
+    async def test_busy_host_does_not_block_other_hosts(self):
+        """Test that requests waiting for a busy host don't take the global slots"""
+        self.fetcher.max_per_host = 1
+        release = asyncio.Event()
+        
+        async def fake_request(url, timeout, headers=None):
+            if 'fever' in url:
+                await release.wait()
+            return fake_response(url)
+        
+        with mock.patch.object(self.fetcher, '_request', side_effect=fake_request):
+            fever = [asyncio.create_task(self.fetcher._get('https://fever.wnba.com/roster/'))
+                     for _ in range(3)]
+            await asyncio.sleep(0.01)
+            # Only one of the 2 global slots is in use, so this one goes through
+            sky = await asyncio.wait_for(self.fetcher._get('https://sky.wnba.com/roster/'), 2)
+            release.set()
+            await asyncio.gather(*fever)
+        
+        self.assertEqual(sky.status_code, 200)
+    
+    async def test_not_modified_reuses_the_cache(self):
+        """Test that a 304 reuses the cached page, with the cache used in worker threads"""
+        fetcher = AsyncWNBARosterFetcher(data_dir=self.data_dir, cache_ttl={'roster': 0})
+        cache = fetcher._fetcher.cache
+        cache_threads = []
+        sent_headers = []
+        statuses = iter([200, 304])
+        parse = mock.Mock(return_value=[{'id': '1628932'}])
+        
+        def cache_get(url, real_get=cache.get):
+            cache_threads.append(threading.current_thread())
+            return real_get(url)
+        
+        async def fake_request(url, timeout, headers=None):
+            sent_headers.append(headers)
+            return SimpleNamespace(status_code=next(statuses), headers={'ETag': '"v1"'}, text=ROSTER_HTML)
+        
+        url = 'https://fever.wnba.com/roster/'
+        with mock.patch.object(cache, 'get', side_effect=cache_get), \
+             mock.patch.object(fetcher, '_request', side_effect=fake_request):
+            first = await fetcher._get_parsed(url, 'roster', parse)
+            second = await fetcher._get_parsed(url, 'roster', parse)
+        await fetcher.close()
+        
+        self.assertEqual(first, second)
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(sent_headers[1], {'If-None-Match': '"v1"'})
+        self.assertTrue(cache_threads)
+        self.assertNotIn(threading.main_thread(), cache_threads)
+    
+    async def test_cancel(self):
+        """Test that cancelling a fetch cancels the requests that are running"""
+        started = asyncio.Event()
+        cancelled = []
+        
+        async def slow_request(url, timeout, headers=None):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+        
+        with mock.patch.object(self.fetcher, '_request', side_effect=slow_request):
+            task = asyncio.create_task(self.fetcher.fetch_team_roster('Indiana Fever'))
+            await started.wait()
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        
+        self.assertEqual(cancelled, ['https://fever.wnba.com/roster/'])
+    
+    async def test_http_error_gives_error_roster(self):
+        """Test that a failed roster page gives an 'error' roster, like the sync class"""
+        async def failing_request(url, timeout, headers=None):
+            raise aiohttp.ClientConnectionError("connection refused")
+        
+        self.fetcher.retries = 0
+        with mock.patch.object(self.fetcher, '_request', side_effect=failing_request):
+            roster = await self.fetcher.fetch_team_roster('Indiana Fever')
+        
+        self.assertEqual(roster['status'], 'error')
+        self.assertEqual(roster['players'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Unit tests for headshot_loader module
+Tests the background image loading offline (no requests go out to wnba.com)
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from io import BytesIO
+from unittest import mock
+
+from PIL import Image
+
+from headshot_loader import HeadshotLoader
+
+
+def png_bytes(size=(260, 190)):
+    """Make a small PNG like the headshots on wnba.com"""
+    buffer = BytesIO()
+    Image.new('RGB', size, 'orange').save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def wait_for(loader, timeout=2):
+    """Call process_done until nothing is loading anymore"""
+    deadline = time.perf_counter() + timeout
+    while loader.process_done() and time.perf_counter() < deadline:
+        time.sleep(0.005)
+
+
+class TestHeadshotLoader(unittest.TestCase):
+    """Test cases for HeadshotLoader"""
+    
+    def setUp(self):
+        self.session = mock.Mock()
+        self.loader = HeadshotLoader(self.session, size=(60, 60))
+    
+    def tearDown(self):
+        self.loader.shutdown()
+    
+    def test_image_is_resized_off_the_main_thread(self):
+        """Test that the download and resize run in a worker, the callback on the caller's thread"""
+        threads = {}
+        
+        def fake_get(url, **kwargs):
+            threads['download'] = threading.current_thread()
+            return mock.Mock(content=png_bytes())
+        
+        def on_loaded(image):
+            threads['callback'] = threading.current_thread()
+            self.assertEqual(image.size, (60, 60))
+        
+        self.session.get.side_effect = fake_get
+        self.loader.load('https://example.com/1.png', on_loaded)
+        wait_for(self.loader)
+        
+        self.assertIsNot(threads['download'], threading.main_thread())
+        self.assertIs(threads['callback'], threading.main_thread())
+    
+    def test_large_jpeg_is_resized(self):
+        """Test that a big JPEG headshot (decoded in draft mode) comes out at the row size"""
+        buffer = BytesIO()
+        Image.new('RGB', (1040, 760), 'orange').save(buffer, format='JPEG')
+        self.session.get.return_value = mock.Mock(content=buffer.getvalue())
+        
+        images = []
+        self.loader.load('https://example.com/1.jpg', images.append)
+        wait_for(self.loader)
+        
+        self.assertEqual(images[0].size, (60, 60))
+    
+    def test_roster_loads_in_parallel(self):
+        """Test that 14 headshots take about as long as one download"""
+        def slow_get(url, **kwargs):
+            time.sleep(0.1)
+            return mock.Mock(content=png_bytes())
+        
+        self.session.get.side_effect = slow_get
+        loaded = []
+        
+        start = time.perf_counter()
+        for i in range(14):
+            self.loader.load(f'https://example.com/{i}.png', loaded.append)
+        wait_for(self.loader)
+        elapsed = time.perf_counter() - start
+        
+        self.assertEqual(len(loaded), 14)
+        self.assertLess(elapsed, 0.5)
+    
+    def test_failed_download_gives_none(self):
+        """Test that a failed image calls back with None instead of raising"""
+        self.session.get.side_effect = OSError("connection refused")
+        loaded = []
+        
+        self.loader.load('https://example.com/1.png', loaded.append)
+        wait_for(self.loader)
+        
+        self.assertEqual(loaded, [None])
+    
+    def test_cancel_pending(self):
+        """Test that waiting downloads are skipped after cancel_pending"""
+        loader = HeadshotLoader(self.session, max_workers=1)
+        release = threading.Event()
+        
+        def blocking_get(url, **kwargs):
+            release.wait(2)
+            return mock.Mock(content=png_bytes())
+        
+        self.session.get.side_effect = blocking_get
+        loaded = []
+        for i in range(5):
+            loader.load(f'https://example.com/{i}.png', loaded.append)
+        
+        loader.cancel_pending()
+        release.set()
+        wait_for(loader)
+        loader.shutdown()
+        
+        # Only the download that had already started finishes
+        self.assertEqual(len(loaded), 1)
+        self.assertEqual(self.session.get.call_count, 1)
+    
+    def test_load_any_tries_urls_in_order_and_saves(self):
+        """Test that load_any uses the first URL that works and saves the image"""
+        def fake_get(url, **kwargs):
+            if 'mirror1' in url:
+                raise OSError("timed out")
+            return mock.Mock(content=png_bytes())
+        
+        self.session.get.side_effect = fake_get
+        loaded = []
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            logo_path = os.path.join(cache_dir, 'logo.png')
+            self.loader.load_any(['https://mirror1/logo.png', 'https://mirror2/logo.png'],
+                                 loaded.append, size=(80, 80), cache_path=logo_path)
+            wait_for(self.loader)
+            
+            self.assertEqual(loaded[0].size, (80, 80))
+            self.assertEqual(Image.open(logo_path).size, (80, 80))
+    
+    def test_load_any_all_fail(self):
+        """Test that load_any gives None when no URL works"""
+        self.session.get.side_effect = OSError("no network")
+        loaded = []
+        
+        self.loader.load_any(['https://mirror1/logo.png', 'https://mirror2/logo.png'], loaded.append)
+        wait_for(self.loader)
+        
+        self.assertEqual(loaded, [None])
+        self.assertEqual(self.session.get.call_count, 2)
+    
+    
+    def test_hanging_load_any_does_not_block_exit(self):
+        """Test that Python exits while a load_any download hangs (e.g. the logo when the window is closed)"""
+        script = ("import time\nfrom unittest import mock\nfrom headshot_loader import HeadshotLoader\n"
+                  "session = mock.Mock()\nsession.get.side_effect = lambda url, **kwargs: time.sleep(60)\n"
+                  "loader = HeadshotLoader(session)\n"
+                  "loader.load_any(['https://mirror1/logo.png'], print)\n"
+                  "time.sleep(0.2)\nloader.shutdown()\n")
+        
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', script], cwd=os.path.dirname(os.path.abspath(__file__)),
+                       timeout=30, check=True)
+        self.assertLess(time.perf_counter() - start, 10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Unit tests for league_table module
+Tests sorting and filtering all saved rosters in memory
+"""
+
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from league_table import LeagueTable, height_inches, stat_value
+from roster_fetcher import WNBARosterFetcher
+
+
+def make_roster(team_name, players):
+    """Make roster data from (id, name, position, height, ppg, rpg, apg, college) tuples"""
+    return {
+        'team_name': team_name,
+        'status': 'active',
+        'players': [{'id': pid, 'number': '0', 'name': name, 'position': position, 'height': height,
+                     'ppg': ppg, 'rpg': rpg, 'apg': apg, 'experience': '1', 'college': college,
+                     'image_url': ''}
+                    for pid, name, position, height, ppg, rpg, apg, college in players]
+    }
+
+
+ROSTERS = [
+    make_roster('Indiana Fever', [
+        ('1', 'Caitlin Clark', 'Guard', '6-0', '19.2', '5.7', '8.4', 'Iowa'),
+        ('2', 'Aliyah Boston', 'Forward-Center', '6-5', '15.0', '8.3', '3.5', 'South Carolina'),
+    ]),
+    make_roster('Las Vegas Aces', [
+        ('3', "A'ja Wilson", 'Center-Forward', '6-4', '26.9', '11.9', '2.3', 'South Carolina'),
+        ('4', 'Kelsey Plum', 'Guard', '5-8', 17.8, 2.6, 4.2, 'Washington'),
+        ('5', 'New Player', 'Guard', '', '--', '--', '--', ''),
+    ]),
+]
+
+
+class TestLeagueTable(unittest.TestCase):
+    """Test cases for LeagueTable"""
+    
+    def setUp(self):
+        self.league = LeagueTable(ROSTERS)
+    
+    def names(self, rows):
+        return [self.league.row(i)['name'] for i in rows]
+    
+    def test_all_players_from_all_teams(self):
+        """Test that every player is in the table with their team"""
+        self.assertEqual(self.league.size, 5)
+        self.assertEqual(self.league.row(2)['team'], 'Las Vegas Aces')
+        self.assertEqual(self.league.row(2)['name'], "A'ja Wilson")
+    
+    def test_sort_by_stats(self):
+        """Test sorting by PPG, APG and height (missing values go last)"""
+        self.assertEqual(self.names(self.league.query(sort_by='ppg')),
+                         ["A'ja Wilson", 'Caitlin Clark', 'Kelsey Plum', 'Aliyah Boston', 'New Player'])
+        self.assertEqual(self.names(self.league.query(sort_by='apg'))[0], 'Caitlin Clark')
+        self.assertEqual(self.names(self.league.query(sort_by='height', descending=False)),
+                         ['Kelsey Plum', 'Caitlin Clark', "A'ja Wilson", 'Aliyah Boston', 'New Player'])
+    
+    def test_filter_by_name_college_and_position(self):
+        """Test the search box and the position filter"""
+        self.assertEqual(self.names(self.league.query('south carolina')), ["A'ja Wilson", 'Aliyah Boston'])
+        self.assertEqual(self.names(self.league.query('CLARK')), ['Caitlin Clark'])
+        self.assertEqual(self.names(self.league.query(position='Center')), ["A'ja Wilson", 'Aliyah Boston'])
+        self.assertEqual(self.names(self.league.query('a', position='Guard', sort_by='name', descending=False)),
+                         ['Caitlin Clark', 'Kelsey Plum', 'New Player'])
+    
+    def test_typing_narrows_the_last_matches(self):
+        """Test that each new letter gives the same result as a fresh search"""
+        for text in ('k', 'ke', 'kel', 'ke', 'w', 'wa', ''):
+            fresh = LeagueTable(ROSTERS).query(text)
+            self.assertEqual(self.league.query(text), fresh, text)
+    
+    def test_unknown_sort_key(self):
+        """Test that an unknown sort key raises ValueError"""
+        with self.assertRaises(ValueError):
+            self.league.query(sort_by='fouls')
+    
+    def test_values(self):
+        """Test the stat and height helpers"""
+        self.assertEqual(stat_value('19.2'), 19.2)
+        self.assertIsNone(stat_value('--'))
+        self.assertEqual(height_inches('6-4'), 76)
+        self.assertIsNone(height_inches(''))
+
+
+class TestLeagueFromFetcher(unittest.TestCase):
+    """Test loading the league from the saved rosters"""
+    
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.fetcher = WNBARosterFetcher(data_dir=self.data_dir, use_cache=False)
+        for roster in ROSTERS:
+            self.fetcher.save_roster(dict(roster, team_slug=self.fetcher.TEAMS[roster['team_name']]))
+    
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+    
+    def test_files_read_once(self):
+        """Test that queries never read the roster files again"""
+        with mock.patch.object(self.fetcher, 'load_roster', wraps=self.fetcher.load_roster) as load:
+            league = LeagueTable.from_fetcher(self.fetcher)
+            for text in ('c', 'ca', 'cai'):
+                league.query(text, sort_by='rpg')
+        
+        self.assertEqual(load.call_count, 2)
+        self.assertEqual(league.size, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,439 @@
+"""
+Unit tests for roster_fetcher module
+Tests the parsing logic offline (no requests go out to wnba.com)
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from bs4 import BeautifulSoup
+
+from roster_fetcher import WNBARosterFetcher, get_default_parser
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+# A small roster page with the same structure as [team].wnba.com/roster/
+ROSTER_HTML = """
+<html><body>
+<a href="/player/1628932"><div class="number">#22</div><h3>Caitlin Clark</h3>
+  <p class="subtitle">Guard</p><dl><dt>PPG</dt><dd>19.2</dd><dt>RPG</dt><dd>5.7</dd><dt>APG</dt><dd>8.4</dd></dl></a>
+<a href="/player/1642286"><div class="number">#7</div><h3>Aliyah Boston</h3>
+  <p class="subtitle">Forward</p><dl><dt>PPG</dt><dd>15.0</dd><dt>RPG</dt><dd>8.3</dd><dt>APG</dt><dd>3.5</dd></dl></a>
+<a href="/player/1629480"><div class="number">#10</div><h3>Kelsey Mitchell</h3>
+  <p class="subtitle">Guard</p><dl><dt>PPG</dt><dd>20.2</dd><dt>RPG</dt><dd>2.5</dd><dt>APG</dt><dd>3.4</dd></dl></a>
+<a href="/player/">No id here</a>
+</body></html>
+"""
+
+
+class TestParseRosterPage(unittest.TestCase):
+    """Test cases for the two-phase roster page parsing"""
+    
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.fetcher = WNBARosterFetcher(data_dir=self.data_dir, max_workers=3)
+        self.soup = BeautifulSoup(ROSTER_HTML, 'html.parser')
+    
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+    
+    def test_roster_cards_are_parsed(self):
+        """Test that the roster cards are parsed without fetching player pages"""
+        players = self.fetcher._parse_roster_cards(self.soup)
+        
+        self.assertEqual([p['name'] for p in players], ['Caitlin Clark', 'Aliyah Boston', 'Kelsey Mitchell'])
+        self.assertEqual(players[0]['number'], '22')
+        self.assertEqual(players[0]['position'], 'Guard')
+        self.assertEqual(players[0]['ppg'], '19.2')
+        self.assertEqual(players[0]['height'], '')
+    
+    def test_details_merge_back_in_roster_order(self):
+        """Test that slower player pages don't change the roster order"""
+        delays = {'1628932': 0.06, '1642286': 0.0, '1629480': 0.03}
+        
+        def fake_details(player):
+            time.sleep(delays[player['id']])
+            return {'height': player['id'], 'college': '', 'experience': ''}
+        
+        with mock.patch.object(self.fetcher, '_fetch_player_details', side_effect=fake_details):
+            players = self.fetcher._parse_roster_page(self.soup)
+        
+        self.assertEqual([p['id'] for p in players], ['1628932', '1642286', '1629480'])
+        self.assertEqual([p['height'] for p in players], ['1628932', '1642286', '1629480'])
+    
+    def test_failed_player_page_does_not_fail_team(self):
+        """Test that a failing player page leaves empty bio fields only"""
+        with mock.patch.object(self.fetcher.session, 'get', side_effect=OSError("connection refused")):
+            players = self.fetcher._parse_roster_page(self.soup)
+        
+        self.assertEqual(len(players), 3)
+        for player in players:
+            self.assertEqual(player['height'], '')
+            self.assertEqual(player['college'], '')
+            self.assertEqual(player['experience'], '')
+    
+    def test_player_keys_match_saved_format(self):
+        """Test that the player dictionary keeps the same keys as before"""
+        with mock.patch.object(self.fetcher, '_fetch_player_details',
+                               return_value={'height': '6-4', 'college': 'Iowa', 'experience': '2'}):
+            players = self.fetcher._parse_roster_page(self.soup)
+        
+        self.assertEqual(list(players[0].keys()), ['id', 'number', 'name', 'position', 'height',
+                                                   'ppg', 'rpg', 'apg', 'college', 'experience',
+                                                   'image_url'])
+
+
+class TestFetchAllRosters(unittest.TestCase):
+    """Test cases for the whole-league refresh"""
+    
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.fetcher = WNBARosterFetcher(data_dir=self.data_dir, max_connections=4, max_per_host=2)
+    
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+    
+    def fake_roster(self, team_name, incremental=False):
+        status = 'error' if team_name == 'Chicago Sky' else 'active'
+        return {
+            'team_name': team_name,
+            'team_slug': self.fetcher.TEAMS[team_name],
+            'status': status,
+            'players': [{'id': '1', 'name': 'Someone'}] if status == 'active' else [],
+            'fetched_at': '2025-06-01T12:00:00',
+            'error': 'timeout' if status == 'error' else None
+        }
+    
+    def test_results_for_every_team(self):
+        """Test that every team gets a result, in the requested order"""
+        teams = ['Indiana Fever', 'Chicago Sky', 'Atlanta Dream']
+        with mock.patch.object(self.fetcher, 'fetch_team_roster', side_effect=self.fake_roster):
+            results = self.fetcher.fetch_all_rosters(teams)
+        
+        self.assertEqual(list(results.keys()), teams)
+        self.assertEqual(results['Indiana Fever']['status'], 'active')
+        self.assertEqual(results['Indiana Fever']['players'], 1)
+        self.assertGreaterEqual(results['Indiana Fever']['elapsed'], 0)
+        self.assertEqual(results['Chicago Sky']['status'], 'error')
+        self.assertEqual(results['Chicago Sky']['error'], 'timeout')
+    
+    def test_each_team_saved_when_done(self):
+        """Test that finished teams are saved, but failed teams are not"""
+        saved_when_done = []
+        
+        def on_team_done(team_name, result):
+            saved_when_done.append((team_name, result['filepath'] and os.path.exists(result['filepath'])))
+        
+        with mock.patch.object(self.fetcher, 'fetch_team_roster', side_effect=self.fake_roster):
+            self.fetcher.refresh_league(['Indiana Fever', 'Chicago Sky'], on_team_done=on_team_done)
+        
+        self.assertIn(('Indiana Fever', True), saved_when_done)
+        self.assertIn(('Chicago Sky', None), saved_when_done)
+        self.assertEqual(self.fetcher.get_all_saved_rosters(), ['Indiana Fever'])
+    
+    def test_unknown_team_raises(self):
+        """Test that an unknown team name is rejected before fetching"""
+        with self.assertRaises(ValueError):
+            self.fetcher.fetch_all_rosters(['Not A Team'])
+    
+    def test_connection_limits(self):
+        """Test that requests respect the global and per-host limits"""
+        lock = threading.Lock()
+        open_requests = {'total': 0, 'max_total': 0}
+        open_per_host = {}
+        max_per_host = {}
+        
+        def fake_get(url, **kwargs):
+            host = url.split('/')[2]
+            with lock:
+                open_requests['total'] += 1
+                open_requests['max_total'] = max(open_requests['max_total'], open_requests['total'])
+                open_per_host[host] = open_per_host.get(host, 0) + 1
+                max_per_host[host] = max(max_per_host.get(host, 0), open_per_host[host])
+            time.sleep(0.01)
+            with lock:
+                open_requests['total'] -= 1
+                open_per_host[host] -= 1
+            return mock.Mock(status_code=200)
+        
+        urls = [f'https://www.wnba.com/player/{i}' for i in range(10)]
+        urls += [f'https://{slug}.wnba.com/roster/' for slug in ['fever', 'sky', 'dream']]
+        with mock.patch.object(self.fetcher.session, 'get', side_effect=fake_get):
+            threads = [threading.Thread(target=self.fetcher._get, args=(url,)) for url in urls]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        self.assertLessEqual(open_requests['max_total'], 4)
+        self.assertLessEqual(max_per_host['www.wnba.com'], 2)
+    
+    def test_busy_host_does_not_block_other_hosts(self):
+        """Test that requests waiting for a full host don't use up the global slots"""
+        release = threading.Event()
+        started = threading.Semaphore(0)
+        
+        def fake_get(url, **kwargs):
+            if url.startswith('https://www.'):
+                started.release()
+                release.wait(5)
+            return mock.Mock(status_code=200)
+        
+        with mock.patch.object(self.fetcher.session, 'get', side_effect=fake_get):
+            # 10 player pages: 2 run (the www limit), 8 wait for www
+            threads = [threading.Thread(target=self.fetcher._get, args=(f'https://www.wnba.com/player/{i}',))
+                       for i in range(10)]
+            for thread in threads:
+                thread.start()
+            for _ in range(2):
+                started.acquire(timeout=5)
+            
+            # Only 2 of the 4 global slots are in use, so another host gets one
+            roster = threading.Thread(target=self.fetcher._get, args=('https://fever.wnba.com/roster/',))
+            roster.start()
+            roster.join(timeout=2)
+            finished = not roster.is_alive()
+            
+            release.set()
+            for thread in threads + [roster]:
+                thread.join()
+        
+        self.assertTrue(finished)
+
+
+class TestSession(unittest.TestCase):
+    """Test cases for the shared HTTP session"""
+    
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.fetcher = WNBARosterFetcher(data_dir=self.data_dir)
+    
+    def tearDown(self):
+        self.fetcher.session.close()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+    
+    def test_default_headers(self):
+        """Test that the User-Agent is set once on the session"""
+        self.assertEqual(self.fetcher.session.headers['User-Agent'],
+                         WNBARosterFetcher.HEADERS['User-Agent'])
+    
+    def test_pooled_adapter_with_retries(self):
+        """Test that https requests use the pooled adapter with retries"""
+        adapter = self.fetcher.session.get_adapter('https://www.wnba.com/player/1')
+        self.assertGreaterEqual(adapter._pool_maxsize, self.fetcher.max_workers)
+        # Other users of the session size their thread pools from this
+        self.assertEqual(adapter._pool_maxsize, self.fetcher.pool_maxsize)
+        self.assertGreater(adapter.max_retries.total, 0)
+    
+    def test_requests_go_through_session(self):
+        """Test that _get uses the shared session"""
+        response = mock.Mock(status_code=200)
+        with mock.patch.object(self.fetcher.session, 'get', return_value=response) as get:
+            self.assertIs(self.fetcher._get('https://fever.wnba.com/roster/'), response)
+        get.assert_called_once_with('https://fever.wnba.com/roster/', timeout=10)
+
+
+class TestHTTPCache(unittest.TestCase):
+    """Test cases for the on-disk HTTP cache"""
+    
+    URL = 'https://fever.wnba.com/roster/'
+    
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.fetcher = WNBARosterFetcher(data_dir=self.data_dir)
+        self.parse = mock.Mock(return_value=[{'id': '1628932'}])
+    
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+    
+    def response(self, status_code):
+        return mock.Mock(status_code=status_code, text=ROSTER_HTML,
+                         headers={'ETag': '"v1"', 'Last-Modified': 'Sun, 01 Jun 2025 12:00:00 GMT'})
+    
+    def test_fresh_page_makes_no_request(self):
+        """Test that a page within its TTL is served from the cache"""
+        with mock.patch.object(self.fetcher.session, 'get', return_value=self.response(200)) as get:
+            first = self.fetcher._get_parsed(self.URL, 'roster', self.parse)
+            second = self.fetcher._get_parsed(self.URL, 'roster', self.parse)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(self.parse.call_count, 1)
+    
+    def test_not_modified_skips_download_and_parse(self):
+        """Test that a stale page is revalidated and a 304 reuses the cached result"""
+        self.fetcher.cache_ttl['roster'] = 0
+        
+        with mock.patch.object(self.fetcher.session, 'get', return_value=self.response(200)):
+            self.fetcher._get_parsed(self.URL, 'roster', self.parse)
+        
+        with mock.patch.object(self.fetcher.session, 'get', return_value=self.response(304)) as get:
+            data = self.fetcher._get_parsed(self.URL, 'roster', self.parse)
+        
+        self.assertEqual(data, [{'id': '1628932'}])
+        self.assertEqual(self.parse.call_count, 1)
+        headers = get.call_args.kwargs['headers']
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+        self.assertEqual(headers['If-Modified-Since'], 'Sun, 01 Jun 2025 12:00:00 GMT')
+    
+    def test_ttl_per_resource(self):
+        """Test that player bios are kept longer than roster pages"""
+        self.assertGreater(self.fetcher.cache_ttl['player'], self.fetcher.cache_ttl['roster'])
+        
+        fetcher = WNBARosterFetcher(data_dir=self.data_dir, cache_ttl={'roster': 60})
+        self.assertEqual(fetcher.cache_ttl['roster'], 60)
+        self.assertEqual(fetcher.cache_ttl['player'], WNBARosterFetcher.CACHE_TTL['player'])
+    
+    def test_cache_can_be_turned_off(self):
+        """Test that use_cache=False always downloads"""
+        fetcher = WNBARosterFetcher(data_dir=self.data_dir, use_cache=False)
+        with mock.patch.object(fetcher.session, 'get', return_value=self.response(200)) as get:
+            fetcher._get_parsed(self.URL, 'roster', self.parse)
+            fetcher._get_parsed(self.URL, 'roster', self.parse)
+        
+        self.assertEqual(get.call_count, 2)
+
+
+class TestIncrementalRefresh(unittest.TestCase):
+    """Test cases for the incremental roster refresh"""
+    
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.fetcher = WNBARosterFetcher(data_dir=self.data_dir, use_cache=False)
+        self.fetched_ids = []
+    
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+    
+    def fake_get(self, url, **kwargs):
+        if '/roster/' in url:
+            return mock.Mock(status_code=200, text=ROSTER_HTML, headers={})
+        self.fetched_ids.append(url.split('/player/')[-1])
+        bio = ('<dl class="PlayerProfileInfoSecondary"><dt>Height</dt><dd>6-0</dd>'
+               '<dt>College/Country</dt><dd>Iowa/USA</dd><dt>EXP</dt><dd>2</dd></dl>')
+        return mock.Mock(status_code=200, content=bio.encode('utf-8'), headers={})
+    
+    def save_previous(self, player_ids, bio_fetched_at):
+        players = [{'id': pid, 'name': pid, 'height': '5-11', 'college': 'Old U', 'experience': '5'}
+                   for pid in player_ids]
+        self.fetcher.save_roster({
+            'team_name': 'Indiana Fever',
+            'team_slug': 'fever',
+            'status': 'active',
+            'players': players,
+            'fetched_at': bio_fetched_at,
+            'bio_fetched_at': {pid: bio_fetched_at for pid in player_ids}
+        })
+    
+    def test_only_new_players_are_fetched(self):
+        """Test that only players missing from the saved roster get a bio request"""
+        self.save_previous(['1628932', '1642286'], datetime.now().isoformat())
+        
+        with mock.patch.object(self.fetcher.session, 'get', side_effect=self.fake_get):
+            roster = self.fetcher.fetch_team_roster('Indiana Fever', incremental=True)
+        
+        self.assertEqual(self.fetched_ids, ['1629480'])
+        heights = {p['id']: p['height'] for p in roster['players']}
+        self.assertEqual(heights, {'1628932': '5-11', '1642286': '5-11', '1629480': '6-0'})
+        self.assertEqual(set(roster['bio_fetched_at']), {'1628932', '1642286', '1629480'})
+    
+    def test_old_bios_are_fetched_again(self):
+        """Test that bios older than max_bio_age are fetched again"""
+        self.save_previous(['1628932'], (datetime.now() - timedelta(days=30)).isoformat())
+        
+        with mock.patch.object(self.fetcher.session, 'get', side_effect=self.fake_get):
+            roster = self.fetcher.fetch_team_roster('Indiana Fever', incremental=True,
+                                                    max_bio_age=24 * 60 * 60)
+        
+        self.assertEqual(sorted(self.fetched_ids), ['1628932', '1629480', '1642286'])
+        self.assertEqual(roster['players'][0]['height'], '6-0')
+    
+    def test_full_refresh_by_default(self):
+        """Test that without incremental every bio is fetched"""
+        self.save_previous(['1628932', '1642286'], datetime.now().isoformat())
+        
+        with mock.patch.object(self.fetcher.session, 'get', side_effect=self.fake_get):
+            self.fetcher.fetch_team_roster('Indiana Fever')
+        
+        self.assertEqual(len(self.fetched_ids), 3)
+    
+    def test_progress_for_every_player(self):
+        """Test that progress is reported as each player is finished"""
+        self.save_previous(['1628932'], datetime.now().isoformat())
+        updates = []
+        
+        with mock.patch.object(self.fetcher.session, 'get', side_effect=self.fake_get):
+            roster = self.fetcher.fetch_team_roster('Indiana Fever', incremental=True,
+                                                    progress=lambda done, total: updates.append((done, total)))
+        
+        self.assertEqual(roster['status'], 'active')
+        self.assertEqual(updates, [(1, 3), (2, 3), (3, 3)])
+    
+    def test_cancel(self):
+        """Test that a cancelled fetch stops and gives a 'cancelled' roster"""
+        cancel_event = threading.Event()
+        self.fetcher.max_workers = 1
+        
+        def get_then_cancel(url, **kwargs):
+            # The user presses Cancel while the first player page downloads
+            if '/player/' in url:
+                cancel_event.set()
+            return self.fake_get(url, **kwargs)
+        
+        with mock.patch.object(self.fetcher.session, 'get', side_effect=get_then_cancel):
+            roster = self.fetcher.fetch_team_roster('Indiana Fever', cancel_event=cancel_event)
+        
+        self.assertEqual(roster['status'], 'cancelled')
+        self.assertEqual(roster['players'], [])
+        self.assertEqual(len(self.fetched_ids), 1)
+
+
+class TestParserBackends(unittest.TestCase):
+    """Test cases for the parser backends over the synthetic HTML fixtures"""
+    
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        with open(os.path.join(FIXTURES_DIR, 'roster_page.html'), 'rb') as f:
+            content = f.read()
+        self.roster_response = mock.Mock(text=content.decode('utf-8'), content=content)
+        with open(os.path.join(FIXTURES_DIR, 'player_page.html'), 'rb') as f:
+            content = f.read()
+        self.player_response = mock.Mock(text=content.decode('utf-8'), content=content)
+    
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+    
+    def parse_with(self, parser, strain):
+        fetcher = WNBARosterFetcher(data_dir=self.data_dir, use_cache=False, parser=parser, strain=strain)
+        return (fetcher._parse_roster_response(self.roster_response),
+                fetcher._parse_player_response(self.player_response))
+    
+    def test_fixture_is_parsed(self):
+        """Test that the fixtures give the expected players and bio"""
+        players, details = self.parse_with('html.parser', strain=False)
+        
+        self.assertEqual(len(players), 14)
+        self.assertEqual(players[0]['id'], '1641651')
+        self.assertEqual(players[0]['name'], 'Caitlin Clark')
+        self.assertEqual(players[0]['number'], '22')
+        self.assertEqual(details, {'height': '6-0', 'college': 'Iowa', 'experience': '2'})
+    
+    def test_all_backends_give_same_result(self):
+        """Test that every parser, strained or not, gives the same data"""
+        expected = self.parse_with('html.parser', strain=False)
+        
+        for parser in ['html.parser', get_default_parser()]:
+            for strain in (False, True):
+                with self.subTest(parser=parser, strain=strain):
+                    self.assertEqual(self.parse_with(parser, strain), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
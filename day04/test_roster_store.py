@@ -0,0 +1,289 @@
+"""
+Unit tests for roster_store module
+Tests the JSON and SQLite roster storage
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from roster_fetcher import WNBARosterFetcher
+from roster_store import JSONRosterStore, SQLiteRosterStore, SnapshotRosterStore, create_store, msgpack
+
+
+def make_roster(team_name, team_slug, players, fetched_at='2025-06-01T12:00:00'):
+    """Build a roster dictionary like fetch_team_roster returns"""
+    return {
+        'team_name': team_name,
+        'team_slug': team_slug,
+        'status': 'active',
+        'players': [
+            {'id': pid, 'number': num, 'name': name, 'position': pos, 'height': '6-0',
+             'ppg': ppg, 'rpg': '4.0', 'apg': '2.0', 'college': 'Iowa', 'experience': '2',
+             'image_url': f'https://cdn.wnba.com/headshots/wnba/latest/260x190/{pid}.png'}
+            for pid, num, name, pos, ppg in players
+        ],
+        'fetched_at': fetched_at,
+        'source_url': f'https://{team_slug}.wnba.com/roster/'
+    }
+
+
+FEVER = make_roster('Indiana Fever', 'fever', [
+    ('1641651', '22', 'Caitlin Clark', 'Guard', '19.2'),
+    ('1642286', '7', 'Aliyah Boston', 'Forward-Center', '15.0'),
+    ('1629480', '0', 'Kelsey Mitchell', 'Guard', '20.2'),
+])
+SKY = make_roster('Chicago Sky', 'sky', [
+    ('1642798', '7', 'Angel Reese', 'Forward', '14.7'),
+    ('1641638', '3', 'Ariel Atkins', 'Guard', '12.8'),
+    ('1630108', '4', 'Rachel Banham', 'Guard', ''),
+])
+
+
+class TestJSONRosterStore(unittest.TestCase):
+    """Test cases for the one-file-per-team store"""
+    
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.store = JSONRosterStore(self.data_dir)
+    
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+    
+    def test_save_and_load(self):
+        """Test that a saved roster loads back the same"""
+        filepath = self.store.save(FEVER)
+        
+        self.assertEqual(filepath, os.path.join(self.data_dir, 'fever_roster.json'))
+        self.assertEqual(self.store.load('fever'), FEVER)
+        self.assertIsNone(self.store.load('sky'))
+    
+    def test_saved_slugs(self):
+        """Test that saved teams are found with one directory listing"""
+        self.store.save(FEVER)
+        self.store.save(SKY)
+        
+        self.assertEqual(self.store.saved_slugs(), {'fever', 'sky'})
+    
+    def test_compact_format_stores_numbers(self):
+        """Test that the compact format saves the stats as numbers"""
+        store = JSONRosterStore(self.data_dir, 'compact')
+        store.save(SKY)
+        roster = self.store.load('sky')
+        
+        self.assertEqual(roster['players'][0]['ppg'], 14.7)
+        self.assertEqual(roster['players'][0]['number'], 7)
+        self.assertEqual(roster['players'][2]['ppg'], '')
+        self.assertEqual(roster['players'][0]['name'], 'Angel Reese')
+    
+    def test_numbers_that_would_change_stay_text(self):
+        """Test that a jersey number like '00' is not turned into 0"""
+        roster = make_roster('Chicago Sky', 'sky', [('1', '00', 'Someone', 'Guard', '5.0')])
+        JSONRosterStore(self.data_dir, 'compact').save(roster)
+        player = self.store.load('sky')['players'][0]
+        
+        self.assertEqual(player['number'], '00')
+        self.assertEqual(player['ppg'], 5.0)
+    
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_msgpack_format_is_detected(self):
+        """Test that load detects a msgpack file by itself"""
+        filepath = JSONRosterStore(self.data_dir, 'msgpack').save(FEVER)
+        
+        self.assertTrue(filepath.endswith('fever_roster.msgpack'))
+        self.assertEqual(self.store.load('fever')['players'][2]['ppg'], 20.2)
+        self.assertEqual(self.store.saved_slugs(), {'fever'})
+    
+    def test_unknown_format(self):
+        """Test that an unknown file format is rejected"""
+        with self.assertRaises(ValueError):
+            JSONRosterStore(self.data_dir, 'xml')
+
+
+class TestSQLiteRosterStore(unittest.TestCase):
+    """Test cases for the single-file SQLite store"""
+    
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.store = SQLiteRosterStore(os.path.join(self.data_dir, 'rosters.db'))
+        self.store.save(FEVER)
+        self.store.save(SKY)
+    
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+    
+    def test_save_and_load(self):
+        """Test that a saved roster loads back exactly the same"""
+        self.assertEqual(self.store.load('fever'), FEVER)
+        self.assertEqual(self.store.load('sky'), SKY)
+        self.assertIsNone(self.store.load('dream'))
+        self.assertEqual(self.store.saved_slugs(), {'fever', 'sky'})
+    
+    def test_wal_mode(self):
+        """Test that the database runs in WAL mode"""
+        conn = self.store._connect()
+        try:
+            self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        finally:
+            conn.close()
+    
+    def test_find_player(self):
+        """Test finding a player's team by name (any case) or id"""
+        by_name = self.store.find_player('angel reese')
+        by_id = self.store.find_player('1641651')
+        
+        self.assertEqual([(p['team_name'], p['name']) for p in by_name], [('Chicago Sky', 'Angel Reese')])
+        self.assertEqual([(p['team_name'], p['name']) for p in by_id], [('Indiana Fever', 'Caitlin Clark')])
+        self.assertEqual(self.store.find_player('Nobody'), [])
+    
+    def test_query_players(self):
+        """Test a query like 'all guards with PPG > 15'"""
+        guards = self.store.query_players(position='Guard', min_ppg=15)
+        
+        self.assertEqual([p['name'] for p in guards], ['Kelsey Mitchell', 'Caitlin Clark'])
+        self.assertEqual(guards[0]['ppg'], 20.2)
+    
+    def test_lookups_use_indexes(self):
+        """Test that player lookups are index lookups, not full scans"""
+        conn = self.store._connect()
+        try:
+            plan = ' '.join(row[-1] for row in conn.execute(
+                'EXPLAIN QUERY PLAN SELECT * FROM players WHERE name = ? COLLATE NOCASE', ('x',)))
+            self.assertIn('idx_players_name', plan)
+            plan = ' '.join(row[-1] for row in conn.execute(
+                'EXPLAIN QUERY PLAN SELECT * FROM players WHERE ppg > ?', (15,)))
+            self.assertIn('idx_players_ppg', plan)
+        finally:
+            conn.close()
+    
+    def test_new_fetch_replaces_roster_and_keeps_history(self):
+        """Test that saving again replaces the players and adds to the history"""
+        traded = make_roster('Indiana Fever', 'fever', [('1641651', '22', 'Caitlin Clark', 'Guard', '21.0')],
+                             fetched_at='2025-07-01T12:00:00')
+        self.store.save(traded)
+        
+        self.assertEqual(len(self.store.load('fever')['players']), 1)
+        self.assertEqual(self.store.find_player('Kelsey Mitchell'), [])
+        history = self.store.fetch_history('fever')
+        self.assertEqual([h['player_count'] for h in history], [3, 1])
+
+
+class TestSnapshotRosterStore(unittest.TestCase):
+    """Test cases for the snapshot history store"""
+    
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.store = SnapshotRosterStore(os.path.join(self.data_dir, 'snapshots'))
+        
+        # 25 daily fetches where only Caitlin Clark's PPG changes
+        self.rosters = []
+        for day in range(25):
+            roster = make_roster('Indiana Fever', 'fever', [
+                ('1641651', '22', 'Caitlin Clark', 'Guard', f'{18 + day / 10:.1f}'),
+                ('1642286', '7', 'Aliyah Boston', 'Forward-Center', '15.0'),
+                ('1629480', '0', 'Kelsey Mitchell', 'Guard', '20.2'),
+            ], fetched_at=f'2025-06-{day + 1:02d}T12:00:00')
+            self.rosters.append(roster)
+            self.store.save(roster)
+    
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+    
+    def test_latest_roster(self):
+        """Test that load without as_of gives the latest fetch"""
+        self.assertEqual(self.store.load('fever'), self.rosters[-1])
+        self.assertEqual(len(self.store.history('fever')), 25)
+    
+    def test_load_as_of(self):
+        """Test that any point in time can be rebuilt"""
+        for day in (0, 1, 9, 10, 11, 17, 24):
+            as_of = datetime(2025, 6, day + 1, 18, 0)
+            self.assertEqual(self.store.load('fever', as_of=as_of), self.rosters[day])
+        
+        self.assertIsNone(self.store.load('fever', as_of=datetime(2025, 5, 1)))
+    
+    def test_latest_load_reads_only_the_last_index_line(self):
+        """Test that loading the latest roster doesn't read the whole index"""
+        self.store.TAIL_BLOCK = 16  # Smaller than one line, so several blocks are read
+        with mock.patch.object(self.store, '_read_index', side_effect=AssertionError('whole index read')):
+            self.assertEqual(self.store.load('fever'), self.rosters[-1])
+            self.assertIsNone(self.store.load('sky'))
+    
+    def test_index_parsed_once_for_as_of(self):
+        """Test that as_of loads reuse the parsed index until the next save"""
+        as_of = datetime(2025, 6, 5, 18, 0)
+        with mock.patch.object(self.store, '_read_index', wraps=self.store._read_index) as read_index:
+            for _ in range(3):
+                self.assertEqual(self.store.load('fever', as_of=as_of), self.rosters[4])
+            self.assertEqual(read_index.call_count, 1)
+            
+            newer = dict(self.rosters[-1], fetched_at='2025-07-01T12:00:00')
+            self.store.save(newer)
+            self.assertEqual(self.store.load('fever', as_of=datetime(2025, 7, 2)), newer)
+            self.assertEqual(read_index.call_count, 2)
+    
+    def test_deltas_are_small_with_keyframes(self):
+        """Test that most snapshots are small deltas, with a full copy every KEYFRAME_INTERVAL"""
+        index = self.store._read_index('fever')
+        kinds = [entry['kind'] for entry in index]
+        
+        self.assertEqual([i for i, kind in enumerate(kinds) if kind == 'full'], [0, 10, 20])
+        full_size = os.path.getsize(self.store._snapshot_path('fever', 0))
+        delta_size = os.path.getsize(self.store._snapshot_path('fever', 5))
+        self.assertLess(delta_size * 4, full_size)
+    
+    def test_players_added_removed_and_reordered(self):
+        """Test that roster moves are stored and rebuilt correctly"""
+        moved = make_roster('Indiana Fever', 'fever', [
+            ('1629480', '0', 'Kelsey Mitchell', 'Guard', '20.2'),
+            ('1641651', '22', 'Caitlin Clark', 'Guard', '21.0'),
+            ('1630114', '10', 'Lexie Hull', 'Guard', '6.5'),
+        ], fetched_at='2025-07-01T12:00:00')
+        moved['message'] = 'trade deadline'
+        self.store.save(moved)
+        
+        self.assertEqual(self.store.load('fever'), moved)
+        self.assertEqual(self.store.load('fever', as_of=datetime(2025, 6, 30)), self.rosters[-1])
+
+
+class TestFetcherStorage(unittest.TestCase):
+    """Test cases for choosing the storage on the fetcher"""
+    
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+    
+    def test_fetcher_with_sqlite(self):
+        """Test that save_roster/load_roster/get_all_saved_rosters use the database"""
+        fetcher = WNBARosterFetcher(data_dir=self.data_dir, storage='sqlite')
+        filepath = fetcher.save_roster(SKY)
+        
+        self.assertEqual(filepath, os.path.join(self.data_dir, 'rosters.db'))
+        self.assertEqual(fetcher.load_roster('Chicago Sky'), SKY)
+        self.assertEqual(fetcher.get_all_saved_rosters(), ['Chicago Sky'])
+        self.assertFalse(os.path.exists(os.path.join(self.data_dir, 'sky_roster.json')))
+    
+    def test_fetcher_with_snapshots(self):
+        """Test that load_roster(as_of=...) works with storage='snapshots'"""
+        fetcher = WNBARosterFetcher(data_dir=self.data_dir, storage='snapshots')
+        fetcher.save_roster(FEVER)
+        
+        self.assertEqual(fetcher.load_roster('Indiana Fever', as_of=datetime(2025, 6, 2)), FEVER)
+        self.assertEqual(fetcher.get_all_saved_rosters(), ['Indiana Fever'])
+        
+        with self.assertRaises(ValueError):
+            WNBARosterFetcher(data_dir=self.data_dir).load_roster('Indiana Fever', as_of=datetime(2025, 6, 2))
+    
+    def test_unknown_storage(self):
+        """Test that an unknown storage name is rejected"""
+        with self.assertRaises(ValueError):
+            create_store('csv', self.data_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Unit tests for roster_table module
+The widget tests need a display and are skipped without one
+"""
+
+import tkinter as tk
+import unittest
+
+from roster_table import COLUMNS, RosterTable, player_values
+
+try:
+    root = tk.Tk()
+    root.withdraw()
+except tk.TclError:
+    root = None
+
+
+def make_players(count, team='Fever'):
+    """Make a list of simple player dictionaries"""
+    return [{'id': f'{team}-{i}', 'number': str(i), 'name': f'{team} Player {i}', 'position': 'Guard',
+             'height': '6-0', 'ppg': '10.0', 'rpg': '4.0', 'apg': '2.0', 'experience': '3',
+             'college': 'Iowa', 'image_url': ''} for i in range(count)]
+
+
+class TestPlayerValues(unittest.TestCase):
+    """Test cases for player_values"""
+    
+    def test_one_value_per_column(self):
+        """Test that a row has the player's values in column order"""
+        values = player_values(make_players(1)[0])
+        self.assertEqual(len(values), len(COLUMNS))
+        self.assertEqual(values[:3], ('0', 'Fever Player 0', 'Guard'))
+    
+    def test_missing_fields(self):
+        """Test that missing fields show '--' like the card view"""
+        self.assertEqual(player_values({'name': 'Unknown'})[0], '--')
+
+
+@unittest.skipIf(root is None, "no display available")
+class TestRosterTable(unittest.TestCase):
+    """Test cases for RosterTable"""
+    
+    def setUp(self):
+        self.table = RosterTable(root)
+    
+    def tearDown(self):
+        self.table.frame.destroy()
+    
+    def test_rows_are_reused(self):
+        """Test that switching teams changes the rows in place"""
+        self.table.show_players(make_players(12))
+        rows = self.table.tree.get_children()
+        
+        self.table.show_players(make_players(14, team='Sky'))
+        new_rows = self.table.tree.get_children()
+        
+        self.assertEqual(new_rows[:12], rows)
+        self.assertEqual(len(new_rows), 14)
+        self.assertEqual(self.table.tree.set(new_rows[0], 'name'), 'Sky Player 0')
+        
+        self.table.show_players(make_players(3))
+        self.assertEqual(self.table.tree.get_children(), rows[:3])
+    
+    def test_photo_for_player_not_shown(self):
+        """Test that a late photo for a player of the old roster is ignored"""
+        self.table.show_players(make_players(2))
+        self.table.show_players(make_players(2, team='Sky'))
+        self.table.set_photo('Fever-0', None)
+        self.table.set_photo('Sky-0', None)
+
+
+if __name__ == '__main__':
+    unittest.main()
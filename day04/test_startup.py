@@ -0,0 +1,35 @@
+"""
+Unit tests for the fast GUI start
+Tests that the slow modules (bs4, requests, PIL) are only imported when needed
+"""
+
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import bench_startup
+from roster_fetcher import WNBARosterFetcher
+from test_roster_fetcher import ROSTER_HTML
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test that the slow modules are only imported when they are needed"""
+    
+    def test_gui_import_and_saved_rosters_skip_heavy_modules(self):
+        """Test that starting the GUI and loading saved rosters never imports bs4, requests or PIL"""
+        self.assertEqual(bench_startup.run_script(bench_startup.IMPORT_SCRIPT)['modules'], [])
+        self.assertEqual(bench_startup.run_script(bench_startup.LOAD_SAVED_SCRIPT)['modules'], [])
+    
+    def test_parsing_still_works(self):
+        """Test that bs4 is imported when a page is parsed"""
+        fetcher = WNBARosterFetcher(data_dir=tempfile.mkdtemp(), use_cache=False)
+        try:
+            players = fetcher._parse_roster_response(mock.Mock(text=ROSTER_HTML))
+            self.assertEqual(len(players), 3)
+        finally:
+            shutil.rmtree(fetcher.data_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
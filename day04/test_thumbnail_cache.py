@@ -0,0 +1,115 @@
+"""
+Unit tests for thumbnail_cache module
+Tests the on-disk headshot cache and its size limit
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from PIL import Image
+
+from headshot_loader import HeadshotLoader
+from test_headshot_loader import png_bytes, wait_for
+from thumbnail_cache import ThumbnailCache
+
+SIZE = (60, 60)
+
+
+def thumbnail(color):
+    """Make a 60x60 thumbnail with noise so it doesn't compress to nothing"""
+    image = Image.effect_noise(SIZE, 64).convert('RGB')
+    return Image.blend(image, Image.new('RGB', SIZE, color), 0.5)
+
+
+class TestThumbnailCache(unittest.TestCase):
+    """Test cases for ThumbnailCache"""
+    
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = ThumbnailCache(self.cache_dir)
+    
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+    
+    def test_round_trip(self):
+        """Test that a saved thumbnail comes back the same"""
+        image = thumbnail('orange')
+        self.cache.put('1641651', 'https://example.com/clark.png', SIZE, image)
+        
+        cached = self.cache.get('1641651', 'https://example.com/clark.png', SIZE)
+        self.assertEqual(cached.size, SIZE)
+        self.assertEqual(cached.tobytes(), image.tobytes())
+    
+    def test_key_includes_url_and_size(self):
+        """Test that a new headshot URL or another size is a cache miss"""
+        self.cache.put('1641651', 'https://example.com/clark.png', SIZE, thumbnail('orange'))
+        
+        self.assertIsNone(self.cache.get('1641651', 'https://example.com/clark-2025.png', SIZE))
+        self.assertIsNone(self.cache.get('1641651', 'https://example.com/clark.png', (80, 80)))
+        self.assertIsNone(self.cache.get('1642286', 'https://example.com/clark.png', SIZE))
+    
+    def test_kept_between_runs(self):
+        """Test that a new cache object finds the thumbnails of the old one"""
+        self.cache.put('1641651', 'https://example.com/clark.png', SIZE, thumbnail('orange'))
+        
+        cache = ThumbnailCache(self.cache_dir)
+        self.assertIsNotNone(cache.get('1641651', 'https://example.com/clark.png', SIZE))
+        self.assertEqual(cache.total_bytes, self.cache.total_bytes)
+    
+    def test_least_recently_used_are_removed(self):
+        """Test that the size limit removes the thumbnails that were used least recently"""
+        self.cache.put('1', 'u1', SIZE, thumbnail('red'))
+        one_size = self.cache.total_bytes
+        self.cache.max_bytes = one_size * 3.5
+        
+        self.cache.put('2', 'u2', SIZE, thumbnail('green'))
+        self.cache.put('3', 'u3', SIZE, thumbnail('blue'))
+        
+        # Using '1' again makes '2' the oldest
+        self.assertIsNotNone(self.cache.get('1', 'u1', SIZE))
+        self.cache.put('4', 'u4', SIZE, thumbnail('white'))
+        
+        self.assertIsNone(self.cache.get('2', 'u2', SIZE))
+        for player_id in ('1', '3', '4'):
+            self.assertIsNotNone(self.cache.get(player_id, f'u{player_id}', SIZE))
+        self.assertLessEqual(self.cache.total_bytes, self.cache.max_bytes)
+        self.assertEqual(len([f for f in os.listdir(self.cache_dir) if f.endswith('.png')]), 3)
+
+
+class TestHeadshotLoaderWithCache(unittest.TestCase):
+    """Test cases for HeadshotLoader with a thumbnail cache"""
+    
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.session = mock.Mock()
+        self.session.get.return_value = mock.Mock(content=png_bytes())
+    
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+    
+    def load_roster_photos(self):
+        """Load 14 headshots with a new loader (like opening the GUI again)"""
+        loader = HeadshotLoader(self.session, size=SIZE, thumbnail_cache=ThumbnailCache(self.cache_dir))
+        loaded = []
+        for i in range(14):
+            loader.load(f'https://example.com/{i}.png', loaded.append, player_id=str(i))
+        wait_for(loader)
+        loader.shutdown()
+        return loaded
+    
+    def test_second_time_makes_no_requests(self):
+        """Test that photos seen before come from disk without network calls"""
+        first = self.load_roster_photos()
+        self.assertEqual(self.session.get.call_count, 14)
+        
+        second = self.load_roster_photos()
+        self.assertEqual(self.session.get.call_count, 14)
+        self.assertEqual([image.size for image in second], [SIZE] * 14)
+        self.assertEqual(len(first), 14)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+WNBA Team Roster Viewer - Thumbnail Cache
+Keeps the resized player headshots on disk so a team that was viewed before
+shows its photos without downloading them again
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class ThumbnailCache:
+    """On-disk cache of resized headshots with a size limit (least recently used are removed first)"""
+    
+    def __init__(self, cache_dir, max_bytes=20 * 1024 * 1024):
+        """
+        Initialize the cache
+        
+        Args:
+            cache_dir (str): Directory to keep the thumbnails in
+            max_bytes (int): Max total size of the thumbnails on disk
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        
+        # Create cache directory if it doesn't exist
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        
+        # File name -> size, oldest use first (the file times keep the order
+        # between runs of the program)
+        files = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.png'):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+        
+        self._sizes = OrderedDict((name, size) for _, name, size in sorted(files))
+        self.total_bytes = sum(self._sizes.values())
+    
+    def _filename(self, player_id, url, size):
+        """
+        Get the file name of a thumbnail
+        
+        Args:
+            player_id (str): Player ID
+            url (str): URL the headshot was downloaded from
+            size (tuple): Size of the thumbnail (width, height)
+            
+        Returns:
+            str: File name inside the cache directory
+        """
+        key = f"{player_id}|{url}|{size[0]}x{size[1]}"
+        return f"{player_id}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.png"
+    
+    def get(self, player_id, url, size):
+        """
+        Get a cached thumbnail
+        
+        Args:
+            player_id (str): Player ID
+            url (str): URL the headshot was downloaded from
+            size (tuple): Size of the thumbnail (width, height)
+            
+        Returns:
+            PIL.Image.Image: The thumbnail, or None if it is not cached
+        """
+        filename = self._filename(player_id, url, size)
+        
+        with self._lock:
+            if filename not in self._sizes:
+                return None
+            self._sizes.move_to_end(filename)
+        
+        from PIL import Image
+        
+        path = os.path.join(self.cache_dir, filename)
+        try:
+            image = Image.open(path)
+            image.load()
+            # Mark it as used now, so it is kept longer
+            os.utime(path, (time.time(), time.time()))
+        except OSError:
+            self._forget(filename)
+            return None
+        
+        return image
+    
+    def put(self, player_id, url, size, image):
+        """
+        Save a thumbnail and remove the least recently used ones if the
+        cache got too big
+        
+        Args:
+            player_id (str): Player ID
+            url (str): URL the headshot was downloaded from
+            size (tuple): Size of the thumbnail (width, height)
+            image (PIL.Image.Image): The resized headshot
+        """
+        filename = self._filename(player_id, url, size)
+        path = os.path.join(self.cache_dir, filename)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        
+        # Write to a temp file, then rename it, so a half written file is never read
+        image.save(tmp_path, format='PNG')
+        os.replace(tmp_path, path)
+        
+        with self._lock:
+            self.total_bytes -= self._sizes.pop(filename, 0)
+            self._sizes[filename] = os.path.getsize(path)
+            self.total_bytes += self._sizes[filename]
+            
+            while self.total_bytes > self.max_bytes and len(self._sizes) > 1:
+                oldest, oldest_size = self._sizes.popitem(last=False)
+                self.total_bytes -= oldest_size
+                try:
+                    os.remove(os.path.join(self.cache_dir, oldest))
+                except OSError:
+                    pass
+    
+    def clear(self):
+        """Remove every cached thumbnail"""
+        with self._lock:
+            for filename in self._sizes:
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError:
+                    pass
+            self._sizes.clear()
+            self.total_bytes = 0
+    
+    def _forget(self, filename):
+        """
+        Drop a thumbnail that could not be read
+        
+        Args:
+            filename (str): File name inside the cache directory
+        """
+        with self._lock:
+            self.total_bytes -= self._sizes.pop(filename, 0)